@@ -5,6 +5,19 @@ Created on Fri Sep 11 03:57:41 2020
 @author: Z250201
 """
 import simplejson as json
+import os
+import hashlib
+import tempfile
+import traceback
+import warnings
+from itertools import repeat
+from functools import cached_property
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from tablebuilder import TableBuilder
+import sessionfile
+from sessionfile import readSession
+from cohort import loadManifest, filterManifest, sortManifest
 import pandas as pd
 import numpy as np
 import scipy.stats as stats
@@ -13,7 +26,7 @@ from matplotlib import pyplot as plt
 
 
 def readTestFile(filename):
-    """Reads JSON file and returns the data as a Python dictionary.
+    """Reads JSON file and returns the data as a Python dictionary. The binary version of the file is read instead if it exists (see sessionfile.convertCohort).
     
     Parameters:
         filename(string): name of the JSON file
@@ -21,23 +34,95 @@ def readTestFile(filename):
     Returns: 
         dict: data of JSON file
     """
-    f = open(filename,) 
-    data = json.load(f) 
+    return readSession(filename)
+
+class KeyEvents:
+    """ 
+    This class contains the key presses/releases of a single test in columnar form: contiguous arrays of key codes, positions (0 = pressed, 1 = released) and timestamps instead of one dictionary per event.
+    """
+    __slots__ = ("k", "p", "e")
+    
+    def __init__(self, k, p, e):
+        self.k = np.ascontiguousarray(k, dtype=np.int16)
+        self.p = np.ascontiguousarray(p, dtype=np.int8)
+        self.e = np.ascontiguousarray(e)
+        
+    @classmethod
+    def fromList(cls, datalist):
+        """Builds the columnar representation from a list of {'k', 'p', 'e'} dictionaries.
+        
+        Parameters:
+            datalist(list): data list which contains the information about when which key was pressed/released
+        
+        Returns: 
+            KeyEvents: columnar key events
+        """
+        return cls([d['k'] for d in datalist], [d['p'] for d in datalist], [d['e'] for d in datalist])
+    
+    def toList(self):
+        """Returns the key events as a list of {'k', 'p', 'e'} dictionaries.
+        
+        Returns: 
+            list: data list which contains the information about when which key was pressed/released
+        """
+        return [{'k' : k, 'p' : p, 'e' : e} for k, p, e in zip(*self.columns())]
+    
+    def columns(self):
+        """Returns the key codes, positions and timestamps as Python lists for sequential processing. The lists are converted on every call and not kept, so that only the arrays stay in memory; computeWindowFeatures walks all time intervals of a test with one conversion.
+        
+        Returns: 
+            list: key codes
+            list: positions
+            list: timestamps
+        """
+        return self.k.tolist(), self.p.tolist(), self.e.tolist()
+    
+    def __len__(self):
+        return len(self.k)
     
-    return data
+def asKeyEvents(datalist):
+    """Returns the columnar representation of the key presses/releases, building it only if necessary.
+    
+    Parameters:
+        datalist(list/tuple/KeyEvents): list of {'k', 'p', 'e'} dictionaries, tuple of key code, position and timestamp arrays, or already columnar key events
+    
+    Returns: 
+        KeyEvents: columnar key events
+    """
+    if isinstance(datalist, KeyEvents):
+        return datalist
+    if isinstance(datalist, tuple):
+        return KeyEvents(*datalist)
+    return KeyEvents.fromList(datalist)
 
-def createSubjectFromData(filename):
+def createSubjectFromData(filename, cache_dir = None, diagnosis = None):
     """Given a dictionary of the data, an object of the class Subject is initiated and returned.
     
     Parameters:
         filename(dict): filename of the JSON file
+        cache_dir(string): directory of the feature cache (None: no caching)
+        diagnosis(int): diagnosis code, e.g. from the cohort manifest (None: derived from the filename)
     
     Returns: 
         Subject object: initiated object of the Subject class containing the data
     """
+    if (cache_dir is not None):
+        path = os.path.join(cache_dir, getCacheKey(filename, diagnosis) + ".npz")
+        s = loadCachedSubject(path)
+        if (s is None):
+            s = createSubjectFromData(filename, diagnosis = diagnosis).precompute()
+            try:
+                saveCachedSubject(s, path)
+            except Exception as e:
+                # the features are computed anyway, only the cache entry is missing
+                warnings.warn("Could not cache the features of " + filename + ": " + repr(e))
+        return s
+    
     data = readTestFile(filename)  
     
-    if (filename.count("PD") == 1 and filename.count("OFF") == 1):
+    if (diagnosis is not None):
+        pass
+    elif (filename.count("PD") == 1 and filename.count("OFF") == 1):
         diagnosis = 0
     elif  (filename.count("PD") == 1 and filename.count("ON") == 1):
         diagnosis = 1
@@ -48,6 +133,151 @@ def createSubjectFromData(filename):
     s = Subject(filename, diagnosis, data['typist'], data['side'], data['years'], data['UPDRS-3_4a'], data['UPDRS-3_4b'], data['UPDRS-3_5a'], data['UPDRS-3_5b'], data['UPDRS-3_6a'], data['UPDRS-3_6b'], data['serial'], data['hand'], data['tm'], data['d']['0'], data['d']['1'], data['d']['2'], data['d']['3'], data['d']['4'], data['d']['5'])
     return s
 
+def loadSubject(filename, cache_dir = None, diagnosis = None, precompute = True):
+    """Loads a subject like createSubjectFromData, but returns the error instead of raising it so that a failing subject does not abort the loading of a whole cohort.
+    
+    Parameters:
+        filename(string): filename of the JSON file
+        cache_dir(string): directory of the feature cache (None: no caching)
+        diagnosis(int): diagnosis code (None: derived from the filename)
+        precompute(boolean): compute all features now, so that errors of the feature code are returned as well (False: the features are computed on first access)
+    
+    Returns: 
+        Subject object: initiated object of the Subject class (None if loading failed)
+        string: traceback of the error (None if loading succeeded)
+    """
+    try:
+        s = createSubjectFromData(filename, cache_dir, diagnosis)
+        return (s.precompute() if precompute else s), None
+    except Exception:
+        return None, traceback.format_exc()
+
+def getCodeDigest(filenames):
+    """Returns the digest of source files.
+    
+    Parameters:
+        filenames(list): filenames of the source files
+    
+    Returns: 
+        string: hexadecimal SHA-256 digest
+    """
+    h = hashlib.sha256()
+    for filename in filenames:
+        with open(filename, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+# Digest of this module and of the session parser (which produces the cached key presses/releases): every change of the feature code invalidates the cached features
+FEATURE_CODE_DIGEST = getCodeDigest([__file__, sessionfile.__file__])
+
+def getCacheKey(filename, diagnosis = None):
+    """Returns the key of the cached features of a subject, which changes whenever the data file, its name (subject id and diagnosis) or the feature code changes.
+    
+    Parameters:
+        filename(string): filename of the JSON file
+        diagnosis(int): diagnosis code given to createSubjectFromData
+    
+    Returns: 
+        string: hexadecimal SHA-256 digest
+    """
+    h = hashlib.sha256(FEATURE_CODE_DIGEST.encode())
+    h.update((filename + "\n" + str(diagnosis) + "\n").encode())
+    with open(filename, 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def saveCachedSubject(s, path):
+    """Stores all attributes of a subject in a .npz file. Arrays, lists and numeric scalars are concatenated into one buffer per dtype (a few large arrays load much faster than a hundred small ones) and a JSON schema records where each attribute lives. The file is written to a temporary file first and then renamed, so that concurrent or interrupted writers never leave a partial cache entry.
+    
+    Parameters:
+        s(Subject): subject with computed features
+        path(string): filename of the cache entry
+    """
+    buffers = {}
+    sizes = {}
+    
+    def pack(value):
+        value = np.asarray(value)
+        if value.dtype.kind not in "biuf":
+            raise TypeError("Cannot cache an array of type " + str(value.dtype) + " of " + str(s.subject_id))
+        dtype = value.dtype.name
+        start = sizes.get(dtype, 0)
+        buffers.setdefault(dtype, []).append(value.ravel())
+        sizes[dtype] = start + value.size
+        return [dtype, start, start + value.size, list(value.shape)]
+    
+    schema = {}
+    for name, value in vars(s).items():
+        if isinstance(value, KeyEvents):
+            schema[name] = ["KeyEvents", [pack(value.k), pack(value.p), pack(value.e)]]
+        elif isinstance(value, np.ndarray):
+            schema[name] = ["array", pack(value)]
+        elif isinstance(value, (np.generic, float)):
+            # floats are packed as well because JSON cannot represent NaN
+            schema[name] = ["numpy" if isinstance(value, np.generic) else "float", pack(value)]
+        elif isinstance(value, list):
+            # only lists of a single Python type come back unchanged from an array
+            if len({type(v) for v in value} - {int, float, bool}) > 0 or len({type(v) for v in value}) > 1:
+                raise TypeError("Cannot cache the list " + name + " of " + str(s.subject_id))
+            schema[name] = ["list", pack(value if len(value) > 0 else np.zeros(0, dtype = np.int64))]
+        elif value is None or isinstance(value, (bool, int, str)):
+            schema[name] = ["value", value]
+        else:
+            raise TypeError("Cannot cache the attribute " + name + " of " + str(s.subject_id))
+    arrays = {dtype : np.concatenate(parts) for dtype, parts in buffers.items()}
+    arrays["schema"] = np.asarray(json.dumps(schema))
+    
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok = True)
+    fd, tmp = tempfile.mkstemp(dir = directory, suffix = ".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+def loadCachedSubject(path):
+    """Restores a subject stored with saveCachedSubject without recomputing its features.
+    
+    Parameters:
+        path(string): filename of the cache entry
+    
+    Returns: 
+        Subject object: subject with all stored attributes (None if there is no readable cache entry)
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle = False) as data:
+            schema = json.loads(str(data["schema"]))
+            buffers = {dtype : data[dtype] for dtype in data.files if dtype != "schema"}
+    except Exception:
+        # unreadable entry (e.g. written by an older numpy): recompute it
+        return None
+    
+    def unpack(entry):
+        dtype, start, stop, shape = entry
+        return buffers[dtype][start:stop].reshape(shape)
+    
+    s = Subject.__new__(Subject)
+    for name, (kind, entry) in schema.items():
+        if kind == "KeyEvents":
+            value = KeyEvents(*[unpack(e) for e in entry])
+        elif kind == "array":
+            value = unpack(entry)
+        elif kind == "numpy":
+            value = unpack(entry)[()]
+        elif kind == "float":
+            value = float(unpack(entry))
+        elif kind == "list":
+            value = unpack(entry).tolist()
+        else:
+            value = entry
+        setattr(s, name, value)
+    return s
+
 def getOtherTargetKey(target1, target2, current):
     """Returns the key code of the target key that is not the current key.
     
@@ -84,7 +314,7 @@ def computeFlightTimesWithTwoTargets(target1, target2, datalist, time, starttime
     Parameters:
         target1(int): key code of target key 1 of the FT
         target2(int): key code of target key 2 of the FT
-        datalist(list): data list which contains the information about when which key was pressed/released
+        datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
         time(int): time interval
         starttime(int): start of the time interval
     
@@ -92,52 +322,54 @@ def computeFlightTimesWithTwoTargets(target1, target2, datalist, time, starttime
         list: list of flight times
         int: nr of errors
     """
+    keys, positions, times = asKeyEvents(datalist).columns()
     ft = []
     nrOfErrors = 0
-    start = datalist[0]['e'] + starttime
+    start = times[0] + starttime
     end = start + time  
 
     # Start with the first release of a target key
     i = 0
-    while (datalist[i]['p'] != 1 or (datalist[i]['k'] != target1 and datalist[i]['k'] != target2) or datalist[i]['e'] < start):
-        if (datalist[i]['k'] != target1 and datalist[i]['k'] != target2):
+    while (positions[i] != 1 or (keys[i] != target1 and keys[i] != target2) or times[i] < start):
+        if (keys[i] != target1 and keys[i] != target2):
             nrOfErrors = nrOfErrors + 1
         i = i + 1
-        if (i > len(datalist)-1):
+        if (i > len(keys)-1):
             break
-    if (i > len(datalist)-1):
+    if (i > len(keys)-1):
         return [], 0
     else:
         # Set current target, pos, and time of first release
-        currentTargetKey = datalist[i]['k']
-        currentKeyPos = datalist[i]['p']
-        currentKeyTime = datalist[i]['e']
+        currentTargetKey = keys[i]
+        currentKeyPos = positions[i]
+        currentKeyTime = times[i]
 
         # Loop through data of key presses/releases
-        for d in datalist[i+1:]:
+        for j in range(i+1, len(keys)):
+            k, p, e = keys[j], positions[j], times[j]
 
             # If next key is pressed
-            if (d['p'] == 0 and d['e'] < end):
+            if (p == 0 and e < end):
                 # and if key is the other target key
-                if (d['k'] == getOtherTargetKey(target1, target2, currentTargetKey)):
+                if (k == getOtherTargetKey(target1, target2, currentTargetKey)):
                     # compute flight time and append it to list
-                    ft.append(d['e'] - currentKeyTime)
+                    ft.append(e - currentKeyTime)
 
                     # Update current target key and time
-                    currentTargetKey = d['k']
-                    currentKeyTime = d['e']
+                    currentTargetKey = k
+                    currentKeyTime = e
 
                 # if the key is not a target key
-                elif (d['k'] != target1 and d['k'] != target2):
+                elif (k != target1 and k != target2):
                     # increase number of errors by 1
                     nrOfErrors = nrOfErrors + 1
 
-            elif (d['p'] == 1 and d['e'] < end):
+            elif (p == 1 and e < end):
                 # and if key is the other target key
-                if (d['k'] == currentTargetKey):
-                    currentKeyTime = d['e']
+                if (k == currentTargetKey):
+                    currentKeyTime = e
                 # if the key is not a target key
-                elif (d['k'] != target1 and d['k'] != target2):
+                elif (k != target1 and k != target2):
                     # increase number of errors by 1
                     nrOfErrors = nrOfErrors + 1      
         return ft, nrOfErrors
@@ -147,7 +379,7 @@ def computeFlightTimesWithOneTarget(target, datalist, time, starttime = 0):
     
     Parameters:
         target(int): key code of the target key of the FT
-        datalist(list): data list which contains the information about when which key was pressed/released
+        datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
         time(int): time interval
         starttime(int): start time of the time interval
     
@@ -155,59 +387,140 @@ def computeFlightTimesWithOneTarget(target, datalist, time, starttime = 0):
         list: list of flight times
         int: number of errors
     """
+    keys, positions, times = asKeyEvents(datalist).columns()
     ft = []
     nrOfErrors = 0
     errorFT = False
     
-    start = datalist[0]['e'] + starttime
+    start = times[0] + starttime
     end = start + time 
     
     # Start with the first release of a target key
     i = 0
-    while (datalist[i]['p'] != 1 or datalist[i]['k'] != target or datalist[i]['e'] < start):
-        if (datalist[i]['k'] != target):
+    while (positions[i] != 1 or keys[i] != target or times[i] < start):
+        if (keys[i] != target):
             nrOfErrors = nrOfErrors + 1
         i = i + 1
-        if (i > len(datalist)-1):
+        if (i > len(keys)-1):
             break
-    if (i > len(datalist)-1):
+    if (i > len(keys)-1):
         return [], 0
     else:
         # Set current time of first release
-        currentKeyTime = datalist[i]['e']   
+        currentKeyTime = times[i]   
 
         # Loop through data of key presses/releases
-        for d in datalist[i+1:]:
+        for j in range(i+1, len(keys)):
+            k, p, e = keys[j], positions[j], times[j]
             # If next key is pressed
-            if (d['p'] == 0 and d['e'] < end):
+            if (p == 0 and e < end):
                 # and if key is the target key
-                if (d['k'] == target):
+                if (k == target):
                     # compute flight time and append it to list if not error FT
-                    ft.append(d['e'] - currentKeyTime)
+                    ft.append(e - currentKeyTime)
                     # Update current time
-                    currentKeyTime = d['e']
+                    currentKeyTime = e
                 # if the key is not the target key
-                elif (d['k'] != target):
+                elif (k != target):
                     # increase number of errors by 1
                     nrOfErrors = nrOfErrors + 1
-            elif (d['p'] == 1 and d['e'] < end):
+            elif (p == 1 and e < end):
                 # and if key is the target key
-                if (d['k'] == target):
+                if (k == target):
                     # Update current time
-                    currentKeyTime = d['e']
+                    currentKeyTime = e
                 # if the key is not the target key
-                elif (d['k'] != target):
+                elif (k != target):
                     # increase number of errors by 1
                     nrOfErrors = nrOfErrors + 1
         return ft, nrOfErrors
     
+class KeyboardLayout:
+    """ 
+    This class contains the target keys and adjacent keys of a FTT together with the precomputed key code -> DS score lookup table (target keys score 1, adjacent keys 2, and all other keys 3).
+    """
+    def __init__(self, targets, adjacent):
+        self.targets = [t for t in targets if t is not None]
+        self.adjacent = list(adjacent)
+        self.table = np.full(max([255] + self.targets + self.adjacent) + 1, 3, dtype=np.int64)
+        self.table[self.adjacent] = 2
+        self.table[self.targets] = 1
+        
+    def score(self, keys):
+        """Returns the DS score of every key code.
+        
+        Parameters:
+            keys(array): key codes
+        
+        Returns: 
+            array: scores (1, 2 or 3)
+        """
+        keys = np.asarray(keys)
+        known = (keys >= 0) & (keys < len(self.table))
+        return np.where(known, self.table[np.clip(keys, 0, len(self.table) - 1)], 3)
+
+# Registered keyboard layouts of the FTTs
+DS_LAYOUTS = {}
+
+def registerLayout(name, targets, adjacent):
+    """Registers a keyboard layout for the DS under a name.
+    
+    Parameters:
+        name(string): name of the layout
+        targets(list): key codes of the target keys
+        adjacent(list): key codes of the adjacent keys
+    
+    Returns: 
+        KeyboardLayout: registered layout
+    """
+    DS_LAYOUTS[name] = KeyboardLayout(targets, adjacent)
+    return DS_LAYOUTS[name]
+
+def getLayout(layout):
+    """Returns a keyboard layout given its registered name (or the layout itself).
+    
+    Parameters:
+        layout(string/KeyboardLayout): name of a registered layout or layout
+    
+    Returns: 
+        KeyboardLayout: layout
+    """
+    if isinstance(layout, KeyboardLayout):
+        return layout
+    return DS_LAYOUTS[layout]
+
+registerLayout("QP", [80, 81], [79, 48, 45, 91, 59, 76, 9, 49, 50, 87, 65, 20])
+registerLayout("MN", [77, 78], [74, 75, 44, 32, 66, 72])
+registerLayout("M", [77], [78, 74, 75, 32, 44])
+
+def getDSWindows(datalist, layout, windows):
+    """Returns the dysmetria score (DS) for several time intervals at once by scoring all key presses with the lookup table of the layout.
+    
+    Parameters:
+        datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
+        layout(string/KeyboardLayout): name of a registered layout or layout
+        windows(list): time intervals in msec
+    
+    Returns: 
+        array: DS per time interval
+    """
+    events = asKeyEvents(datalist)
+    presses = events.p == 0
+    scores = getLayout(layout).score(events.k[presses])
+    
+    ends = events.e[0] + np.asarray(windows)
+    inWindow = events.e[presses][np.newaxis, :] < ends[:, np.newaxis]
+    
+    # sum of scores divided by total number of taps
+    return np.where(inWindow, scores, 0).sum(axis=1) / inWindow.sum(axis=1)
+
 def getDS(datalist, target, time, adjacent, target2 = None):
     """
     Returns the dysmetria score (DS; a measure of the average accuracy of key strikes where the central keyscores 1, adjacent keys are 2, and all other keys are 3)
     
     Parameters:
         target(int): key code of the target key of the FT
-        datalist(list): data list which contains the information about when which key was pressed/released
+        datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
         time(int): time interval
         adjacent(list): list of adjacent keys
         target2(int): optional second target key
@@ -215,41 +528,44 @@ def getDS(datalist, target, time, adjacent, target2 = None):
     Returns: 
         float: DS 
     """
-    err = []
-    nrOfTaps = 0
+    return getDSWindows(datalist, KeyboardLayout([target, target2], adjacent), [time])[0]
+
+def pairKeyPresses(datalist, targets):
+    """Matches every press of the given keys with the next release of the same key. The matching is done with one pass per key code, so overlapping keys are paired independently and presses that are never released are marked as dangling.
     
-    start = datalist[0]['e']
-    end = start + time 
+    Parameters:
+        datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
+        targets(list): key codes of the keys to pair
     
-    # Loop through data of key presses/releases
-    for d in datalist:
-        # If next key is pressed
-        if (d['p'] == 0 and d['e'] < end):
-            # increase nr of taps
-            nrOfTaps = nrOfTaps + 1
-            
-            # and if key is one of the target key(s)
-            if (d['k'] == target or d['k'] == target2):
-                # append 1
-                err.append(1)
-                
-            # if the key is one of the adjacent keys
-            elif (d['k'] in adjacent):
-                # append 2
-                err.append(2)
-                
-            else:
-                # append 3
-                err.append(3)
-                
-    # return sum of err list divided by total number of taps          
-    return np.sum(err)/nrOfTaps
+    Returns: 
+        array: indices of the key presses in the order of the data list
+        array: indices of the matching key releases (-1 for dangling presses)
+    """
+    events = asKeyEvents(datalist)
+    presses, releases = [], []
+    for key in dict.fromkeys(targets):
+        isKey = events.k == key
+        pressIdx = np.flatnonzero(isKey & (events.p == 0))
+        releaseIdx = np.flatnonzero(isKey & (events.p == 1))
+        
+        # next release of the same key after every press
+        nextRelease = np.searchsorted(releaseIdx, pressIdx, side='right')
+        matched = np.full(len(pressIdx), -1, dtype=np.intp)
+        released = nextRelease < len(releaseIdx)
+        matched[released] = releaseIdx[nextRelease[released]]
+        
+        presses.append(pressIdx)
+        releases.append(matched)
+    presses = np.concatenate(presses)
+    releases = np.concatenate(releases)
+    order = np.argsort(presses, kind='stable')
+    return presses[order], releases[order]
 
 def computeDwellTimes(datalist, target, time, target2 = None):
     """Returns the dwell times of the FTT in a list.
     
     Parameters:
-        datalist(list): data list which contains the information about when which key was pressed/released
+        datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
         target(int): key code of the target key of the DT
         interval(int): interval time in msec
         target2(int): key code of optional second target
@@ -258,21 +574,101 @@ def computeDwellTimes(datalist, target, time, target2 = None):
     Returns: 
         list: list of dwell times with or without 'x' marking the ends of intervals
     """
-    dt = []
-    i = 0
+    events = asKeyEvents(datalist)
     
-    start = datalist[0]['e']
+    start = events.e[0]
     end = start + time    
     
-    for kPress in datalist:
-        if (kPress['p'] == 0 and (kPress['k'] == target or kPress['k'] == target2) and (kPress['e'] < end)):
-            for kRelease in datalist[i + 1:]:
-                if ((kRelease['p'] == 1) and (kPress['k'] == kRelease['k'])):
-                    dt.append(kRelease['e'] - kPress['e'])
-                    break
-        i = i + 1
+    presses, releases = pairKeyPresses(events, [target] if target2 is None else [target, target2])
+    paired = (releases >= 0) & (events.e[presses] < end)
+    dt = events.e[releases[paired]] - events.e[presses[paired]]
                 
-    return dt
+    return dt.tolist()
+
+def computeWindowFeatures(datalist, layout, windows):
+    """Returns the flight times, errors, dwell times and DS of the FTT for several time intervals at once. All time intervals start at the first key press/release, and the key presses/releases are walked only once. The results are identical to calling computeFlightTimesWithOneTarget/computeFlightTimesWithTwoTargets, computeDwellTimes and getDS once per time interval.
+    
+    Parameters:
+        datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
+        layout(string/KeyboardLayout): name of a registered layout or layout with the target key(s) of the FTT
+        windows(list): time intervals in msec
+    
+    Returns: 
+        dict: per time interval a dict with the flight times ('ft'), nr of errors ('err'), dwell times ('dt') and DS ('DS')
+    """
+    events = asKeyEvents(datalist)
+    layout = getLayout(layout)
+    target1 = layout.targets[0]
+    target2 = layout.targets[1] if len(layout.targets) > 1 else None
+    keys, positions, times = events.columns()
+    start = times[0]
+    lastEnd = start + max(windows)
+    
+    # Flight times and errors: timestamps of the key presses/releases that produced them
+    ft, ftTimes, errTimes = [], [], []
+    nrOfInitialErrors = 0
+    currentTargetKey = None
+    isSorted = True
+    
+    # Dwell times of the target key presses (None while not released) and the presses still waiting for their release per key
+    dt, pressTimes, pending = [], [], {}
+    
+    for j in range(len(keys)):
+        k, p, e = keys[j], positions[j], times[j]
+        isTarget = (k == target1 or k == target2)
+        if (j > 0 and e < times[j - 1]):
+            isSorted = False
+        
+        # Start with the first release of a target key
+        if (currentTargetKey is None):
+            if (p == 1 and isTarget and e >= start):
+                currentTargetKey = k
+                currentKeyTime = e
+                nextTargetKey = target1 if target2 is None else getOtherTargetKey(target1, target2, currentTargetKey)
+            elif not isTarget:
+                nrOfInitialErrors = nrOfInitialErrors + 1
+        elif (p == 0 and e < lastEnd):
+            # compute flight time if the next target key is pressed
+            if (k == nextTargetKey):
+                ft.append(e - currentKeyTime)
+                ftTimes.append(e)
+                currentTargetKey = k
+                currentKeyTime = e
+                nextTargetKey = target1 if target2 is None else getOtherTargetKey(target1, target2, currentTargetKey)
+            elif not isTarget:
+                errTimes.append(e)
+        elif (p == 1 and e < lastEnd):
+            if (k == currentTargetKey):
+                currentKeyTime = e
+            elif not isTarget:
+                errTimes.append(e)
+        
+        # Pair target key presses with the next release of the same key
+        if (p == 0 and isTarget and e < lastEnd):
+            pending.setdefault(k, []).append(len(dt))
+            dt.append(None)
+            pressTimes.append(e)
+        elif (p == 1 and k in pending):
+            for press in pending.pop(k):
+                dt[press] = e - pressTimes[press]
+    
+    DS = getDSWindows(events, layout, windows)
+    
+    features = {}
+    for window, windowDS in zip(windows, DS):
+        end = start + window
+        if (currentTargetKey is None):
+            windowFt, nrOfErrors = [], 0
+        elif isSorted:
+            # with sorted timestamps the events of a shorter interval are a prefix of the events of the longest one
+            windowFt = ft[:bisect_left(ftTimes, end)]
+            nrOfErrors = nrOfInitialErrors + bisect_left(errTimes, end)
+        elif (target2 is None):
+            windowFt, nrOfErrors = computeFlightTimesWithOneTarget(target1, events, window)
+        else:
+            windowFt, nrOfErrors = computeFlightTimesWithTwoTargets(target1, target2, events, window)
+        features[window] = {'ft' : windowFt, 'err' : nrOfErrors, 'dt' : [d for d, t in zip(dt, pressTimes) if (t < end and d is not None)], 'DS' : windowDS}
+    return features
 
 def reject_outliers(data, m=3, remove = 0):
     """Rejects outliers and returns the number of found outliers
@@ -346,47 +742,220 @@ def computeVelocityScore2(fts):
     vs_slope_dom, _, _, _, _ = stats.linregress(range(len(vs_perc_dom)), vs_perc_dom)
     return vs_slope_dom #np.mean(vs_perc_dom)
 
+class FlightTimeIndex:
+    """ 
+    This class contains a timestamp index over the target key presses/releases of a test. The number of flight times that computeFlightTimesWithOneTarget/computeFlightTimesWithTwoTargets find in any time interval is obtained with binary searches and prefix sums instead of rescanning the key presses/releases.
+    """
+    def __init__(self, datalist, target1, target2 = None):
+        self.events = asKeyEvents(datalist)
+        self.target1 = target1
+        self.target2 = None if target2 == target1 else target2
+        
+        k, p, e = self.events.k, self.events.p, self.events.e
+        isTarget = (k == target1) | (k == self.target2)
+        self.start = e[0]
+        self.isSorted = bool(np.all(e[1:] >= e[:-1]))
+        
+        # Releases of a target key (possible starts of the flight times)
+        self.releaseIdx = np.flatnonzero(isTarget & (p == 1))
+        self.releaseTimes = e[self.releaseIdx]
+        
+        # Presses of a target key and the prefix counts of presses that switch to the other target key
+        self.pressIdx = np.flatnonzero(isTarget & (p == 0))
+        self.pressTimes = e[self.pressIdx]
+        self.pressKeys = k[self.pressIdx]
+        switches = self.pressKeys[1:] != self.pressKeys[:-1]
+        self.switchCounts = np.concatenate([[0, 0], np.cumsum(switches)])
+        
+    def countFlightTimes(self, starttimes, time):
+        """Returns the number of flight times in time intervals of the FTT.
+        
+        Parameters:
+            starttimes(list): start times of the time intervals (relative to the first key press/release)
+            time(int): length of the time intervals
+        
+        Returns: 
+            array: number of flight times per time interval
+        """
+        starttimes = np.asarray(starttimes)
+        if not self.isSorted:
+            if (self.target2 is None):
+                return np.array([len(computeFlightTimesWithOneTarget(self.target1, self.events, time, starttime = s)[0]) for s in starttimes.tolist()], dtype=int)
+            return np.array([len(computeFlightTimesWithTwoTargets(self.target1, self.target2, self.events, time, starttime = s)[0]) for s in starttimes.tolist()], dtype=int)
+        
+        start = self.start + starttimes
+        end = start + time
+        
+        # First release of a target key in the interval and the target key presses after it
+        first = np.searchsorted(self.releaseTimes, start, side='left')
+        started = first < len(self.releaseIdx)
+        firstIdx = self.releaseIdx[np.minimum(first, len(self.releaseIdx) - 1)] if len(self.releaseIdx) else np.zeros(len(start), dtype=np.intp)
+        a = np.searchsorted(self.pressIdx, firstIdx, side='right')
+        b = np.searchsorted(self.pressTimes, end, side='left')
+        valid = started & (b > a)
+        
+        counts = np.zeros(len(start), dtype=int)
+        if (self.target2 is None):
+            counts[valid] = b[valid] - a[valid]
+        else:
+            # the first press only counts if it is not the key that was released, the following presses if they switch key
+            a, b = a[valid], b[valid]
+            counts[valid] = (self.pressKeys[a] != self.events.k[firstIdx[valid]]) + self.switchCounts[b] - self.switchCounts[a + 1]
+        return counts
+    
+    def velocity_curve(self, step_ms, duration = 60000):
+        """Returns the BRAIN velocity curve: the velocity (flight times per second) of consecutive time intervals as percentage of the velocity of the first interval.
+        
+        Parameters:
+            step_ms(float): length of the time intervals in msec
+            duration(int): duration of the test in msec
+        
+        Returns:
+            list: velocity changes in percent (from the second interval on)
+        """
+        counts = self.countFlightTimes(getVelocityIntervals(step_ms, duration), step_ms).tolist()
+        return getVelocityChanges(counts, step_ms)
+
+def getVelocityIntervals(step_ms, duration = 60000):
+    """Returns the start times of the time intervals of the BRAIN velocity curve.
+    
+    Parameters:
+        step_ms(float): length of the time intervals in msec
+        duration(int): duration of the test in msec
+    
+    Returns:
+        list: start times of the time intervals (relative to the first key press/release)
+    """
+    starts = [0]
+    start = step_ms
+    while (start < duration):
+        starts.append(start)
+        start = start + step_ms
+    return starts
+
+def getVelocityChanges(counts, step_ms):
+    """Returns the BRAIN velocity curve given the number of flight times per time interval.
+    
+    Parameters:
+        counts(list): number of flight times per time interval
+        step_ms(float): length of the time intervals in msec
+    
+    Returns:
+        list: velocity changes in percent (from the second interval on)
+    """
+    secs = step_ms/1000
+    baselineVS = counts[0] / secs + 0.000000000001
+    return [((count / secs) / baselineVS) * 100.0 for count in counts[1:]]
+
 def computeVelocityScore(target1, keypresses, target2 = None):
     """Returns velocity score based on BRAIN test (with time intervals).
 
         Parameters:
-            fts(list): list of flight times
+            target1(int): key code of target key 1 of the FT
+            keypresses(list/KeyEvents): data list which contains the information about when which key was pressed/released
+            target2(int): key code of optional second target key
 
         Returns:
-            float: velocity score
+            float: velocity score (slope of the velocity curve)
+            float: intercept of the velocity curve
+            float: standard error of the slope
     """
-    start = 0
-    step = 2000
-    secs = step/1000
-    vss = []
-    if (target2 == None):
-        v, _ = computeFlightTimesWithOneTarget(target1, keypresses, step, starttime = start)
-        start = start + step
-        velocity = len(v) / secs
-        baselineVS = velocity + 0.000000000001
-        while (start < 60000):
-            v, _ = computeFlightTimesWithOneTarget(target1, keypresses, step, starttime = start)
-            velocity = len(v) / secs
-            change = (velocity / baselineVS) * 100.0
-            vss.append(change)
-            start = start + step
-    else:
-        v, _ = computeFlightTimesWithTwoTargets(target1, target2, keypresses, step, starttime = start)
-        start = start + step
-        velocity = len(v) / secs
-        baselineVS = velocity + 0.000000000001
-        while (start < 60000):
-            v, _ = computeFlightTimesWithTwoTargets(target1, target2, keypresses, step, starttime = start)
-            velocity = len(v) / secs
-            change = (velocity / baselineVS) * 100.0
-            vss.append(change)
-            start = start + step
+    vss = FlightTimeIndex(keypresses, target1, target2).velocity_curve(2000)
     slope, intercept, _, _, std_err = stats.linregress(range(len(vss)), vss)
     return slope, intercept, std_err
 
+# Keyboard layout and time intervals (msec) of the tests of a subject
+SUBJECT_TESTS = {"qp_dom" : ("QP", [10000, 30000, 60000]), 
+                 "qp_ndom" : ("QP", [10000, 30000, 60000]), 
+                 "mn_dom" : ("MN", [10000, 60000]), 
+                 "mn_ndom" : ("MN", [10000, 60000]), 
+                 "m_dom" : ("M", [10000, 60000]), 
+                 "m_ndom" : ("M", [10000, 60000])}
+
+# Features of every test per time interval and the features after outlier rejection of the 60 seconds (see getTestFeatures), the QP tests also have the Hasan 2019 features
+WINDOW_FEATURES = {10000 : ["ft_10", "err_10", "dt_10"], 30000 : [], 60000 : ["err", "DS_60"]}
+HASAN_FEATURES = {10000 : ["DS_10", "VS_10"], 30000 : ["ft_30", "dt_30", "DS_30", "VS_30"], 60000 : ["VS_60"]}
+OUTLIER_FEATURES = ["dt", "out_dt", "ft", "out_ft"]
+
+# Attribute name of every feature of a subject -> test and family of features that are computed together: the features of one time interval (family = time interval in msec), the features after outlier rejection ("outliers") or the velocity score ("vs")
+FEATURE_FAMILIES = {}
+for test, (layout, windows) in SUBJECT_TESTS.items():
+    for window in windows:
+        for feature in WINDOW_FEATURES[window] + (HASAN_FEATURES[window] if 30000 in windows else []):
+            FEATURE_FAMILIES[test + "_" + feature] = (test, window)
+    for feature in OUTLIER_FEATURES:
+        FEATURE_FAMILIES[test + "_" + feature] = (test, "outliers")
+    FEATURE_FAMILIES[test + "_vs"] = (test, "vs")
+
+def getWindowFeatures(name, window, features, hasan = False):
+    """Returns the features of one time interval of a test under the attribute names of the Subject class.
+    
+    Parameters:
+        name(string): name of the test, e.g. "qp_dom"
+        window(int): time interval in msec (10000, 30000 or 60000)
+        features(dict): flight times, errors, dwell times and DS of the time interval as returned by computeWindowFeatures
+        hasan(boolean): add the Hasan 2019 features
+    
+    Returns: 
+        dict: features by attribute name
+    """
+    attributes = {}
+    if (window == 10000):
+        # Flight times, errors and dwell times for the first 10 seconds
+        attributes[name + "_ft_10"] = features['ft']
+        attributes[name + "_err_10"] = features['err']
+        attributes[name + "_dt_10"] = features['dt']
+        if hasan:
+            attributes[name + "_DS_10"] = features['DS']
+            attributes[name + "_VS_10"] = computeVelocityScore2(features['ft'])
+    elif (window == 30000):
+        # Hasan 2019 features
+        attributes[name + "_ft_30"] = features['ft']
+        attributes[name + "_dt_30"] = features['dt']
+        attributes[name + "_DS_30"] = features['DS']
+        attributes[name + "_VS_30"] = computeVelocityScore2(features['ft'])
+    elif (window == 60000):
+        attributes[name + "_err"] = features['err']
+        attributes[name + "_DS_60"] = features['DS']
+        if hasan:
+            attributes[name + "_VS_60"] = computeVelocityScore2(features['ft'])
+    return attributes
+
+def getOutlierFeatures(name, features):
+    """Returns the flight and dwell times of the 60 seconds of a test without outliers and the number of outliers under the attribute names of the Subject class.
+    
+    Parameters:
+        name(string): name of the test, e.g. "qp_dom"
+        features(dict): flight times, errors, dwell times and DS of the 60 seconds as returned by computeWindowFeatures
+    
+    Returns: 
+        dict: features by attribute name
+    """
+    attributes = {}
+    # Preprocessing of FT and DT: reject outliers >2SD
+    attributes[name + "_dt"], attributes[name + "_out_dt"] = reject_outliers(features['dt'], m=2, remove = 0)
+    attributes[name + "_ft"], attributes[name + "_out_ft"] = reject_outliers(features['ft'], m=2, remove = 0)
+    return attributes
+
+def getTestFeatures(name, features):
+    """Returns the features of one test of a subject computed from the time intervals under the attribute names of the Subject class (all features except the velocity score).
+    
+    Parameters:
+        name(string): name of the test, e.g. "qp_dom"
+        features(dict): flight times, errors, dwell times and DS per time interval as returned by computeWindowFeatures (10 and 60 seconds, and 30 seconds for the Hasan 2019 features)
+    
+    Returns: 
+        dict: features by attribute name
+    """
+    attributes = {}
+    for window in features:
+        attributes.update(getWindowFeatures(name, window, features[window], hasan = 30000 in features))
+    attributes.update(getOutlierFeatures(name, features[60000]))
+    return attributes
+
 class Subject:
     """ 
-    This class contains all collected information about the subject from the FTT.
+    This class contains all collected information about the subject from the FTT. The features are computed on first access by family (see FEATURE_FAMILIES): reading a feature of the first 10 seconds only walks the key presses/releases of the 10 seconds, the 30/60 seconds, the outlier rejection and the velocity score are computed when one of their features is read. The computed features are kept, precompute computes them in advance.
     """
     def __init__(self, subject_id, diagnosis, typist, side, years, UPDRS3_4a, UPDRS3_4b, UPDRS3_5a, UPDRS3_5b, UPDRS3_6a, UPDRS3_6b, serial, hand, tm, qp_dom, qp_ndom, mn_dom, mn_ndom, m_dom, m_ndom):
         # General info
@@ -410,97 +979,75 @@ class Subject:
             self.UPDRS_dom = np.round(np.sum([i for i in [UPDRS3_4b, UPDRS3_5b, UPDRS3_6b] if ~np.isnan(i)]) / n_b)
             self.UPDRS_ndom = np.round(np.sum([i for i in [UPDRS3_4a, UPDRS3_5a, UPDRS3_6a] if ~np.isnan(i)]) / n_a)
         
-        # List of key presses/releases of the different tests
-        self.qp_dom = qp_dom
-        self.qp_ndom = qp_ndom
-        self.mn_dom = mn_dom
-        self.mn_ndom = mn_ndom
-        self.m_dom = m_dom
-        self.m_ndom = m_ndom
-        
-        # Flight times and errors
-        self.qp_dom_ft, self.qp_dom_err = computeFlightTimesWithTwoTargets(80, 81, qp_dom, 60000)
-        self.qp_ndom_ft, self.qp_ndom_err = computeFlightTimesWithTwoTargets(80, 81, qp_ndom, 60000)
-        self.mn_dom_ft, self.mn_dom_err = computeFlightTimesWithTwoTargets(77, 78, mn_dom, 60000)
-        self.mn_ndom_ft, self.mn_ndom_err = computeFlightTimesWithTwoTargets(77, 78, mn_ndom, 60000)
-        self.m_dom_ft, self.m_dom_err = computeFlightTimesWithOneTarget(77, m_dom, 60000)
-        self.m_ndom_ft, self.m_ndom_err = computeFlightTimesWithOneTarget(77, m_ndom, 60000)
-        
-        # Velocity score per 2 second intervals
-        self.qp_dom_vs, _, _ = computeVelocityScore(80, qp_dom, 81)
-        self.qp_ndom_vs, _, _ = computeVelocityScore(80, qp_ndom, 81)
-        self.mn_dom_vs, _, _ = computeVelocityScore(77, mn_dom, 78)
-        self.mn_ndom_vs, _, _ = computeVelocityScore(77, mn_ndom, 78)
-        self.m_dom_vs, _, _ = computeVelocityScore(77, m_dom)
-        self.m_ndom_vs, _, _ = computeVelocityScore(77, m_ndom)
-        
-        # Dwell times
-        self.qp_dom_dt = computeDwellTimes(qp_dom, 80, 60000, 81)
-        self.qp_ndom_dt = computeDwellTimes(qp_ndom, 80, 60000, 81)
-        self.mn_dom_dt = computeDwellTimes(mn_dom, 77, 60000, 78)
-        self.mn_ndom_dt = computeDwellTimes(mn_ndom, 77, 60000, 78)
-        self.m_dom_dt = computeDwellTimes(m_dom, 77, 60000)
-        self.m_ndom_dt = computeDwellTimes(m_ndom, 77, 60000)
-        
-        # Flight times and dwell times for first 10 seconds
-        self.qp_dom_ft_10, self.qp_dom_err_10 = computeFlightTimesWithTwoTargets(80, 81, qp_dom, 10000)
-        self.qp_ndom_ft_10, self.qp_ndom_err_10 = computeFlightTimesWithTwoTargets(80, 81, qp_ndom, 10000)
-        self.mn_dom_ft_10, self.mn_dom_err_10 = computeFlightTimesWithTwoTargets(77, 78, mn_dom, 10000)
-        self.mn_ndom_ft_10, self.mn_ndom_err_10 = computeFlightTimesWithTwoTargets(77, 78, mn_ndom, 10000)
-        self.m_dom_ft_10, self.m_dom_err_10 = computeFlightTimesWithOneTarget(77, m_dom, 10000)
-        self.m_ndom_ft_10, self.m_ndom_err_10 = computeFlightTimesWithOneTarget(77, m_ndom, 10000)
-        self.qp_dom_dt_10 = computeDwellTimes(qp_dom, 80, 10000, 81)
-        self.qp_ndom_dt_10 = computeDwellTimes(qp_ndom, 80, 10000, 81)
-        self.mn_dom_dt_10 = computeDwellTimes(mn_dom, 77, 10000, 78)
-        self.mn_ndom_dt_10 = computeDwellTimes(mn_ndom, 77, 10000, 78)
-        self.m_dom_dt_10 = computeDwellTimes(m_dom, 77, 10000)
-        self.m_ndom_dt_10 = computeDwellTimes(m_ndom, 77, 10000)
+        # Key presses/releases of the different tests in columnar form
+        self.qp_dom = asKeyEvents(qp_dom)
+        self.qp_ndom = asKeyEvents(qp_ndom)
+        self.mn_dom = asKeyEvents(mn_dom)
+        self.mn_ndom = asKeyEvents(mn_ndom)
+        self.m_dom = asKeyEvents(m_dom)
+        self.m_ndom = asKeyEvents(m_ndom)
         
-        # Hasan 2019 features
-        self.qp_dom_ft_30, _ = computeFlightTimesWithTwoTargets(80, 81, qp_dom, 30000)
-        self.qp_ndom_ft_30, _ = computeFlightTimesWithTwoTargets(80, 81, qp_ndom, 30000)
-        self.qp_dom_dt_30 = computeDwellTimes(qp_dom, 80, 30000, 81)
-        self.qp_ndom_dt_30 = computeDwellTimes(qp_ndom, 80, 30000, 81)
-        self.qp_dom_DS_30 = getDS(qp_dom, 80, 30000, [79, 48, 45, 91, 59, 76, 9, 49, 50, 87, 65, 20], 81)
-        self.qp_ndom_DS_30 = getDS(qp_ndom, 80, 30000, [79, 48, 45, 91, 59, 76, 9, 49, 50, 87, 65, 20], 81)
-        self.qp_dom_VS_30 = computeVelocityScore2(self.qp_dom_ft_30)
-        self.qp_ndom_VS_30 = computeVelocityScore2(self.qp_ndom_ft_30)
-        
-        self.qp_dom_DS_60 = getDS(qp_dom, 80, 60000, [79, 48, 45, 91, 59, 76, 9, 49, 50, 87, 65, 20], 81)
-        self.qp_ndom_DS_60 = getDS(qp_ndom, 80, 60000, [79, 48, 45, 91, 59, 76, 9, 49, 50, 87, 65, 20], 81)
-        self.qp_dom_VS_60 = computeVelocityScore2(self.qp_dom_ft)
-        self.qp_ndom_VS_60 = computeVelocityScore2(self.qp_ndom_ft)
-        
-        self.qp_dom_DS_10 = getDS(qp_dom, 80, 10000, [79, 48, 45, 91, 59, 76, 9, 49, 50, 87, 65, 20], 81)
-        self.qp_ndom_DS_10 = getDS(qp_ndom, 80, 10000, [79, 48, 45, 91, 59, 76, 9, 49, 50, 87, 65, 20], 81)
-        self.qp_dom_VS_10 = computeVelocityScore2(self.qp_dom_ft_10)
-        self.qp_ndom_VS_10 = computeVelocityScore2(self.qp_ndom_ft_10)
-        
-        self.mn_dom_DS_60 = getDS(mn_dom, 77, 60000, [74, 75, 44, 32, 66, 72], 78)
-        self.mn_ndom_DS_60 = getDS(mn_ndom, 77, 60000, [74, 75, 44, 32, 66, 72], 78)
-        self.m_dom_DS_60 = getDS(m_dom, 77, 60000, [78, 74, 75, 32, 44])
-        self.m_ndom_DS_60 = getDS(m_ndom, 77, 60000, [78, 74, 75, 32, 44])
-
-        # Preprocessing of FT and DT: reject outliers >2SD
-        self.qp_dom_dt, self.qp_dom_out_dt = reject_outliers(self.qp_dom_dt, m=2, remove = 0)
-        self.qp_ndom_dt, self.qp_ndom_out_dt = reject_outliers(self.qp_ndom_dt, m=2, remove = 0)
-        self.mn_dom_dt, self.mn_dom_out_dt = reject_outliers(self.mn_dom_dt, m=2, remove = 0)
-        self.mn_ndom_dt, self.mn_ndom_out_dt = reject_outliers(self.mn_ndom_dt, m=2, remove = 0)
-        self.m_dom_dt, self.m_dom_out_dt = reject_outliers(self.m_dom_dt, m=2, remove = 0)
-        self.m_ndom_dt, self.m_ndom_out_dt = reject_outliers(self.m_ndom_dt, m=2, remove = 0)
-        
-        self.qp_dom_ft, self.qp_dom_out_ft = reject_outliers(self.qp_dom_ft, m=2, remove = 0)
-        self.qp_ndom_ft, self.qp_ndom_out_ft = reject_outliers(self.qp_ndom_ft, m=2, remove = 0)
-        self.mn_dom_ft, self.mn_dom_out_ft = reject_outliers(self.mn_dom_ft, m=2, remove = 0)
-        self.mn_ndom_ft, self.mn_ndom_out_ft = reject_outliers(self.mn_ndom_ft, m=2, remove = 0)
-        self.m_dom_ft, self.m_dom_out_ft = reject_outliers(self.m_dom_ft, m=2, remove = 0)
-        self.m_ndom_ft, self.m_ndom_out_ft = reject_outliers(self.m_ndom_ft, m=2, remove = 0)
+    def __getattr__(self, name):
+        # only called for attributes that are not set yet: compute the family of the feature
+        if name not in FEATURE_FAMILIES:
+            raise AttributeError("'Subject' object has no attribute '" + name + "'")
+        test, family = FEATURE_FAMILIES[name]
+        self.computeFeatures(test, [family])
+        return self.__dict__[name]
+    
+    def computeFeatures(self, test, families):
+        """Computes families of features of a test and sets them as attributes. The time intervals of all requested families are computed in one walk over the key presses/releases.
+        
+        Parameters:
+            test(string): name of the test, e.g. "qp_dom"
+            families(list): time intervals in msec for the flight times, errors, dwell times and DS of a time interval, "outliers" for the flight and dwell times without outliers, "vs" for the velocity score
+        """
+        events = getattr(self, test)
+        layout, windows = SUBJECT_TESTS[test]
+        if ("vs" in families):
+            targets = getLayout(layout).targets
+            self.__dict__[test + "_vs"], _, _ = computeVelocityScore(targets[0], events, targets[1] if len(targets) > 1 else None)
+        
+        # the outlier rejection needs the 60 seconds
+        needed = [window for window in windows if window in families or (window == 60000 and "outliers" in families)]
+        if (len(needed) == 0):
+            return
+        features = computeWindowFeatures(events, layout, needed)
+        for window in needed:
+            if window in families:
+                self.__dict__.update(getWindowFeatures(test, window, features[window], hasan = 30000 in windows))
+        if ("outliers" in families):
+            self.__dict__.update(getOutlierFeatures(test, features[60000]))
+            
+    def precompute(self, features = None):
+        """Computes features in advance, e.g. before a subject is sent to another process or stored. The missing families of a test are computed together.
+        
+        Parameters:
+            features(list): attribute names of the features (None: all features)
+        
+        Returns: 
+            Subject object: the subject itself
+        """
+        families = {}
+        for name in (FEATURE_FAMILIES if features is None else features):
+            if (name not in self.__dict__):
+                test, family = FEATURE_FAMILIES[name]
+                families.setdefault(test, []).append(family)
+        for test, missing in families.items():
+            self.computeFeatures(test, set(missing))
+        return self
+        
+    def toRow(self):
+        """
+            Returns all attributes as a list in the order of the dataframe columns; the key presses/releases of the tests are lists of {'k', 'p', 'e'} dictionaries as in the JSON files
+        """
+        return [self.subject_id, self.diagnosis, self.typist, self.side, self.years, self.UPDRS_dom, self.UPDRS_ndom, self.serial, self.hand, self.tm, self.qp_dom.toList(), self.qp_ndom.toList(), self.mn_dom.toList(), self.mn_ndom.toList(), self.m_dom.toList(), self.m_ndom.toList(), self.qp_dom_ft, self.qp_ndom_ft, self.mn_dom_ft, self.mn_ndom_ft, self.m_dom_ft, self.m_ndom_ft, self.qp_dom_err, self.qp_ndom_err, self.mn_dom_err, self.mn_ndom_err, self.m_dom_err, self.m_ndom_err, self.qp_dom_dt, self.qp_ndom_dt, self.mn_dom_dt, self.mn_ndom_dt, self.m_dom_dt, self.m_ndom_dt, self.qp_dom_ft_10, self.qp_ndom_ft_10, self.mn_dom_ft_10, self.mn_ndom_ft_10, self.m_dom_ft_10, self.m_ndom_ft_10, self.qp_dom_dt_10, self.qp_ndom_dt_10, self.mn_dom_dt_10, self.mn_ndom_dt_10, self.m_dom_dt_10, self.m_ndom_dt_10, self.qp_dom_err_10, self.qp_ndom_err_10, self.mn_dom_err_10, self.mn_ndom_err_10, self.m_dom_err_10, self.m_ndom_err_10, self.qp_dom_vs, self.qp_ndom_vs, self.mn_dom_vs, self.mn_ndom_vs, self.m_dom_vs, self.m_ndom_vs, self.qp_dom_ft_30, self.qp_ndom_ft_30, self.qp_dom_dt_30, self.qp_ndom_dt_30, self.qp_dom_DS_30, self.qp_ndom_DS_30, self.qp_dom_VS_30, self.qp_ndom_VS_30, self.qp_dom_DS_60, self.qp_ndom_DS_60, self.qp_dom_VS_60, self.qp_ndom_VS_60, self.qp_dom_DS_10, self.qp_ndom_DS_10, self.qp_dom_VS_10, self.qp_ndom_VS_10, self.qp_dom_out_dt, self.qp_ndom_out_dt, self.mn_dom_out_dt, self.mn_ndom_out_dt, self.m_dom_out_dt, self.m_ndom_out_dt, self.qp_dom_out_ft, self.qp_ndom_out_ft, self.mn_dom_out_ft, self.mn_ndom_out_ft, self.m_dom_out_ft, self.m_ndom_out_ft, self.mn_dom_DS_60, self.mn_ndom_DS_60, self.m_dom_DS_60, self.m_ndom_DS_60]
         
     def toDataframe(self):
         """
             Transforms all attributes into a dataframe
         """
-        data = [self.subject_id, self.diagnosis, self.typist, self.side, self.years, self.UPDRS_dom, self.UPDRS_ndom, self.serial, self.hand, self.tm, self.qp_dom, self.qp_ndom, self.mn_dom, self.mn_ndom, self.m_dom, self.m_ndom, self.qp_dom_ft, self.qp_ndom_ft, self.mn_dom_ft, self.mn_ndom_ft, self.m_dom_ft, self.m_ndom_ft, self.qp_dom_err, self.qp_ndom_err, self.mn_dom_err, self.mn_ndom_err, self.m_dom_err, self.m_ndom_err, self.qp_dom_dt, self.qp_ndom_dt, self.mn_dom_dt, self.mn_ndom_dt, self.m_dom_dt, self.m_ndom_dt, self.qp_dom_ft_10, self.qp_ndom_ft_10, self.mn_dom_ft_10, self.mn_ndom_ft_10, self.m_dom_ft_10, self.m_ndom_ft_10, self.qp_dom_dt_10, self.qp_ndom_dt_10, self.mn_dom_dt_10, self.mn_ndom_dt_10, self.m_dom_dt_10, self.m_ndom_dt_10, self.qp_dom_err_10, self.qp_ndom_err_10, self.mn_dom_err_10, self.mn_ndom_err_10, self.m_dom_err_10, self.m_ndom_err_10, self.qp_dom_vs, self.qp_ndom_vs, self.mn_dom_vs, self.mn_ndom_vs, self.m_dom_vs, self.m_ndom_vs, self.qp_dom_ft_30, self.qp_ndom_ft_30, self.qp_dom_dt_30, self.qp_ndom_dt_30, self.qp_dom_DS_30, self.qp_ndom_DS_30, self.qp_dom_VS_30, self.qp_ndom_VS_30, self.qp_dom_DS_60, self.qp_ndom_DS_60, self.qp_dom_VS_60, self.qp_ndom_VS_60, self.qp_dom_DS_10, self.qp_ndom_DS_10, self.qp_dom_VS_10, self.qp_ndom_VS_10, self.qp_dom_out_dt, self.qp_ndom_out_dt, self.mn_dom_out_dt, self.mn_ndom_out_dt, self.m_dom_out_dt, self.m_ndom_out_dt, self.qp_dom_out_ft, self.qp_ndom_out_ft, self.mn_dom_out_ft, self.mn_ndom_out_ft, self.m_dom_out_ft, self.m_ndom_out_ft, self.mn_dom_DS_60, self.mn_ndom_DS_60, self.m_dom_DS_60, self.m_ndom_DS_60]
+        data = self.toRow()
         features = ["subject_id", "diagnosis", "typist", "side", "years", "UPDRS_dom", "UPDRS_ndom", "serial", "hand", "tm", "qp_dom", "qp_ndom", "mn_dom", "mn_ndom", "m_dom", "m_ndom", "qp_dom_ft", "qp_ndom_ft", "mn_dom_ft", "mn_ndom_ft", "m_dom_ft", "m_ndom_ft", "qp_dom_err", "qp_ndom_err", "mn_dom_err", "mn_ndom_err", "m_dom_err", "m_ndom_err", "qp_dom_dt", "qp_ndom_dt", "mn_dom_dt", "mn_ndom_dt", "m_dom_dt", "m_ndom_dt", "qp_dom_ft_10", "qp_ndom_ft_10", "mn_dom_ft_10", "mn_ndom_ft_10", "m_dom_ft_10", "m_ndom_ft_10", "qp_dom_dt_10", "qp_ndom_dt_10", "mn_dom_dt_10", "mn_ndom_dt_10", "m_dom_dt_10", "m_ndom_dt_10", "qp_dom_err_10", "qp_ndom_err_10", "mn_dom_err_10", "mn_ndom_err_10", "m_dom_err_10", "m_ndom_err_10", "qp_dom_vs", "qp_ndom_vs", "mn_dom_vs", "mn_ndom_vs", "m_dom_vs", "m_ndom_vs", "qp_dom_ft_30", "qp_ndom_ft_30", "qp_dom_dt_30", "qp_ndom_dt_30", "qp_dom_DS_30", "qp_ndom_DS_30", "qp_dom_VS_30", "qp_ndom_VS_30", "qp_dom_DS_60", "qp_ndom_DS_60", "qp_dom_VS_60", "qp_ndom_VS_60", "qp_dom_DS_10", "qp_ndom_DS_10", "qp_dom_VS_10", "qp_ndom_VS_10", "qp_dom_hesitations_dt", "qp_ndom_hesitations_dt", "mn_dom_hesitations_dt", "mn_ndom_hesitations_dt", "m_dom_hesitations_dt", "m_ndom_hesitations_dt", "qp_dom_hesitations_ft", "qp_ndom_hesitations_ft", "mn_dom_hesitations_ft", "mn_ndom_hesitations_ft", "m_dom_hesitations_ft", "m_ndom_hesitations_ft", "mn_dom_DS_60", "mn_ndom_DS_60", "m_dom_DS_60", "m_ndom_DS_60"]
         data_t = pd.DataFrame(data).transpose()
         data_t.columns = features
@@ -510,21 +1057,61 @@ class Subjects:
     """
         Loads all subjects.
     """
-    def __init__(self):
+    def __init__(self, n_jobs = None, cache_dir = None, manifest = None):
+        """
+            Initialise class
+
+            Parameters:
+                n_jobs(int): number of worker processes to load the subjects in parallel (None or 1: serial, -1: all CPUs). Subjects that fail to load are skipped with a warning and their errors are kept in self.failed; all features are computed while loading, in both modes, so that errors of the feature code are caught per subject as well.
+                cache_dir(string): directory of the feature cache (None: features are always recomputed)
+                manifest(dataframe/string): cohort manifest (or its filename) of the sessions to load, see cohort.scanCohort and cohort.filterManifest (None: the subjects listed below)
+        """
         self.PD_OFF_ids = ["PD01_OFF", "PD03_OFF", "PD04_OFF", "PD05_OFF", "PD08_OFF", "PD09_OFF", "PD13_OFF", "PD16_OFF", "PD17_OFF", "PD22_OFF", "PD25_OFF", "PD29_OFF", "PD31_OFF", "PD33_OFF", "PD34_OFF", "PD36_OFF", "PD37_OFF", "PD38_OFF", "PD39_OFF"] # "PD21_OFF"
         self.PD_ON_ids = ["PD01_ON", "PD03_ON", "PD04_ON", "PD05_ON", "PD08_ON", "PD09_ON", "PD13_ON", "PD16_ON", "PD17_ON", "PD21_ON", "PD22_ON", "PD25_ON", "PD29_ON", "PD31_ON", "PD33_ON", "PD34_ON", "PD36_ON", "PD37_ON", "PD38_ON", "PD39_ON"]
         self.HC_ids = ["HC01", "HC08", "HC09", "HC11", "HC12", "HC13", "HC14", "HC17", "HC19", "HC20", "HC22", "HC23", "HC25", "HC27", "HC28", "HC30", "HC33", "HC35", "HC36", "HC37"]
         self.CA_ids = ["CA01", "CA02", "CA03", "CA11", "CA13", "CA15", "CA16", "CA25", "CA29", "CA37", "CA39", "CA40", "CA41", "CA44", "CA46", "CA52", "CA55", "CA56", "CA59"]
         self.subject_groups = [self.PD_OFF_ids, self.PD_ON_ids, self.HC_ids, self.CA_ids]
         self.features =  ["subject_id", "diagnosis", "typist", "side", "years", "UPDRS_dom", "UPDRS_ndom", "serial", "hand", "tm", "qp_dom", "qp_ndom", "mn_dom", "mn_ndom", "m_dom", "m_ndom", "qp_dom_ft", "qp_ndom_ft", "mn_dom_ft", "mn_ndom_ft", "m_dom_ft", "m_ndom_ft", "qp_dom_err", "qp_ndom_err", "mn_dom_err", "mn_ndom_err", "m_dom_err", "m_ndom_err", "qp_dom_dt", "qp_ndom_dt", "mn_dom_dt", "mn_ndom_dt", "m_dom_dt", "m_ndom_dt", "qp_dom_ft_10", "qp_ndom_ft_10", "mn_dom_ft_10", "mn_ndom_ft_10", "m_dom_ft_10", "m_ndom_ft_10", "qp_dom_dt_10", "qp_ndom_dt_10", "mn_dom_dt_10", "mn_ndom_dt_10", "m_dom_dt_10", "m_ndom_dt_10", "qp_dom_err_10", "qp_ndom_err_10", "mn_dom_err_10", "mn_ndom_err_10", "m_dom_err_10", "m_ndom_err_10", "qp_dom_vs", "qp_ndom_vs", "mn_dom_vs", "mn_ndom_vs", "m_dom_vs", "m_ndom_vs", "qp_dom_ft_30", "qp_ndom_ft_30", "qp_dom_dt_30", "qp_ndom_dt_30", "qp_dom_DS_30", "qp_ndom_DS_30", "qp_dom_VS_30", "qp_ndom_VS_30", "qp_dom_DS_60", "qp_ndom_DS_60", "qp_dom_VS_60", "qp_ndom_VS_60", "qp_dom_DS_10", "qp_ndom_DS_10", "qp_dom_VS_10", "qp_ndom_VS_10", "qp_dom_hesitations_dt", "qp_ndom_hesitations_dt", "mn_dom_hesitations_dt", "mn_ndom_hesitations_dt", "m_dom_hesitations_dt", "m_ndom_hesitations_dt", "qp_dom_hesitations_ft", "qp_ndom_hesitations_ft", "mn_dom_hesitations_ft", "mn_ndom_hesitations_ft", "m_dom_hesitations_ft", "m_ndom_hesitations_ft", "mn_dom_DS_60", "mn_ndom_DS_60", "m_dom_DS_60", "m_ndom_DS_60"]
-        self.df = pd.DataFrame(columns = self.features)
         self.subjects = []
+        self.failed = {}
+        
+        if (manifest is None):
+            filenames = ["Data/" + id + ".txt" for group in self.subject_groups for id in group]
+            diagnoses = [None] * len(filenames)
+        else:
+            if isinstance(manifest, str):
+                manifest = loadManifest(manifest)
+            manifest = sortManifest(filterManifest(manifest, keyboard = True))
+            self.PD_OFF_ids, self.PD_ON_ids, self.HC_ids, self.CA_ids = [manifest.loc[manifest["group"] == group, "subject_id"].tolist() for group in ["PD_OFF", "PD_ON", "HC", "CA"]]
+            self.subject_groups = [self.PD_OFF_ids, self.PD_ON_ids, self.HC_ids, self.CA_ids]
+            filenames = manifest["data_path"].tolist()
+            diagnoses = manifest["diagnosis"].tolist()
+        
+        if (n_jobs == 0):
+            raise ValueError("n_jobs must not be 0 (None or 1: serial, -1: all CPUs)")
+        if (n_jobs is None or n_jobs == 1):
+            loaded = (loadSubject(filename, cache_dir, diagnosis) for filename, diagnosis in zip(filenames, diagnoses))
+        else:
+            # the results of the pool are returned in the order of the filenames
+            with ProcessPoolExecutor(max_workers = os.cpu_count() if n_jobs < 0 else n_jobs) as pool:
+                loaded = list(pool.map(loadSubject, filenames, repeat(cache_dir), diagnoses))
         
-        for group in self.subject_groups:
-            for id in group:
-                s = createSubjectFromData("Data/" + id + ".txt")
-                self.df = self.df.append(s.toDataframe())
-                self.subjects.append(s)
+        for filename, (s, error) in zip(filenames, loaded):
+            if (error is not None):
+                warnings.warn("Could not load " + filename + ":\n" + error)
+                self.failed[filename] = error
+                continue
+            self.subjects.append(s)
+            
+    @cached_property
+    def df(self):
+        """
+            Dataframe with all attributes of all subjects, built on first access (which computes all features)
+        """
+        table = TableBuilder(self.features)
+        for s in self.subjects:
+            table.append(s.toRow())
+        return table.toDataFrame()
                 
     def getPD_OFF(self):
         return self.df[self.df['subject_id'].str.contains('PD') & self.df['subject_id'].str.contains('OFF')]
@@ -536,4 +1123,210 @@ class Subjects:
         return self.df[self.df['subject_id'].str.contains('HC')]
         
     def getCA(self):
-        return self.df[self.df['subject_id'].str.contains('CA')]
\ No newline at end of file
+        return self.df[self.df['subject_id'].str.contains('CA')]
+
+class OnlineKeyTest:
+    """ 
+    This class computes the features of a FTT incrementally while the test is running. Key presses/releases are pushed one at a time (or in small batches) in the order of their timestamps, and the features of the events seen so far are available at any moment. They are identical to the features computeWindowFeatures and computeVelocityScore compute from the same events.
+    """
+    def __init__(self, layout, windows, step_ms = 2000, duration = 60000):
+        """
+            Initialise class
+
+            Parameters:
+                layout(string/KeyboardLayout): name of a registered layout or layout with the target key(s) of the FTT
+                windows(list): time intervals in msec
+                step_ms(float): length of the time intervals of the velocity score in msec
+                duration(int): duration of the test in msec
+        """
+        self.layout = getLayout(layout)
+        self.target1 = self.layout.targets[0]
+        self.target2 = self.layout.targets[1] if len(self.layout.targets) > 1 else None
+        self.windows = list(windows)
+        self.step_ms = step_ms
+        self.duration = duration
+        self.start = None
+        self.lastTime = None
+        
+        # Flight times: state of the target key sequence and number of flight times/errors per time interval
+        self.currentTargetKey = None
+        self.nrOfInitialErrors = 0
+        self.ft = []
+        self.nrOfFt = [0] * len(self.windows)
+        self.nrOfErrors = [0] * len(self.windows)
+        
+        # Dwell times in the order of the target key presses (None while not released), number of presses per time interval and the presses waiting for their release per key
+        self.dt = []
+        self.nrOfPresses = [0] * len(self.windows)
+        self.pending = {}
+        
+        # Sum of the DS scores and number of key presses per time interval
+        self.dsSums = [0] * len(self.windows)
+        self.dsCounts = [0] * len(self.windows)
+        
+        # Number of flight times per velocity interval, each interval restarts the target key sequence
+        self.velocityCounts = [0] * len(getVelocityIntervals(step_ms, duration))
+        self.interval = None
+        self.intervalTargetKey = None
+        
+    def nextTarget(self, current):
+        """Returns the target key that has to be pressed next after the current target key."""
+        if (self.target2 is None):
+            return self.target1
+        return getOtherTargetKey(self.target1, self.target2, current)
+        
+    def push(self, k, p, e):
+        """Adds a key press/release to the test.
+        
+        Parameters:
+            k(int): key code
+            p(int): position (0 = pressed, 1 = released)
+            e(int): timestamp in msec
+        """
+        if (self.start is None):
+            self.start = e
+            self.ends = [e + window for window in self.windows]
+            self.lastEnd = max(self.ends)
+            self.velocityStarts = [e + start for start in getVelocityIntervals(self.step_ms, self.duration)]
+        elif (e < self.lastTime):
+            raise ValueError("Key presses/releases must be pushed in the order of their timestamps (" + str(e) + " after " + str(self.lastTime) + ")")
+        self.lastTime = e
+        isTarget = (k == self.target1 or k == self.target2)
+        
+        # Flight times and errors (see computeWindowFeatures)
+        if (self.currentTargetKey is None):
+            if (p == 1 and isTarget):
+                self.currentTargetKey = k
+                self.currentKeyTime = e
+            elif not isTarget:
+                self.nrOfInitialErrors = self.nrOfInitialErrors + 1
+        elif (p == 0 and e < self.lastEnd):
+            if (k == self.nextTarget(self.currentTargetKey)):
+                self.ft.append(e - self.currentKeyTime)
+                self.currentTargetKey = k
+                self.currentKeyTime = e
+                self.count(self.nrOfFt, e)
+            elif not isTarget:
+                self.count(self.nrOfErrors, e)
+        elif (p == 1 and e < self.lastEnd):
+            if (k == self.currentTargetKey):
+                self.currentKeyTime = e
+            elif not isTarget:
+                self.count(self.nrOfErrors, e)
+        
+        # Dwell times: pair target key presses with the next release of the same key
+        if (p == 0 and isTarget and e < self.lastEnd):
+            self.pending.setdefault(k, []).append((len(self.dt), e))
+            self.dt.append(None)
+            self.count(self.nrOfPresses, e)
+        elif (p == 1 and k in self.pending):
+            for press, pressTime in self.pending.pop(k):
+                self.dt[press] = e - pressTime
+        
+        # DS
+        if (p == 0):
+            score = int(self.layout.score([k])[0])
+            for i, end in enumerate(self.ends):
+                if (e < end):
+                    self.dsSums[i] = self.dsSums[i] + score
+                    self.dsCounts[i] = self.dsCounts[i] + 1
+        
+        # Velocity score (see FlightTimeIndex)
+        interval = bisect_right(self.velocityStarts, e) - 1
+        if (interval >= 0 and e < self.velocityStarts[interval] + self.step_ms):
+            if (interval != self.interval):
+                self.interval = interval
+                self.intervalTargetKey = None
+            if (self.intervalTargetKey is None):
+                if (p == 1 and isTarget):
+                    self.intervalTargetKey = k
+            elif (p == 0 and k == self.nextTarget(self.intervalTargetKey)):
+                self.velocityCounts[interval] = self.velocityCounts[interval] + 1
+                self.intervalTargetKey = k
+        
+    def count(self, counts, e):
+        """Increases the counts of the time intervals that contain the timestamp e."""
+        for i, end in enumerate(self.ends):
+            if (e < end):
+                counts[i] = counts[i] + 1
+        
+    def pushMany(self, datalist):
+        """Adds several key presses/releases to the test.
+        
+        Parameters:
+            datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
+        """
+        for k, p, e in zip(*asKeyEvents(datalist).columns()):
+            self.push(k, p, e)
+            
+    def features(self):
+        """Returns the flight times, errors, dwell times and DS of the key presses/releases pushed so far.
+        
+        Returns: 
+            dict: per time interval a dict with the flight times ('ft'), nr of errors ('err'), dwell times ('dt') and DS ('DS') as returned by computeWindowFeatures
+        """
+        features = {}
+        for i, window in enumerate(self.windows):
+            if (self.currentTargetKey is None):
+                ft, nrOfErrors = [], 0
+            else:
+                ft, nrOfErrors = self.ft[:self.nrOfFt[i]], self.nrOfInitialErrors + self.nrOfErrors[i]
+            dt = [d for d in self.dt[:self.nrOfPresses[i]] if d is not None]
+            DS = np.int64(self.dsSums[i]) / np.int64(self.dsCounts[i]) if self.dsCounts[i] > 0 else np.float64(np.nan)
+            features[window] = {'ft' : ft, 'err' : nrOfErrors, 'dt' : dt, 'DS' : DS}
+        return features
+    
+    def velocityScore(self):
+        """Returns the velocity score of the key presses/releases pushed so far.
+        
+        Returns:
+            float: velocity score (slope of the velocity curve)
+            float: intercept of the velocity curve
+            float: standard error of the slope
+        """
+        vss = getVelocityChanges(self.velocityCounts, self.step_ms)
+        slope, intercept, _, _, std_err = stats.linregress(range(len(vss)), vss)
+        return slope, intercept, std_err
+    
+class OnlineSubject:
+    """ 
+    This class computes the features of the FTTs of a subject while the tests are running (see OnlineKeyTest).
+    """
+    def __init__(self):
+        self.tests = {name : OnlineKeyTest(layout, windows) for name, (layout, windows) in SUBJECT_TESTS.items()}
+        
+    def push(self, test, k, p, e):
+        """Adds a key press/release to a test.
+        
+        Parameters:
+            test(string): name of the test, e.g. "qp_dom"
+            k(int): key code
+            p(int): position (0 = pressed, 1 = released)
+            e(int): timestamp in msec
+        """
+        self.tests[test].push(k, p, e)
+        
+    def pushMany(self, test, datalist):
+        """Adds several key presses/releases to a test.
+        
+        Parameters:
+            test(string): name of the test, e.g. "qp_dom"
+            datalist(list/KeyEvents): data list which contains the information about when which key was pressed/released
+        """
+        self.tests[test].pushMany(datalist)
+        
+    def features(self, tests = None):
+        """Returns the features of the key presses/releases pushed so far under the attribute names of the Subject class.
+        
+        Parameters:
+            tests(list): names of the tests (None: all tests)
+        
+        Returns: 
+            dict: features by attribute name
+        """
+        attributes = {}
+        for name in (self.tests if tests is None else tests):
+            test = self.tests[name]
+            attributes[name + "_vs"], _, _ = test.velocityScore()
+            attributes.update(getTestFeatures(name, test.features()))
+        return attributes
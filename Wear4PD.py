@@ -10,14 +10,27 @@ import numpy as np
 import scipy.stats as stats
 from sklearn.preprocessing import MinMaxScaler
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from scipy import fftpack
-import scipy.io as sio
 import math
+from typing import NamedTuple
+import os
+from collections import deque
+from itertools import islice
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from scipy.signal import argrelextrema
-from scipy import signal
+from wavelets import cwtReduce
+from tablebuilder import TableBuilder
+from sessionfile import readSession
+from sensorstore import readSensorWindow, getTimestampIndex
+from headerindex import readHeader
+from timeslots import TIMESLOTS_FILE, lookupTimeslots, getTimeslotKinds
+from cohort import loadManifest, filterManifest, sortManifest, getSessionPaths, getManifestPaths
 
 def readJSONFile(filename):
-    """Reads JSON file and returns the data as a Python dictionary.
+    """Reads the clinical data of a JSON file and returns it as a Python dictionary. The binary version of the file is read instead if it exists (see sessionfile.convertCohort), without the key presses/releases of the keyboard tests.
     
     Parameters:
         filename(string): name of the JSON file
@@ -25,10 +38,7 @@ def readJSONFile(filename):
     Returns: 
         dict: data of JSON file
     """
-    f = open(filename,) 
-    data = json.load(f) 
-    
-    return data
+    return readSession(filename, events = False)
 
 def segmentIntegrals(integrals):
     """Finds and returns the local minima and maxima.
@@ -60,81 +70,299 @@ def findHesitationsFreezing(CSA_T, threshold, main_freq, dt):
         Returns:
             int: number of detected hesitations/halts
     """
-    T = 1/float(main_freq)
-    steps = int((T/dt)/3)
-    bool_arr = CSA_T < threshold
-    counter = 0
-    i = 0
-    for e in bool_arr:
-        if e:
-            i = i + 1
-        else:
-            if (i > steps):
-                counter = counter + 1
-            i = 0
-    return counter
+    counts, _ = detectHesitationsFreezing(CSA_T, [threshold], main_freq, dt, legacy = True)
+    return counts[0]
+
+def detectHesitationsFreezing(CSA_T, thresholds, main_freq, dt, t0 = 0.0, legacy = False):
+    """Locates the hesitations/halts for several thresholds at once (see findHesitationsFreezing). The runs of samples below every threshold are found with one comparison of the whole signal per threshold instead of a loop over the samples.
+
+        Parameters:
+            CSA_T(list): list of the cross-sectional area along the time-axis.
+            thresholds(list): thresholds
+            main_freq(float): frequency characteristic described by Bobić
+            dt(float): time step
+            t0(float): time of the first sample
+            legacy(boolean): ignore a run that lasts until the end of the signal (as findHesitationsFreezing always did)
 
-def getAmplitudes(x, y):
+        Returns:
+            list: number of detected hesitations/halts per threshold
+            dataframe: one row per hesitation/halt with threshold, start time, end time (first sample above the threshold), duration and depth (threshold minus the lowest CSA in the run)
+    """
+    CSA_T = np.asarray(CSA_T)
+    thresholds = np.asarray(thresholds, dtype = float).reshape(-1)
+    # main_freq may be the one-element array of the CWT frequency
+    T = 1/float(np.ravel(main_freq)[0])
+    steps = int((T/dt)/3)
+    
+    # Starts and ends (exclusive) of all runs below the thresholds, one row per threshold
+    below = CSA_T[np.newaxis, :] < thresholds[:, np.newaxis]
+    edges = np.diff(np.pad(below, ((0, 0), (1, 1))).astype(np.int8), axis = 1)
+    row, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    
+    keep = (ends - starts) > steps
+    if legacy:
+        keep &= ends < len(CSA_T)
+    row, starts, ends = row[keep], starts[keep], ends[keep]
+    
+    # Lowest value of every run (the padding makes the end of the signal a valid index)
+    if len(starts):
+        padded = np.append(CSA_T.astype(float), np.inf)
+        lowest = np.minimum.reduceat(padded, np.stack([starts, ends], axis = 1).reshape(-1))[::2]
+    else:
+        lowest = np.array([], dtype = float)
+    
+    events = pd.DataFrame({"threshold" : thresholds[row], 
+                           "start" : t0 + starts*dt, 
+                           "end" : t0 + ends*dt, 
+                           "duration" : (ends - starts)*dt, 
+                           "depth" : thresholds[row] - lowest})
+    return np.bincount(row, minlength = len(thresholds)).tolist(), events
+
+def getAmplitudes(x, y, rule = "rectangle", uniform = True):
     """Computes relative angular displacement, the absolute amplitudes, and the durations of the movements
 
             Parameters:
                 x(list): timestamps
                 y(list): angular velocity
+                rule(string): integration rule (see F)
+                uniform(boolean): use the first sampling interval for all samples (see F)
 
             Returns:
                 list: indices of maxima
                 list: indices of minima
     """
     # Take integral
-    integral = F(x,y)
+    integral = F(x, y, rule, uniform)
     # Get local minima and maxima
     (maxi,), (mini,) = segmentIntegrals(integral)
 
     # Compute absolute amplitudes and durations
-    absAmp = np.array([])
-    durations = np.array([])
-    while ((mini.size != 0 and maxi.size != 0)):
-        if (min(mini) < min(maxi)):
-            absAmp = np.append(absAmp, integral[mini[0]] - integral[maxi[0]])
-            durations = np.append(durations, x[maxi[0]] - x[mini[0]])
-            mini = mini[1:]
-        else:
-            absAmp = np.append(absAmp, integral[maxi[0]] - integral[mini[0]])
-            durations = np.append(durations, x[mini[0]] - x[maxi[0]])
-            maxi = maxi[1:]
+    absAmp, durations, _, _ = segmentMovements(x, integral, maxi, mini)
 
     return integral, absAmp, durations
+
+def segmentMovements(x, integral, maxi, mini):
+    """Splits the relative angular displacement into movements (pronations and supinations). Every local extremum starts a movement that ends at the next extremum of the other kind, the movements are in the order of their start. Extrema without a later extremum of the other kind start no movement.
+
+            Parameters:
+                x(list): timestamps
+                integral(array): relative angular displacement
+                maxi(array): sorted indices of the local maxima
+                mini(array): sorted indices of the local minima
+
+            Returns:
+                array: amplitudes (displacement at the start minus displacement at the end)
+                array: durations
+                array: indices of the start samples
+                array: indices of the end samples
+    """
+    x = np.asarray(x)
+    maxi = np.asarray(maxi, dtype = np.intp)
+    mini = np.asarray(mini, dtype = np.intp)
     
-def createHeaderDict(header):
-    """Creates a dictionary with the header information
+    # Next extremum of the other kind after every extremum
+    maxiEnd = np.searchsorted(mini, maxi, side = "right")
+    miniEnd = np.searchsorted(maxi, mini, side = "right")
+    starts = np.concatenate([maxi[maxiEnd < len(mini)], mini[miniEnd < len(maxi)]])
+    ends = np.concatenate([mini[maxiEnd[maxiEnd < len(mini)]], maxi[miniEnd[miniEnd < len(maxi)]]])
+    
+    order = np.argsort(starts, kind = "stable")
+    starts, ends = starts[order], ends[order]
+    amplitudes = (integral[starts] - integral[ends]).astype(np.float64)
+    durations = (x[ends] - x[starts]).astype(np.float64)
+    return amplitudes, durations, starts, ends
+    
+class WristFeatures(NamedTuple):
+    """Features of the supination pronation movements of one wrist (see computeWristFeatures)."""
+    mean_amplitude_supination: float
+    mean_amplitude_pronation: float
+    mean_amplitude: float
+    var_amplitude_supination: float
+    var_amplitude_pronation: float
+    var_amplitude: float
+    decrement_amplitude_supination: float
+    decrement_amplitude_pronation: float
+    decrement_amplitude: float
+    main_freq: float
+    var_periods: float
+    decrement_periods: float
+    movements: int
+    hesitations: int
+    freezes: int
+    f1: float
+
+class WristSegmentation(NamedTuple):
+    """Relative angular displacement of one wrist and its local extrema, which split it into movements (see computeWristFeatures)."""
+    integral: np.ndarray
+    maxima: np.ndarray
+    minima: np.ndarray
+
+def computeWristFeatures(timestamps, signal, fs, integration_rule = "rectangle", uniform_spacing = True, cwt_precision = "double", segmentation = False):
+    """Computes the amplitude, frequency, period and hesitation features of the recording of one wrist.
 
         Parameters:
-            header(mat structure): header containing additional information
+            timestamps(array): timestamps
+            signal(array): angular velocities (y-axis of the gyroscope)
+            fs(float): sampling frequency
+            integration_rule(string): integration rule of the angular velocities (see F)
+            uniform_spacing(boolean): integrate with the first sampling interval for all samples (see F)
+            cwt_precision(string): precision of the wavelet transform ("double" or "single", see MorletCWT)
+            segmentation(boolean): return the integral and its extrema as well, e.g. for plots (see Wear4PD.plotIntegrals)
 
         Returns:
-            list: indices of maxima
-            list: indices of minima
+            WristFeatures: features
+            WristSegmentation: integral and extrema (only if segmentation is True)
+    """
+    integral = F(timestamps, signal, integration_rule, uniform_spacing)
+    (maxi,), (mini,) = segmentIntegrals(integral)
+    amplitudes, durations, _, _ = segmentMovements(timestamps, integral, maxi, mini)
+    supination = amplitudes[amplitudes > 0]
+    pronation = amplitudes[amplitudes < 0]
+    
+    ## Frequency/Speed Features:
+    z = fftpack.fft(signal)
+    freqs = fftpack.fftfreq(len(signal)) * fs
+    
+    ## Hesitations and Halts
+    dt = timestamps[1] - timestamps[0]
+    
+    # Normalize signal
+    p = np.polyfit(timestamps - timestamps[0], signal, 1)
+    dat_notrend = signal - np.polyval(p, timestamps - timestamps[0])
+    dat_norm = dat_notrend / dat_notrend.std()  # Normalized dataset
+    
+    w = 1. # central frequency
+    freq = np.linspace(1, fs/2, 100)
+    widths = w*fs / (2*freq*np.pi)
+    # continuous wavelet transform, reduced to the sum of the magnitudes per sample and the index of the frequency characteristic
+    csa, x, y = cwtReduce(dat_norm, widths, w=w, precision=cwt_precision)
+    
+    # Compute cross-sectional area by summing the CWT coefficients perpendicular to the time axis
+    # Normalize with respect to its maximum value and is expressed as a percentage
+    CSA_T = csa/np.max(csa) * 100
+    
+    # Compute thresholds
+    hesitation_threshold = 0.5*np.mean(CSA_T)
+    freeze_threshold = 0.25*np.mean(CSA_T)
+    (hesitations, freezes), _ = detectHesitationsFreezing(CSA_T, [hesitation_threshold, freeze_threshold], freq[x], dt, legacy = True)
+    
+    features = WristFeatures(mean_amplitude_supination = np.mean(supination),
+                             mean_amplitude_pronation = np.mean(pronation),
+                             mean_amplitude = np.mean(np.abs(amplitudes)),
+                             var_amplitude_supination = np.var(supination),
+                             var_amplitude_pronation = np.var(pronation),
+                             var_amplitude = np.var(np.abs(amplitudes)),
+                             decrement_amplitude_supination = np.polyfit(range(len(supination)), supination, 1)[0],
+                             decrement_amplitude_pronation = np.polyfit(range(len(pronation)), pronation, 1)[0],
+                             decrement_amplitude = np.polyfit(range(len(amplitudes)), np.abs(amplitudes), 1)[0],
+                             main_freq = freqs[np.argmax(np.abs(z))],
+                             var_periods = np.var(durations),
+                             decrement_periods = np.polyfit(range(len(durations)), durations, 1)[0],
+                             movements = len(durations),
+                             hesitations = hesitations,
+                             freezes = freezes,
+                             # the first of the largest coefficients: MinMaxScaler cannot scale the one-element arrays of freq[x] with NumPy 2
+                             f1 = freq[x[0]])
+    if segmentation:
+        return features, WristSegmentation(integral, maxi, mini)
+    return features
+
+def mapWrists(handedness, side, wrists):
+    """Assigns the features of the left and the right wrist to the dominant and the non-dominant hand.
+
+        Parameters:
+            handedness(string): "left" (the left wrist is dominant) or other (the right wrist is dominant)
+            side(int): affected side (1: right, 2: left, 3: both, other: no information)
+            wrists(tuple): features of the left wrist and the right wrist
+
+        Returns:
+            tuple: features of the dominant hand and whether it is affected
+            tuple: features of the non-dominant hand and whether it is affected
+    """
+    features_LW, features_RW = wrists
+    affected_LW = side in (2, 3)
+    affected_RW = side in (1, 3)
+    if (handedness == "left"):
+        return (features_LW, affected_LW), (features_RW, affected_RW)
+    return (features_RW, affected_RW), (features_LW, affected_LW)
+
+def decimateSignal(x, y, max_points = None):
+    """Reduces a signal to at most max_points samples for plotting; the signal is split into max_points/2 consecutive buckets of which the smallest and the largest sample are kept, so that peaks stay visible.
+
+        Parameters:
+            x(array): timestamps
+            y(array): signal
+            max_points(int): maximum number of samples (None: all samples)
+
+        Returns:
+            array: timestamps of the kept samples
+            array: kept samples
     """
-    gyro_scale = header['header'][0][0][6][0][0][1][0][0][0][0][0]
-    gyro_sensorID = header['header'][0][0][6][0][0][1][0][0][1][0][0]
-    gyro_FS = header['header'][0][0][6][0][0][1][0][0][2][0][0]
-    gyro_dataPayload = header['header'][0][0][6][0][0][1][0][0][3][0][0]
-    gyro_calib = header['header'][0][0][6][0][0][1][0][0][4][0]
-    gyro_nbSamples = header['header'][0][0][6][0][0][1][0][0][5][0][0]
-
-    deviceID = header['header'][0][0][0][0][0]
-    deviceType = header['header'][0][0][1][0][0]
-    bodyLocation = header['header'][0][0][2][0]
-    firmwareVersion = header['header'][0][0][3][0]
-    startDate = header['header'][0][0][4]
-    baseFrequency = header['header'][0][0][5][0][0]
-    stopDate = header['header'][0][0][7]
-    measureID = header['header'][0][0][8][0][0]
-    
-    # Create dict
-    header_df = {"gyro_scale" : gyro_scale, "gyro_sensorID" : gyro_sensorID, "gyro_FS" : gyro_FS, "gyro_dataPayload" : gyro_dataPayload, "gyro_calib" : gyro_calib, "gyro_nbSamples" : gyro_nbSamples, "deviceID" : deviceID, "deviceType" : deviceType, "bodyLocation" : bodyLocation, "firmwareVersion" : firmwareVersion, "startDate" : startDate, "baseFrequency" : baseFrequency, "stopDate" : stopDate, "measureID" : measureID}
-    
-    return header_df
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if (max_points is None or len(y) <= max_points):
+        return x, y
+    edges = np.linspace(0, len(y), max(1, max_points // 2) + 1).astype(int)
+    buckets = np.searchsorted(edges, np.arange(len(y)), side = "right") - 1
+    # samples sorted by bucket and value: the first and the last sample of every bucket are its minimum and maximum
+    order = np.lexsort((y, buckets))
+    keep = np.unique(np.concatenate([order[edges[:-1]], order[edges[1:] - 1]]))
+    return x[keep], y[keep]
+
+def drawIntegrals(fig, plot):
+    """Draws the angular velocities and their integrals with the local extrema of both wrists of a subject (see Wear4PD.getIntegralPlot).
+
+        Parameters:
+            fig(Figure): empty figure
+            plot(dict): data of the plot
+    """
+    LW, RW = plot["LW"], plot["RW"]
+    max_points = plot.get("max_points")
+    axs = fig.subplots(2, 2)
+    fig.suptitle(plot["subject_id"] + ' Integrals', fontsize=18)
+    # left hand y-axis raw
+    axs[0, 0].plot(*decimateSignal(LW["timestamps"], LW["signal"], max_points))
+    axs[0, 0].set_ylabel('Angular Velocity [deg/s]', fontsize = 14)
+    axs[0, 0].set_title('Left Hand Y-Axis' + LW["label"] + ", Nr of Periods: " + str(LW["periods"]), fontsize=16)
+
+    # right hand y-axis raw
+    axs[0, 1].plot(*decimateSignal(RW["timestamps"], RW["signal"], max_points))
+    axs[0, 1].set_title('Right Hand Y-Axis' + RW["label"] + ", Nr of Periods: " + str(RW["periods"]), fontsize=16)
+
+    # left hand y-axis integral
+    axs[1, 0].plot(*decimateSignal(LW["timestamps"], LW["integral"], max_points))
+    axs[1, 0].plot(LW["timestamps"][LW["minima"]], LW["integral"][LW["minima"]], "or")
+    axs[1, 0].plot(LW["timestamps"][LW["maxima"]], LW["integral"][LW["maxima"]], "og")
+    axs[1, 0].set_ylabel('Angular Displacement [deg]', fontsize = 14)
+    axs[1, 0].set_xlabel('Time [s]', fontsize = 14)
+    axs[1, 0].set_title('Left Hand Y-Axis Integral' + LW["label"] + ", Nr of Periods: " + str(LW["periods"]), fontsize=16)
+
+    # right hand y-axis integral
+    axs[1, 1].plot(*decimateSignal(RW["timestamps"], RW["integral"], max_points))
+    axs[1, 1].plot(RW["timestamps"][RW["minima"]], RW["integral"][RW["minima"]], "or")
+    axs[1, 1].plot(RW["timestamps"][RW["maxima"]], RW["integral"][RW["maxima"]], "og")
+    axs[1, 1].set_xlabel('Time [s]', fontsize = 14)
+    axs[1, 1].set_title('Right Hand Y-Axis Integral' + RW["label"] + ", Nr of Periods: " + str(RW["periods"]), fontsize=16)
+
+    # Hide x labels and tick labels for top plots and y ticks for right plots.
+    for ax in axs.flat:
+        ax.label_outer()
+
+def renderIntegrals(plot):
+    """Draws the integrals of a subject (see drawIntegrals) on a figure of the non-interactive Agg backend and saves it; the figure is not registered with pyplot and is freed afterwards.
+
+        Parameters:
+            plot(dict): data of the plot, with the filename of the image
+
+        Returns:
+            string: filename of the image
+    """
+    fig = Figure(figsize = (20,10))
+    FigureCanvasAgg(fig)
+    drawIntegrals(fig, plot)
+    fig.savefig(plot["filename"])
+    return plot["filename"]
 
 def find_nearest(array, value):
     """Creates a dictionary with the header information
@@ -152,22 +380,34 @@ def find_nearest(array, value):
     else:
         return array[idx]
     
-def F(x, y):
+def F(x, y, rule = "rectangle", uniform = True):
     """Take the integral of the angular velocities
 
         Parameters:
             x(list): timestamps
             y(list): angular velocities
+            rule(string): integration rule, "rectangle" (every sample times the interval that ends at it, the integral starts at the first sample) or "trapezoid" (the integral starts at 0)
+            uniform(boolean): use the first sampling interval for all samples (True) or the real spacing of the timestamps (False)
 
         Returns:
             list: list of integral values
     """
-    integral = np.array([])
-    old = 0.0
-    for velocity in y:
-        integral = np.append(integral, old + np.diff(x)[0]*velocity)
-        old = old + np.diff(x)[0]*velocity
-    return integral
+    y = np.asarray(y)
+    if (len(y) == 0):
+        return np.array([])
+    if uniform:
+        dx = x[1] - x[0]
+    else:
+        # the first sample gets the interval that follows it
+        dx = np.diff(np.asarray(x, dtype = float))
+        dx = np.concatenate([dx[:1], dx])
+    
+    if (rule == "rectangle"):
+        return np.cumsum(dx*y)
+    elif (rule == "trapezoid"):
+        dx = dx if uniform else dx[1:]
+        return np.concatenate([[0.0], np.cumsum(dx*(y[1:] + y[:-1])/2.0)])
+    raise ValueError("Unknown integration rule: " + str(rule))
 
 def getSensorData(data, start, end):
     """Extract the sensor data from defined time interval.
@@ -182,202 +422,61 @@ def getSensorData(data, start, end):
             int: sampling frequency
             list: timestamps
     """
+    return getSensorWindows(data, [start], [end])[0]
+
+def getSensorWindows(data, starts, ends):
+    """Extract the sensor data from several time intervals, e.g. sliding windows (see sensorstore.slidingWindows). The intervals are found with binary search in the timestamp index, which is cached in the data.
+
+        Parameters:
+            data(list): data
+            starts(list): start times of the intervals
+            ends(list): end times of the intervals
+
+        Returns:
+            list: gyroscope data along the y-axis and z-axis, sampling frequency and timestamps of every interval
+    """
     gyro_data = data['sensorData'][0][1][3]
     gyro_FS = data['sensorData'][0][1][2][0][0]
-    gyro_timestamps = np.concatenate(data['sensorData'][0][1][4]).ravel()
-    
-    start_index = np.where(gyro_timestamps == find_nearest(gyro_timestamps, start))[0][0]
-    end_index = np.where(gyro_timestamps == find_nearest(gyro_timestamps, end))[0][0]
+    index = getTimestampIndex(data)
+    start_indices, end_indices = index.windows(starts, ends)
     
     # return gyro data along the y-axis and z-axis in the timeslot of the pronation supination movements
-    return gyro_data[start_index:end_index,1:3], gyro_FS, gyro_timestamps[start_index:end_index]
+    return [(gyro_data[a:b,1:3], gyro_FS, index.timestamps[a:b]) for a, b in zip(start_indices, end_indices)]
 
-def createSubjectFromData(filename, timeslot_choice):
+def createSubjectFromData(filename, timeslot_choice, diagnosis = None, paths = None):
     """Given a dictionary of the data, an object of the class Subject is initiated and returned.
     
     Parameters:
         filename(dict): filename of the JSON file
-        timeslot_choice(string): time slot mode (10 seconds vs all)
+        timeslot_choice(string): kind of time slot in timeslots.csv ("full" or "10_seconds"; other values: 10 seconds)
+        diagnosis(int): diagnosis code, e.g. from the cohort manifest (None: derived from the filename)
+        paths(dict): filenames of the JSON file, the sensor data and the headers of the session, e.g. from the cohort manifest (see cohort.getManifestPaths; None: in the directories Data and SensorData)
     
     Returns: 
         Subject object: initiated object of the Subject class containing the data
     """
+    if (paths is None):
+        paths = getSessionPaths(filename)
     
-    # Read wearable sensor data .mat files
-    data_LW = sio.loadmat('SensorData/' + filename + '_LW_sensorData.mat')
-    data_RW = sio.loadmat('SensorData/' + filename + '_RW_sensorData.mat')
-    header_LW = createHeaderDict(sio.loadmat('SensorData/' + filename + '_LW_header.mat'))
-    header_RW = createHeaderDict(sio.loadmat('SensorData/' + filename + '_RW_header.mat'))
-    
-    timeslots_10_seconds = {"CA01_LW_start" : 358.0, "CA01_LW_end" : 368.0, "CA01_RW_start" : 318.7, "CA01_RW_end" : 328.7, 
-                 "CA02_LW_start" : 235.6, "CA02_LW_end" : 245.6, "CA02_RW_start" : 206.5, "CA02_RW_end" : 216.5,
-                "CA03_LW_start" : 552.0, "CA03_LW_end" : 562.0, "CA03_RW_start" : 510.0, "CA03_RW_end" : 520.0,
-                "CA11_LW_start" : 244.3, "CA11_LW_end" : 254.3, "CA11_RW_start" : 216.7, "CA11_RW_end" : 226.7,
-                "CA13_LW_start" : 357.0, "CA13_LW_end" : 367.0, "CA13_RW_start" : 326.0, "CA13_RW_end" : 336.0,
-                "CA15_LW_start" : 356.4, "CA15_LW_end" : 366.4, "CA15_RW_start" : 330.6, "CA15_RW_end" : 340.6,
-                "CA16_LW_start" : 281.5, "CA16_LW_end" : 291.5, "CA16_RW_start" : 254.9, "CA16_RW_end" : 264.9,
-                "CA25_LW_start" : 324.6, "CA25_LW_end" : 334.6, "CA25_RW_start" : 301.7, "CA25_RW_end" : 311.7,
-                "CA29_LW_start" : 252.0, "CA29_LW_end" : 262.0, "CA29_RW_start" : 266.5, "CA29_RW_end" : 276.5,
-                "CA37_LW_start" : 505.4, "CA37_LW_end" : 515.4, "CA37_RW_start" : 459.0, "CA37_RW_end" : 469.0,
-                "CA39_LW_start" : 435.3, "CA39_LW_end" : 445.3, "CA39_RW_start" : 381.2, "CA39_RW_end" : 391.2,
-                "CA40_LW_start" : 363.0, "CA40_LW_end" : 373.0, "CA40_RW_start" : 327.1, "CA40_RW_end" : 337.1,
-                "CA41_LW_start" : 296.4, "CA41_LW_end" : 306.4, "CA41_RW_start" : 258.5, "CA41_RW_end" : 268.5,
-                "CA44_LW_start" : 247.5, "CA44_LW_end" : 257.5, "CA44_RW_start" : 216.0, "CA44_RW_end" : 226.0,
-                "CA46_LW_start" : 346.0, "CA46_LW_end" : 356.0, "CA46_RW_start" : 314.0, "CA46_RW_end" : 324.0,
-                "CA52_LW_start" : 413.6, "CA52_LW_end" : 423.6, "CA52_RW_start" : 419.0, "CA52_RW_end" : 429.0,
-                "CA55_LW_start" : 391.6, "CA55_LW_end" : 401.6, "CA55_RW_start" : 362.5, "CA55_RW_end" : 372.5,
-                "CA56_LW_start" : 293.4, "CA56_LW_end" : 303.4, "CA56_RW_start" : 290.0, "CA56_RW_end" : 300.0,
-                "CA59_LW_start" : 294.3, "CA59_LW_end" : 304.3, "CA59_RW_start" : 298.5, "CA59_RW_end" : 308.5,
-                "HC01_LW_start" : 650.5, "HC01_LW_end" : 660.5, "HC01_RW_start" : 621.0, "HC01_RW_end" : 631.0,
-                "HC08_LW_start" : 294.4, "HC08_LW_end" : 304.4, "HC08_RW_start" : 278.5, "HC08_RW_end" : 288.5,
-                "HC09_LW_start" : 214.7, "HC09_LW_end" : 224.7, "HC09_RW_start" : 194.2, "HC09_RW_end" : 204.2,
-                "HC11_LW_start" : 300.0, "HC11_LW_end" : 310.0, "HC11_RW_start" : 289.5, "HC11_RW_end" : 299.5,
-                "HC12_LW_start" : 358.0, "HC12_LW_end" : 368.0, "HC12_RW_start" : 332.0, "HC12_RW_end" : 342.0,
-                "HC13_LW_start" : 356.3, "HC13_LW_end" : 366.3, "HC13_RW_start" : 318.0, "HC13_RW_end" : 328.0,
-                "HC14_LW_start" : 293.0, "HC14_LW_end" : 303.0, "HC14_RW_start" : 269.9, "HC14_RW_end" : 279.9,
-                "HC17_LW_start" : 448.8, "HC17_LW_end" : 458.8, "HC17_RW_start" : 422.7, "HC17_RW_end" : 432.7,
-                "HC20_LW_start" : 439.0, "HC20_LW_end" : 449.0, "HC20_RW_start" : 383.8, "HC20_RW_end" : 393.8,
-                "HC22_LW_start" : 550.0, "HC22_LW_end" : 560.0, "HC22_RW_start" : 422.0, "HC22_RW_end" : 432.0,
-                "HC23_LW_start" : 325.7, "HC23_LW_end" : 335.7, "HC23_RW_start" : 303.0, "HC23_RW_end" : 313.0,
-                "HC25_LW_start" : 482.3, "HC25_LW_end" : 492.3, "HC25_RW_start" : 463.7, "HC25_RW_end" : 473.7,
-                "HC27_LW_start" : 379.7, "HC27_LW_end" : 389.7, "HC27_RW_start" : 366.0, "HC27_RW_end" : 376.0,
-#                 "HC28_LW_start" : 0.0, "HC28_LW_end" : 10.0, "HC28_RW_start" : 358.6, "HC28_RW_end" : 368.6,
-                "HC30_LW_start" : 347.5, "HC30_LW_end" : 357.5, "HC30_RW_start" : 295.0, "HC30_RW_end" : 305.0,
-                "HC33_LW_start" : 360.7, "HC33_LW_end" : 370.7, "HC33_RW_start" : 344.8, "HC33_RW_end" : 354.8,
-                "HC35_LW_start" : 398.3, "HC35_LW_end" : 408.3, "HC35_RW_start" : 392.9, "HC35_RW_end" : 402.9,
-                "HC36_LW_start" : 328.3, "HC36_LW_end" : 338.3, "HC36_RW_start" : 301.0, "HC36_RW_end" : 311.0,
-                "HC37_LW_start" : 321.4, "HC37_LW_end" : 331.4, "HC37_RW_start" : 303.8, "HC37_RW_end" : 313.8,
-                
-                "PD01_OFF_LW_start" : 241.0, "PD01_OFF_LW_end" : 251.0, "PD01_OFF_RW_start" : 207.8, "PD01_OFF_RW_end" : 217.8,
-                "PD03_OFF_LW_start" : 1155.3, "PD03_OFF_LW_end" : 1165.3, "PD03_OFF_RW_start" : 1117.0, "PD03_OFF_RW_end" : 1127.0,
-                "PD04_OFF_LW_start" : 368.7, "PD04_OFF_LW_end" : 378.7, "PD04_OFF_RW_start" : 324.3, "PD04_OFF_RW_end" : 334.3,
-                "PD05_OFF_LW_start" : 345.4, "PD05_OFF_LW_end" : 355.4, "PD05_OFF_RW_start" : 314.5, "PD05_OFF_RW_end" : 324.5,
-                "PD09_OFF_LW_start" : 428.5, "PD09_OFF_LW_end" : 438.5, "PD09_OFF_RW_start" : 383.3, "PD09_OFF_RW_end" : 393.3,
-                "PD13_OFF_LW_start" : 475.3, "PD13_OFF_LW_end" : 485.3, "PD13_OFF_RW_start" : 481.6, "PD13_OFF_RW_end" : 491.6,
-                "PD16_OFF_LW_start" : 355.44, "PD16_OFF_LW_end" : 365.44, "PD16_OFF_RW_start" : 330.7, "PD16_OFF_RW_end" : 340.7,
-                "PD17_OFF_LW_start" : 404.5, "PD17_OFF_LW_end" : 414.5, "PD17_OFF_RW_start" : 418.2, "PD17_OFF_RW_end" : 428.2,
-                "PD22_OFF_LW_start" : 342.6, "PD22_OFF_LW_end" : 352.6, "PD22_OFF_RW_start" : 311.0, "PD22_OFF_RW_end" : 321.0,
-                "PD25_OFF_LW_start" : 350.8, "PD25_OFF_LW_end" : 360.8, "PD25_OFF_RW_start" : 360.7, "PD25_OFF_RW_end" : 370.7,
-                "PD29_OFF_LW_start" : 365.4, "PD29_OFF_LW_end" : 375.4, "PD29_OFF_RW_start" : 307.1, "PD29_OFF_RW_end" : 317.1,
-                "PD31_OFF_LW_start" : 315.0, "PD31_OFF_LW_end" : 325.0, "PD31_OFF_RW_start" : 291.5, "PD31_OFF_RW_end" : 301.5,
-                "PD33_OFF_LW_start" : 399.6, "PD33_OFF_LW_end" : 409.6, "PD33_OFF_RW_start" : 357.5, "PD33_OFF_RW_end" : 367.5,
-                "PD34_OFF_LW_start" : 389.35, "PD34_OFF_LW_end" : 399.35, "PD34_OFF_RW_start" : 355.1, "PD34_OFF_RW_end" : 365.1,
-                "PD36_OFF_LW_start" : 326.3, "PD36_OFF_LW_end" : 336.3, "PD36_OFF_RW_start" : 297.55, "PD36_OFF_RW_end" : 307.55,
-                "PD37_OFF_LW_start" : 293.3, "PD37_OFF_LW_end" : 303.3, "PD37_OFF_RW_start" : 267.6, "PD37_OFF_RW_end" : 277.6,
-                "PD38_OFF_LW_start" : 322.26, "PD38_OFF_LW_end" : 332.26, "PD38_OFF_RW_start" : 287.6, "PD38_OFF_RW_end" : 297.6,
-                "PD39_OFF_LW_start" : 307.8, "PD39_OFF_LW_end" : 317.8, "PD39_OFF_RW_start" : 281.0, "PD39_OFF_RW_end" : 291.0,
-                
-                "PD01_ON_LW_start" : 414.0, "PD01_ON_LW_end" : 424.0, "PD01_ON_RW_start" : 374.2, "PD01_ON_RW_end" : 384.2,
-                "PD03_ON_LW_start" : 249.0, "PD03_ON_LW_end" : 259.0, "PD03_ON_RW_start" : 221.9, "PD03_ON_RW_end" : 231.9,
-                "PD04_ON_LW_start" : 367.0, "PD04_ON_LW_end" : 377.0, "PD04_ON_RW_start" : 337.8, "PD04_ON_RW_end" : 347.8,
-                "PD05_ON_LW_start" : 247.785, "PD05_ON_LW_end" : 257.785, "PD05_ON_RW_start" : 209.0, "PD05_ON_RW_end" : 219.0,
-                "PD08_ON_LW_start" : 351.96, "PD08_ON_LW_end" : 361.96, "PD08_ON_RW_start" : 331.484, "PD08_ON_RW_end" : 341.484,
-                "PD09_ON_LW_start" : 295.49, "PD09_ON_LW_end" : 305.49, "PD09_ON_RW_start" : 266.22, "PD09_ON_RW_end" : 276.22,
-                "PD13_ON_LW_start" : 232.9, "PD13_ON_LW_end" : 242.9, "PD13_ON_RW_start" : 246.65, "PD13_ON_RW_end" : 256.65,
-#                 "PD16_ON_LW_start" : 191.75, "PD16_ON_LW_end" : 201.75, "PD16_ON_RW_start" : 0.0, "PD16_ON_RW_end" : 10.0,
-                "PD17_ON_LW_start" : 241.4, "PD17_ON_LW_end" : 251.4, "PD17_ON_RW_start" : 213.7, "PD17_ON_RW_end" : 223.7,
-                "PD22_ON_LW_start" : 291.2, "PD22_ON_LW_end" : 301.2, "PD22_ON_RW_start" : 217.8, "PD22_ON_RW_end" : 227.8,
-                "PD25_ON_LW_start" : 229.95, "PD25_ON_LW_end" : 239.95, "PD25_ON_RW_start" : 197.1, "PD25_ON_RW_end" : 207.1,
-                "PD29_ON_LW_start" : 212.75, "PD29_ON_LW_end" : 222.75, "PD29_ON_RW_start" : 194.0, "PD29_ON_RW_end" : 204.0,
-                "PD31_ON_LW_start" : 394.4, "PD31_ON_LW_end" : 404.4, "PD31_ON_RW_start" : 376.15, "PD31_ON_RW_end" : 386.15,
-                "PD33_ON_LW_start" : 257.4, "PD33_ON_LW_end" : 267.4, "PD33_ON_RW_start" : 223.75, "PD33_ON_RW_end" : 233.75,
-                "PD34_ON_LW_start" : 454.0, "PD34_ON_LW_end" : 464.0, "PD34_ON_RW_start" : 432.0, "PD34_ON_RW_end" : 442.0,
-                "PD36_ON_LW_start" : 277.35, "PD36_ON_LW_end" : 287.35, "PD36_ON_RW_start" : 244.2, "PD36_ON_RW_end" : 254.2,
-               # "PD37_ON_LW_start" : 287.5, "PD37_ON_LW_end" : 297.5, "PD37_ON_RW_start" : 0.0, "PD37_ON_RW_end" : 10.0,
-                "PD38_ON_LW_start" : 229.84, "PD38_ON_LW_end" : 239.84, "PD38_ON_RW_start" : 207.84, "PD38_ON_RW_end" : 217.84,
-                "PD39_ON_LW_start" : 222.4, "PD39_ON_LW_end" : 232.4, "PD39_ON_RW_start" : 196.58, "PD39_ON_RW_end" : 206.58}
-    
-    timeslots_full_duration = {"CA01_LW_start" : 358.0, "CA01_LW_end" : 367.0, "CA01_RW_start" : 318.7, "CA01_RW_end" : 327.3, 
-                 "CA02_LW_start" : 235.6, "CA02_LW_end" : 243.0, "CA02_RW_start" : 206.5, "CA02_RW_end" : 216.0,
-                "CA03_LW_start" : 552.0, "CA03_LW_end" : 565.6, "CA03_RW_start" : 503.9, "CA03_RW_end" : 520.3,
-                "CA11_LW_start" : 244.3, "CA11_LW_end" : 256.1, "CA11_RW_start" : 216.7, "CA11_RW_end" : 227.1,
-                "CA13_LW_start" : 355.5, "CA13_LW_end" : 368.0, "CA13_RW_start" : 326.3, "CA13_RW_end" : 334.6,
-                "CA15_LW_start" : 356.4, "CA15_LW_end" : 368.9, "CA15_RW_start" : 330.6, "CA15_RW_end" : 345.9,
-                "CA16_LW_start" : 281.5, "CA16_LW_end" : 293.8, "CA16_RW_start" : 254.9, "CA16_RW_end" : 267.3,
-                "CA25_LW_start" : 324.6, "CA25_LW_end" : 338.0, "CA25_RW_start" : 301.7, "CA25_RW_end" : 315.1,
-                "CA29_LW_start" : 251.5, "CA29_LW_end" : 262.6, "CA29_RW_start" : 266.5, "CA29_RW_end" : 274.4,
-                "CA37_LW_start" : 505.4, "CA37_LW_end" : 516.5, "CA37_RW_start" : 459.0, "CA37_RW_end" : 471.0,
-                "CA39_LW_start" : 435.3, "CA39_LW_end" : 444.2, "CA39_RW_start" : 381.2, "CA39_RW_end" : 389.0,
-                "CA40_LW_start" : 363.0, "CA40_LW_end" : 375.0, "CA40_RW_start" : 327.1, "CA40_RW_end" : 336.95,
-                "CA41_LW_start" : 296.4, "CA41_LW_end" : 306.7, "CA41_RW_start" : 258.5, "CA41_RW_end" : 268.66,
-                "CA44_LW_start" : 247.5, "CA44_LW_end" : 255.6, "CA44_RW_start" : 217.7, "CA44_RW_end" : 225.6,
-                "CA46_LW_start" : 346.7, "CA46_LW_end" : 355.9, "CA46_RW_start" : 313.6, "CA46_RW_end" : 327.0,
-                "CA52_LW_start" : 413.6, "CA52_LW_end" : 424.0, "CA52_RW_start" : 418.3, "CA52_RW_end" : 430.2,
-                "CA55_LW_start" : 391.6, "CA55_LW_end" : 407.4, "CA55_RW_start" : 362.5, "CA55_RW_end" : 373.8,
-                "CA56_LW_start" : 293.4, "CA56_LW_end" : 309.9, "CA56_RW_start" : 289.9, "CA56_RW_end" : 302.5,
-                "CA59_LW_start" : 294.3, "CA59_LW_end" : 304.2, "CA59_RW_start" : 298.5, "CA59_RW_end" : 308.65,
-                "HC01_LW_start" : 650.5, "HC01_LW_end" : 662.8, "HC01_RW_start" : 621.0, "HC01_RW_end" : 634.3,
-                "HC08_LW_start" : 294.4, "HC08_LW_end" : 302.1, "HC08_RW_start" : 278.6, "HC08_RW_end" : 287.7,
-                "HC09_LW_start" : 214.7, "HC09_LW_end" : 222.5, "HC09_RW_start" : 194.2, "HC09_RW_end" : 204.5,
-                "HC11_LW_start" : 300.3, "HC11_LW_end" : 308.5, "HC11_RW_start" : 289.5, "HC11_RW_end" : 298.8,
-                "HC12_LW_start" : 358.0, "HC12_LW_end" : 368.0, "HC12_RW_start" : 332.0, "HC12_RW_end" : 341.4,
-                "HC13_LW_start" : 356.3, "HC13_LW_end" : 367.3, "HC13_RW_start" : 318.0, "HC13_RW_end" : 330.8,
-                "HC14_LW_start" : 293.3, "HC14_LW_end" : 302.8, "HC14_RW_start" : 269.9, "HC14_RW_end" : 281.6,
-                "HC17_LW_start" : 448.8, "HC17_LW_end" : 457.6, "HC17_RW_start" : 422.7, "HC17_RW_end" : 432.9,
-                "HC20_LW_start" : 439.0, "HC20_LW_end" : 446.0, "HC20_RW_start" : 384.0, "HC20_RW_end" : 390.0,
-                "HC22_LW_start" : 550.5, "HC22_LW_end" : 563.0, "HC22_RW_start" : 422.0, "HC22_RW_end" : 431.2,
-                "HC23_LW_start" : 325.8, "HC23_LW_end" : 333.9, "HC23_RW_start" : 303.1, "HC23_RW_end" : 310.6,
-                "HC25_LW_start" : 482.3, "HC25_LW_end" : 490.4, "HC25_RW_start" : 463.8, "HC25_RW_end" : 470.24,
-                "HC27_LW_start" : 379.95, "HC27_LW_end" : 389.7, "HC27_RW_start" : 365.9, "HC27_RW_end" : 376.37,
-#                 "HC28_LW_start" : 0.0, "HC28_LW_end" : 10.0, "HC28_RW_start" : 358.6, "HC28_RW_end" : 368.6,
-                "HC30_LW_start" : 347.6, "HC30_LW_end" : 360.8, "HC30_RW_start" : 295.0, "HC30_RW_end" : 306.6,
-                "HC33_LW_start" : 360.8, "HC33_LW_end" : 370.3, "HC33_RW_start" : 344.9, "HC33_RW_end" : 353.6,
-                "HC35_LW_start" : 398.3, "HC35_LW_end" : 407.9, "HC35_RW_start" : 393.0, "HC35_RW_end" : 402.2,
-                "HC36_LW_start" : 328.4, "HC36_LW_end" : 337.7, "HC36_RW_start" : 301.0, "HC36_RW_end" : 311.0,
-                "HC37_LW_start" : 321.5, "HC37_LW_end" : 331.1, "HC37_RW_start" : 303.8, "HC37_RW_end" : 311.6,
-                
-                "PD01_OFF_LW_start" : 241.0, "PD01_OFF_LW_end" : 251.5, "PD01_OFF_RW_start" : 207.8, "PD01_OFF_RW_end" : 222.3,
-                "PD03_OFF_LW_start" : 1155.3, "PD03_OFF_LW_end" : 1173.1, "PD03_OFF_RW_start" : 1116.9, "PD03_OFF_RW_end" : 1135.9,
-                "PD04_OFF_LW_start" : 368.8, "PD04_OFF_LW_end" : 381.8, "PD04_OFF_RW_start" : 324.3, "PD04_OFF_RW_end" : 334.9,
-                "PD05_OFF_LW_start" : 345.3, "PD05_OFF_LW_end" : 361.3, "PD05_OFF_RW_start" : 314.5, "PD05_OFF_RW_end" : 330.0,
-                "PD09_OFF_LW_start" : 428.5, "PD09_OFF_LW_end" : 443.6, "PD09_OFF_RW_start" : 383.3, "PD09_OFF_RW_end" : 401.4,
-                "PD13_OFF_LW_start" : 475.3, "PD13_OFF_LW_end" : 493.3, "PD13_OFF_RW_start" : 481.6, "PD13_OFF_RW_end" : 493.4,
-                "PD16_OFF_LW_start" : 355.44, "PD16_OFF_LW_end" : 372.9, "PD16_OFF_RW_start" : 330.7, "PD16_OFF_RW_end" : 341.6,
-                "PD17_OFF_LW_start" : 404.5, "PD17_OFF_LW_end" : 417.1, "PD17_OFF_RW_start" : 418.2, "PD17_OFF_RW_end" : 429.7,
-                "PD22_OFF_LW_start" : 342.6, "PD22_OFF_LW_end" : 354.2, "PD22_OFF_RW_start" : 311.0, "PD22_OFF_RW_end" : 329.7,
-                "PD25_OFF_LW_start" : 350.8, "PD25_OFF_LW_end" : 364.8, "PD25_OFF_RW_start" : 360.7, "PD25_OFF_RW_end" : 373.5,
-                "PD29_OFF_LW_start" : 365.4, "PD29_OFF_LW_end" : 380.4, "PD29_OFF_RW_start" : 307.1, "PD29_OFF_RW_end" : 318.1,
-                "PD31_OFF_LW_start" : 315.0, "PD31_OFF_LW_end" : 326.4, "PD31_OFF_RW_start" : 291.5, "PD31_OFF_RW_end" : 301.5,
-                "PD33_OFF_LW_start" : 399.6, "PD33_OFF_LW_end" : 410.6, "PD33_OFF_RW_start" : 357.5, "PD33_OFF_RW_end" : 366.3,
-                "PD34_OFF_LW_start" : 389.35, "PD34_OFF_LW_end" : 401.8, "PD34_OFF_RW_start" : 355.1, "PD34_OFF_RW_end" : 368.9,
-                "PD36_OFF_LW_start" : 326.3, "PD36_OFF_LW_end" : 337.55, "PD36_OFF_RW_start" : 297.55, "PD36_OFF_RW_end" : 309.6,
-                "PD37_OFF_LW_start" : 293.3, "PD37_OFF_LW_end" : 304.1, "PD37_OFF_RW_start" : 267.6, "PD37_OFF_RW_end" : 277.6,
-                "PD38_OFF_LW_start" : 322.26, "PD38_OFF_LW_end" : 333.5, "PD38_OFF_RW_start" : 287.6, "PD38_OFF_RW_end" : 296.7,
-                "PD39_OFF_LW_start" : 307.8, "PD39_OFF_LW_end" : 321.25, "PD39_OFF_RW_start" : 281.0, "PD39_OFF_RW_end" : 297.3,
-                
-                "PD01_ON_LW_start" : 414.0, "PD01_ON_LW_end" : 432.2, "PD01_ON_RW_start" : 374.2, "PD01_ON_RW_end" : 394.2,
-                "PD03_ON_LW_start" : 249.0, "PD03_ON_LW_end" : 260.9, "PD03_ON_RW_start" : 221.9, "PD03_ON_RW_end" : 235.3,
-                "PD04_ON_LW_start" : 367.0, "PD04_ON_LW_end" : 379.7, "PD04_ON_RW_start" : 337.8, "PD04_ON_RW_end" : 348.9,
-                "PD05_ON_LW_start" : 244.2, "PD05_ON_LW_end" : 263.4, "PD05_ON_RW_start" : 209.0, "PD05_ON_RW_end" : 229.6,
-                "PD08_ON_LW_start" : 351.96, "PD08_ON_LW_end" : 366.45, "PD08_ON_RW_start" : 331.484, "PD08_ON_RW_end" : 343.25,
-                "PD09_ON_LW_start" : 295.49, "PD09_ON_LW_end" : 309.6, "PD09_ON_RW_start" : 266.22, "PD09_ON_RW_end" : 277.6,
-                "PD13_ON_LW_start" : 232.9, "PD13_ON_LW_end" : 246.4, "PD13_ON_RW_start" : 246.65, "PD13_ON_RW_end" : 255.8,
-#                 "PD16_ON_LW_start" : 191.75, "PD16_ON_LW_end" : 199.66, "PD16_ON_RW_start" : 0.0, "PD16_ON_RW_end" : 10.0,
-                "PD17_ON_LW_start" : 241.4, "PD17_ON_LW_end" : 252.0, "PD17_ON_RW_start" : 213.7, "PD17_ON_RW_end" : 224.2,
-                "PD22_ON_LW_start" : 291.2, "PD22_ON_LW_end" : 301.55, "PD22_ON_RW_start" : 217.8, "PD22_ON_RW_end" : 229.1,
-                "PD25_ON_LW_start" : 229.95, "PD25_ON_LW_end" : 241.2, "PD25_ON_RW_start" : 197.1, "PD25_ON_RW_end" : 209.3,
-                "PD29_ON_LW_start" : 212.75, "PD29_ON_LW_end" : 224.2, "PD29_ON_RW_start" : 194.0, "PD29_ON_RW_end" : 207.2,
-                "PD31_ON_LW_start" : 394.4, "PD31_ON_LW_end" : 408.4, "PD31_ON_RW_start" : 376.15, "PD31_ON_RW_end" : 387.4,
-                "PD33_ON_LW_start" : 257.4, "PD33_ON_LW_end" : 266.9, "PD33_ON_RW_start" : 223.75, "PD33_ON_RW_end" : 232.66,
-                "PD34_ON_LW_start" : 454.0, "PD34_ON_LW_end" : 463.2, "PD34_ON_RW_start" : 432.0, "PD34_ON_RW_end" : 441.9,
-                "PD36_ON_LW_start" : 277.35, "PD36_ON_LW_end" : 289.5, "PD36_ON_RW_start" : 244.2, "PD36_ON_RW_end" : 257.3,
-               # "PD37_ON_LW_start" : 287.5, "PD37_ON_LW_end" : 297.5, "PD37_ON_RW_start" : 0.0, "PD37_ON_RW_end" : 10.0,
-                "PD38_ON_LW_start" : 229.84, "PD38_ON_LW_end" : 239.2, "PD38_ON_RW_start" : 207.84, "PD38_ON_RW_end" : 219.84,
-                "PD39_ON_LW_start" : 222.4, "PD39_ON_LW_end" : 235.2, "PD39_ON_RW_start" : 196.58, "PD39_ON_RW_end" : 210.5}
-    
-    # Extract gyro data
-    if (timeslot_choice == "full"):
-        gyro_data_LW, gyro_FS_LW, gyro_timestamps_LW = getSensorData(data_LW, timeslots_full_duration[filename + "_LW_start"], timeslots_full_duration[filename + "_LW_end"]) 
-        gyro_data_RW, gyro_FS_RW, gyro_timestamps_RW = getSensorData(data_RW, timeslots_full_duration[filename + "_RW_start"], timeslots_full_duration[filename + "_RW_end"]) 
-    else:
-        gyro_data_LW, gyro_FS_LW, gyro_timestamps_LW = getSensorData(data_LW, timeslots_10_seconds[filename + "_LW_start"], timeslots_10_seconds[filename + "_LW_end"]) 
-        gyro_data_RW, gyro_FS_RW, gyro_timestamps_RW = getSensorData(data_RW, timeslots_10_seconds[filename + "_RW_start"], timeslots_10_seconds[filename + "_RW_end"]) 
+    # Read wearable sensor headers from the header index if it is up to date, see headerindex.scanHeaders (the sensor data is read per time slot below)
+    header_LW = readHeader(paths["header_LW"])
+    header_RW = readHeader(paths["header_RW"])
+    
+    # Extract gyro data (only the time slot is read if the recordings were converted, see sensorstore.convertSensorDirectory)
+    kind = timeslot_choice if timeslot_choice in getTimeslotKinds() else "10_seconds"
+    starts, ends = lookupTimeslots([filename, filename], ["LW", "RW"], kind)
+    if np.isnan(starts).any() or np.isnan(ends).any():
+        raise KeyError("No " + kind + " time slots for " + filename + " in " + TIMESLOTS_FILE)
+    gyro_data_LW, gyro_FS_LW, gyro_timestamps_LW = readSensorWindow(paths["sensor_LW"], starts[0], ends[0])
+    gyro_data_RW, gyro_FS_RW, gyro_timestamps_RW = readSensorWindow(paths["sensor_RW"], starts[1], ends[1])
     
     # Read clinical data from JSON files
-    clinical_data = readJSONFile("Data/" + filename + ".txt")  
+    clinical_data = readJSONFile(paths["data"])  
     
     # Identify diagnosis
-    if (filename.count("PD") == 1 and filename.count("OFF") == 1):
+    if (diagnosis is not None):
+        pass
+    elif (filename.count("PD") == 1 and filename.count("OFF") == 1):
         diagnosis = 0
     elif  (filename.count("PD") == 1 and filename.count("ON") == 1):
         diagnosis = 1
@@ -424,8 +523,14 @@ class Subject:
             self.UPDRS_dom = UPDRS3_6b 
             self.UPDRS_ndom = UPDRS3_6a 
         
+    def toRow(self):
+        """
+            Returns all attributes as a list in the order of the dataframe columns
+        """
+        return [self.subject_id, self.diagnosis, self.typist, self.side, self.years, self.UPDRS_dom, self.UPDRS_ndom, self.serial, self.handedness, self.side, self.years, self.header_LW, self.header_RW, self.gyro_data_LW, self.gyro_FS_LW, self.gyro_timestamps_LW, self.gyro_data_RW, self.gyro_FS_RW, self.gyro_timestamps_RW]
+        
     def toDataframe(self):
-        data = [self.subject_id, self.diagnosis, self.typist, self.side, self.years, self.UPDRS_dom, self.UPDRS_ndom, self.serial, self.handedness, self.side, self.years, self.header_LW, self.header_RW, self.gyro_data_LW, self.gyro_FS_LW, self.gyro_timestamps_LW, self.gyro_data_RW, self.gyro_FS_RW, self.gyro_timestamps_RW]
+        data = self.toRow()
         features = ["subject_id", "diagnosis", "typist", "side", "years", "UPDRS_dom", "UPDRS_ndom", "serial", "handedness", "side", "years", "header_LW", "header_RW", "gyro_data_LW", "gyro_FS_LW", "gyro_timestamps_LW", "gyro_data_RW", "gyro_FS_RW", "gyro_timestamps_RW"] 
         data_t = pd.DataFrame(data).transpose()
         data_t.columns = features
@@ -435,21 +540,78 @@ class Subjects:
     """
         Loads all subjects.
     """
-    def __init__(self, timeslot_choice):
+    def __init__(self, timeslot_choice, manifest = None, io_workers = None, prefetch = 4, load = True, keep_subjects = True):
+        """
+            Initialise class
+
+            Parameters:
+                timeslot_choice(string): time slot mode (10 seconds vs all)
+                manifest(dataframe/string): cohort manifest (or its filename) of the sessions to load, their files are read from the paths of the manifest, see cohort.scanCohort and cohort.filterManifest (None: the subjects listed below)
+                io_workers(int): number of threads reading the sensor files of the next subjects ahead (None: serial)
+                prefetch(int): maximum number of subjects read ahead
+                load(boolean): load all subjects now (False: the subjects are loaded by iterating iterSubjects)
+                keep_subjects(boolean): keep the loaded subjects with their sensor data in self.subjects (False: the subjects are only yielded by iterSubjects, so that they can be freed once they are processed)
+        """
         self.PD_OFF_ids = ["PD01_OFF", "PD03_OFF", "PD04_OFF", "PD05_OFF", "PD09_OFF", "PD13_OFF", "PD16_OFF", "PD17_OFF", "PD22_OFF", "PD25_OFF", "PD29_OFF", "PD31_OFF", "PD33_OFF", "PD34_OFF", "PD36_OFF", "PD37_OFF", "PD38_OFF", "PD39_OFF"] # "PD21_OFF", "PD08_OFF"
         self.PD_ON_ids = ["PD01_ON", "PD03_ON", "PD04_ON", "PD05_ON", "PD08_ON", "PD09_ON", "PD13_ON", "PD17_ON", "PD22_ON", "PD25_ON", "PD29_ON", "PD31_ON", "PD33_ON", "PD34_ON", "PD36_ON", "PD38_ON", "PD39_ON"] # "PD21_ON" "PD37_ON" "PD16_ON"
         self.HC_ids = ["HC01", "HC08", "HC09", "HC11", "HC12", "HC13", "HC14", "HC17", "HC20", "HC22", "HC23", "HC25", "HC27", "HC30", "HC33", "HC35", "HC36", "HC37"] # "HC19" "HC28"
         self.CA_ids = ["CA01", "CA02", "CA03", "CA11", "CA13", "CA15", "CA16", "CA25", "CA29", "CA37", "CA39", "CA40", "CA41", "CA44", "CA46", "CA52", "CA55", "CA56", "CA59"]
         self.subject_groups = [self.PD_OFF_ids, self.PD_ON_ids, self.HC_ids, self.CA_ids]
         self.features =  ["subject_id", "diagnosis", "typist", "side", "years", "UPDRS_dom", "UPDRS_ndom", "serial", "handedness", "side", "years", "header_LW", "header_RW", "gyro_data_LW", "gyro_FS_LW", "gyro_timestamps_LW", "gyro_data_RW", "gyro_FS_RW", "gyro_timestamps_RW"] 
-        self.df = pd.DataFrame(columns = self.features)
+        self.diagnoses = {}
+        self.paths = {}
+        if (manifest is not None):
+            if isinstance(manifest, str):
+                manifest = loadManifest(manifest)
+            manifest = sortManifest(filterManifest(manifest, keyboard = True, sensors = True))
+            self.PD_OFF_ids, self.PD_ON_ids, self.HC_ids, self.CA_ids = [manifest.loc[manifest["group"] == group, "subject_id"].tolist() for group in ["PD_OFF", "PD_ON", "HC", "CA"]]
+            self.subject_groups = [self.PD_OFF_ids, self.PD_ON_ids, self.HC_ids, self.CA_ids]
+            self.diagnoses = dict(zip(manifest["subject_id"], manifest["diagnosis"]))
+            self.paths = getManifestPaths(manifest)
+        self.timeslot_choice = timeslot_choice
+        self.io_workers = io_workers
+        self.prefetch = prefetch
+        self.keep_subjects = keep_subjects
         self.subjects = []
         
-        for group in self.subject_groups:
-            for id in group:
-                s = createSubjectFromData(id, timeslot_choice)
-                self.df = self.df.append(s.toDataframe())
-                self.subjects.append(s)
+        if load:
+            for s in self.iterSubjects():
+                pass
+    
+    def iterSubjects(self):
+        """Loads the subjects and yields them in the order of the groups; every subject is also added to self.subjects if keep_subjects is set. With io_workers, the sensor files of the next subjects (at most prefetch) are read while the caller processes the current subject.
+
+        Returns:
+            Subject: subjects
+        """
+        ids = iter([id for group in self.subject_groups for id in group])
+        if not self.io_workers:
+            for id in ids:
+                s = createSubjectFromData(id, self.timeslot_choice, self.diagnoses.get(id), self.paths.get(id))
+                if self.keep_subjects:
+                    self.subjects.append(s)
+                yield s
+            return
+        
+        with ThreadPoolExecutor(max_workers = self.io_workers) as pool:
+            pending = deque(pool.submit(createSubjectFromData, id, self.timeslot_choice, self.diagnoses.get(id), self.paths.get(id)) for id in islice(ids, max(1, self.prefetch)))
+            while pending:
+                s = pending.popleft().result()
+                for id in islice(ids, 1):
+                    pending.append(pool.submit(createSubjectFromData, id, self.timeslot_choice, self.diagnoses.get(id), self.paths.get(id)))
+                if self.keep_subjects:
+                    self.subjects.append(s)
+                yield s
+    
+    @cached_property
+    def df(self):
+        """
+            Dataframe with all attributes of all loaded subjects, built on first access
+        """
+        table = TableBuilder(self.features)
+        for s in self.subjects:
+            table.append(s.toRow())
+        return table.toDataFrame()
                 
     def getPD_OFF(self):
         return self.df[self.df['subject_id'].str.contains('PD') & self.df['subject_id'].str.contains('OFF')]
@@ -467,12 +629,28 @@ class Wear4PD():
     """
         Loads all features from all subjects and saves them in a dataframe.
     """
-    def __init__(self, savepath="./models/", timeslot_choice = "full"):
+    def __init__(self, savepath="./models/", timeslot_choice = "full", manifest = None, integration_rule = "rectangle", uniform_spacing = True, cwt_precision = "double", wrist_workers = 2, io_workers = None, n_jobs = None, prefetch = 4, keep_subjects = True):
         # load subjects on initialization; subjects with flight and dwell times (top 5% outliers + first and last 10 taps removed)
-        self.subjects = Subjects(timeslot_choice).subjects
+        # the subjects are loaded while the features of the loaded subjects are computed (see loadUPDRS)
+        # prefetch bounds the subjects waiting to be processed; the loaded subjects and their integrals are kept for the plots unless keep_subjects is False, then they are freed once their rows are added and loaded again by plotIntegrals
+        self.manifest = manifest
+        self.io_workers = io_workers
+        self.keep_subjects = keep_subjects
+        subjects = Subjects(timeslot_choice, manifest, io_workers, prefetch, load = False, keep_subjects = keep_subjects)
+        self.subjects = subjects.subjects
         self.savepath = savepath
         self.timeslot_choice = timeslot_choice
-        self.loadUPDRS()
+        # integration of the angular velocities (see F)
+        self.integration_rule = integration_rule
+        self.uniform_spacing = uniform_spacing
+        # precision of the wavelet transform ("double" or "single", see MorletCWT)
+        self.cwt_precision = cwt_precision
+        # number of threads computing the features of the wrists (see computeWristFeatures)
+        self.wrist_workers = wrist_workers
+        # number of worker processes computing the features (None: threads, see wrist_workers) and maximum number of subjects waiting for their features
+        self.n_jobs = n_jobs
+        self.prefetch = prefetch
+        self.loadUPDRS(subjects.iterSubjects())
         self.params = {}
     
     def preprocess(self, df):
@@ -492,457 +670,174 @@ class Wear4PD():
        
         return df
     
-    def loadUPDRS(self):
-        df = pd.DataFrame(columns=['subject_id', 'handedness', 'diagnosis', 'UPDRS', 'typist', 'years', 'dominant', 'affected', 'mean_amplitude', 'var_amplitude', 'decrement_amplitude', 'main_freq', 'var_periods', 'decrement_periods', 'movements', 'hesitations', 'freezes', 'f1']) # add features: hesitations, halts, wavelets
-            
-        for s in self.subjects:
-            print(s.subject_id)
-
-            if (s.handedness == "left"):
-                # left hand y-axis
-                integral_LW, amplitudes_LW, durations_LW = getAmplitudes(s.gyro_timestamps_LW, s.gyro_data_LW[:,0])
-                
-                ## Amplitude Features:
-                #'mean_amplitude_supination'
-                mean_amplitude_supination_dom = np.mean(amplitudes_LW[amplitudes_LW > 0])
-                #'mean_amplitude_pronation' 
-                mean_amplitude_pronation_dom = np.mean(amplitudes_LW[amplitudes_LW < 0])
-                #'mean_amplitude'
-                mean_amplitude_dom = np.mean(np.abs(amplitudes_LW))
-                #'var_amplitude_supination'
-                var_amplitude_supination_dom = np.var(amplitudes_LW[amplitudes_LW > 0])
-                #'var_amplitude_pronation' 
-                var_amplitude_pronation_dom = np.var(amplitudes_LW[amplitudes_LW < 0])
-                #'var_amplitude'
-                var_amplitude_dom = np.var(np.abs(amplitudes_LW))
-                #'decrement_amplitude_supination'
-                polyfit = np.polyfit(range(len(amplitudes_LW[amplitudes_LW > 0])), amplitudes_LW[amplitudes_LW > 0], 1)
-                decrement_amplitude_supination_dom = polyfit[0]
-                #'decrement_amplitude_pronation' 
-                polyfit = np.polyfit(range(len(amplitudes_LW[amplitudes_LW < 0])), amplitudes_LW[amplitudes_LW < 0], 1)
-                decrement_amplitude_pronation_dom = polyfit[0]
-                #'decrement_amplitude'
-                polyfit = np.polyfit(range(len(amplitudes_LW)), np.abs(amplitudes_LW), 1)
-                decrement_amplitude_dom = polyfit[0]
-                
-                ## Frequency/Speed Features:
-                #'main_freq'
-                z = fftpack.fft(s.gyro_data_LW[:, 0])
-                freqs = fftpack.fftfreq(len(s.gyro_data_LW)) * s.gyro_FS_LW
-                main_freq_dom = freqs[np.argmax(np.abs(z))]
-                #'var_periods'
-                var_periods_dom = np.var(durations_LW)
-                #'decrement_periods'
-                polyfit = np.polyfit(range(len(durations_LW)), durations_LW, 1)
-                decrement_periods_dom = polyfit[0]
-                #'movements'
-                movements_dom = len(durations_LW)
-                
-                ## Hesitations and Halts
-                dat = s.gyro_data_LW[:,0]
-                t0 = s.gyro_timestamps_LW[0]
-                dt = s.gyro_timestamps_LW[1] - s.gyro_timestamps_LW[0]
-                t = s.gyro_timestamps_LW
-
-                # Normalize signal
-                p = np.polyfit(s.gyro_timestamps_LW - s.gyro_timestamps_LW[0], s.gyro_data_LW[:,0], 1)
-                dat_notrend = s.gyro_data_LW[:,0] - np.polyval(p, s.gyro_timestamps_LW - s.gyro_timestamps_LW[0])
-                std = dat_notrend.std()  # Standard deviation
-                var = std ** 2  # Variance
-                dat_norm = dat_notrend / std  # Normalized dataset
-
-                w = 1. # central frequency
-                freq = np.linspace(1, s.gyro_FS_LW/2, 100)
-                widths = w*s.gyro_FS_LW / (2*freq*np.pi)
-                cwtm = signal.cwt(dat_norm, signal.morlet2, widths, w=w) # continuous wavelet transform
-                
-                (x, y) = np.where(np.abs(cwtm) == np.amax(np.abs(cwtm))) # get index of frequency characteristic
-                f1_dom = freq[x]
-                
-                # Compute cross-sectional area by summing the CWT coefficients perpendicular to the time axis
-                # Normalize with respect to its maximum value and is expressed as a percentage
-                CSA_T = np.sum(np.abs(cwtm), 0)/np.max(np.sum(np.abs(cwtm), 0)) * 100
-
-                # Compute thresholds
-                hesitation_threshold = 0.5*np.mean(CSA_T)
-                freeze_threshold = 0.25*np.mean(CSA_T)
-
-                hesitations_dom = findHesitationsFreezing(CSA_T, hesitation_threshold, freq[x], dt)
-                freezes_dom =  findHesitationsFreezing(CSA_T, freeze_threshold, freq[x], dt)
-
-                del integral_LW, amplitudes_LW, durations_LW 
-                
-                # right hand y-axis
-                integral_RW, amplitudes_RW, durations_RW = getAmplitudes(s.gyro_timestamps_RW, s.gyro_data_RW[:,0])
-                
-                ## Amplitude Features:
-                #'mean_amplitude_supination'
-                mean_amplitude_supination_ndom = np.mean(amplitudes_RW[amplitudes_RW > 0])
-                #'mean_amplitude_pronation' 
-                mean_amplitude_pronation_ndom = np.mean(amplitudes_RW[amplitudes_RW < 0])
-                #'mean_amplitude'
-                mean_amplitude_ndom = np.mean(np.abs(amplitudes_RW))
-                #'var_amplitude_supination'
-                var_amplitude_supination_ndom = np.var(amplitudes_RW[amplitudes_RW > 0])
-                #'var_amplitude_pronation' 
-                var_amplitude_pronation_ndom = np.var(amplitudes_RW[amplitudes_RW < 0])
-                #'var_amplitude'
-                var_amplitude_ndom = np.var(np.abs(amplitudes_RW))
-                #'decrement_amplitude_supination'
-                polyfit = np.polyfit(range(len(amplitudes_RW[amplitudes_RW > 0])), amplitudes_RW[amplitudes_RW > 0], 1)
-                decrement_amplitude_supination_ndom = polyfit[0]
-                #'decrement_amplitude_pronation' 
-                polyfit = np.polyfit(range(len(amplitudes_RW[amplitudes_RW < 0])), amplitudes_RW[amplitudes_RW < 0], 1)
-                decrement_amplitude_pronation_ndom = polyfit[0]
-                #'decrement_amplitude'
-                polyfit = np.polyfit(range(len(amplitudes_RW)), np.abs(amplitudes_RW), 1)
-                decrement_amplitude_ndom = polyfit[0]
-                
-                ## Frequency/Speed Features:
-                #'main_freq'
-                z = fftpack.fft(s.gyro_data_RW[:, 0])
-                freqs = fftpack.fftfreq(len(s.gyro_data_RW)) * s.gyro_FS_RW
-                main_freq_ndom = freqs[np.argmax(np.abs(z))]
-                #'var_periods'
-                var_periods_ndom = np.var(durations_RW)
-                #'decrement_periods'
-                polyfit = np.polyfit(range(len(durations_RW)), durations_RW, 1)
-                decrement_periods_ndom = polyfit[0]
-                #'movements'
-                movements_ndom = len(durations_RW)
-                
-                ## Hesitations and Halts
-                dat = s.gyro_data_RW[:,0]
-                t0 = s.gyro_timestamps_RW[0]
-                dt = s.gyro_timestamps_RW[1] - s.gyro_timestamps_RW[0]
-                t = s.gyro_timestamps_RW
-
-                # Normalize signal
-                p = np.polyfit(s.gyro_timestamps_RW - s.gyro_timestamps_RW[0], s.gyro_data_RW[:,0], 1)
-                dat_notrend = s.gyro_data_RW[:,0] - np.polyval(p, s.gyro_timestamps_RW - s.gyro_timestamps_RW[0])
-                std = dat_notrend.std()  # Standard deviation
-                var = std ** 2  # Variance
-                dat_norm = dat_notrend / std  # Normalized dataset
-
-                w = 1. # central frequency
-                freq = np.linspace(1, s.gyro_FS_RW/2, 100)
-                widths = w*s.gyro_FS_RW / (2*freq*np.pi)
-                cwtm = signal.cwt(dat_norm, signal.morlet2, widths, w=w) # continuous wavelet transform
-                
-                (x, y) = np.where(np.abs(cwtm) == np.amax(np.abs(cwtm))) # get index of frequency characteristic
-                f1_ndom = freq[x]
-                
-                # Compute cross-sectional area by summing the CWT coefficients perpendicular to the time axis
-                # Normalize with respect to its maximum value and is expressed as a percentage
-                CSA_T = np.sum(np.abs(cwtm), 0)/np.max(np.sum(np.abs(cwtm), 0)) * 100
-
-                # Compute thresholds
-                hesitation_threshold = 0.5*np.mean(CSA_T)
-                freeze_threshold = 0.25*np.mean(CSA_T)
-
-                hesitations_ndom = findHesitationsFreezing(CSA_T, hesitation_threshold, freq[x], dt)
-                freezes_ndom =  findHesitationsFreezing(CSA_T, freeze_threshold, freq[x], dt)
-                
-                del integral_RW, amplitudes_RW, durations_RW 
-                
-                # Right affected
-                if (s.side == 1):
-                    affected_dom = False
-                    affected_ndom = True
-                # Left affected
-                elif (s.side == 2):
-                    affected_dom = True
-                    affected_ndom = False
-                # Both sides affected
-                elif (s.side == 3):
-                    affected_dom = True
-                    affected_ndom = True
-                # No information
-                else:
-                    affected_dom = False
-                    affected_ndom = False
-            else:
-                # left hand y-axis
-                integral_LW, amplitudes_LW, durations_LW = getAmplitudes(s.gyro_timestamps_LW, s.gyro_data_LW[:,0])
-                
-                ## Amplitude Features:
-                #'mean_amplitude_supination'
-                mean_amplitude_supination_ndom = np.mean(amplitudes_LW[amplitudes_LW > 0])
-                #'mean_amplitude_pronation' 
-                mean_amplitude_pronation_ndom = np.mean(amplitudes_LW[amplitudes_LW < 0])
-                #'mean_amplitude'
-                mean_amplitude_ndom = np.mean(np.abs(amplitudes_LW))
-                #'var_amplitude_supination'
-                var_amplitude_supination_ndom = np.var(amplitudes_LW[amplitudes_LW > 0])
-                #'var_amplitude_pronation' 
-                var_amplitude_pronation_ndom = np.var(amplitudes_LW[amplitudes_LW < 0])
-                #'var_amplitude'
-                var_amplitude_ndom = np.var(np.abs(amplitudes_LW))
-                #'decrement_amplitude_supination'
-                polyfit = np.polyfit(range(len(amplitudes_LW[amplitudes_LW > 0])), amplitudes_LW[amplitudes_LW > 0], 1)
-                decrement_amplitude_supination_ndom = polyfit[0]
-                #'decrement_amplitude_pronation' 
-                polyfit = np.polyfit(range(len(amplitudes_LW[amplitudes_LW < 0])), amplitudes_LW[amplitudes_LW < 0], 1)
-                decrement_amplitude_pronation_ndom = polyfit[0]
-                #'decrement_amplitude'
-                polyfit = np.polyfit(range(len(amplitudes_LW)), np.abs(amplitudes_LW), 1)
-                decrement_amplitude_ndom = polyfit[0]
-                
-                ## Frequency/Speed Features:
-                #'main_freq'
-                z = fftpack.fft(s.gyro_data_LW[:, 0])
-                freqs = fftpack.fftfreq(len(s.gyro_data_LW)) * s.gyro_FS_LW
-                main_freq_ndom = freqs[np.argmax(np.abs(z))]
-                #'var_periods'
-                var_periods_ndom = np.var(durations_LW)
-                #'decrement_periods'
-                polyfit = np.polyfit(range(len(durations_LW)), durations_LW, 1)
-                decrement_periods_ndom = polyfit[0]
-                #'movements'
-                movements_ndom = len(durations_LW)
-                
-                ## Hesitations and Halts
-                dat = s.gyro_data_LW[:,0]
-                t0 = s.gyro_timestamps_LW[0]
-                dt = s.gyro_timestamps_LW[1] - s.gyro_timestamps_LW[0]
-                t = s.gyro_timestamps_LW
-
-                # Normalize signal
-                p = np.polyfit(s.gyro_timestamps_LW - s.gyro_timestamps_LW[0], s.gyro_data_LW[:,0], 1)
-                dat_notrend = s.gyro_data_LW[:,0] - np.polyval(p, s.gyro_timestamps_LW - s.gyro_timestamps_LW[0])
-                std = dat_notrend.std()  # Standard deviation
-                var = std ** 2  # Variance
-                dat_norm = dat_notrend / std  # Normalized dataset
-
-                w = 1. # central frequency
-                freq = np.linspace(1, s.gyro_FS_LW/2, 100)
-                widths = w*s.gyro_FS_LW / (2*freq*np.pi)
-                cwtm = signal.cwt(dat_norm, signal.morlet2, widths, w=w) # continuous wavelet transform
-                
-                (x, y) = np.where(np.abs(cwtm) == np.amax(np.abs(cwtm))) # get index of frequency characteristic
-                f1_ndom = freq[x]
-                
-                # Compute cross-sectional area by summing the CWT coefficients perpendicular to the time axis
-                # Normalize with respect to its maximum value and is expressed as a percentage
-                CSA_T = np.sum(np.abs(cwtm), 0)/np.max(np.sum(np.abs(cwtm), 0)) * 100
-
-                # Compute thresholds
-                hesitation_threshold = 0.5*np.mean(CSA_T)
-                freeze_threshold = 0.25*np.mean(CSA_T)
-
-                hesitations_ndom = findHesitationsFreezing(CSA_T, hesitation_threshold, freq[x], dt)
-                freezes_ndom =  findHesitationsFreezing(CSA_T, freeze_threshold, freq[x], dt)
-
-                del integral_LW, amplitudes_LW, durations_LW 
-                
-                # right hand y-axis
-                integral_RW, amplitudes_RW, durations_RW = getAmplitudes(s.gyro_timestamps_RW, s.gyro_data_RW[:,0])
-    
-                ## Amplitude Features:
-                #'mean_amplitude_supination'
-                mean_amplitude_supination_dom = np.mean(amplitudes_RW[amplitudes_RW > 0])
-                #'mean_amplitude_pronation' 
-                mean_amplitude_pronation_dom = np.mean(amplitudes_RW[amplitudes_RW < 0])
-                #'mean_amplitude'
-                mean_amplitude_dom = np.mean(np.abs(amplitudes_RW))
-                #'var_amplitude_supination'
-                var_amplitude_supination_dom = np.var(amplitudes_RW[amplitudes_RW > 0])
-                #'var_amplitude_pronation' 
-                var_amplitude_pronation_dom = np.var(amplitudes_RW[amplitudes_RW < 0])
-                #'var_amplitude'
-                var_amplitude_dom = np.var(np.abs(amplitudes_RW))
-                #'decrement_amplitude_supination'
-                polyfit = np.polyfit(range(len(amplitudes_RW[amplitudes_RW > 0])), amplitudes_RW[amplitudes_RW > 0], 1)
-                decrement_amplitude_supination_dom = polyfit[0]
-                #'decrement_amplitude_pronation' 
-                polyfit = np.polyfit(range(len(amplitudes_RW[amplitudes_RW < 0])), amplitudes_RW[amplitudes_RW < 0], 1)
-                decrement_amplitude_pronation_dom = polyfit[0]
-                #'decrement_amplitude'
-                polyfit = np.polyfit(range(len(amplitudes_RW)), np.abs(amplitudes_RW), 1)
-                decrement_amplitude_dom = polyfit[0]
-                
-                ## Frequency/Speed Features:
-                #'main_freq'
-                z = fftpack.fft(s.gyro_data_RW[:, 0])
-                freqs = fftpack.fftfreq(len(s.gyro_data_RW)) * s.gyro_FS_RW
-                main_freq_dom = freqs[np.argmax(np.abs(z))]
-                #'var_periods'
-                var_periods_dom = np.var(durations_RW)
-                #'decrement_periods'
-                polyfit = np.polyfit(range(len(durations_RW)), durations_RW, 1)
-                decrement_periods_dom = polyfit[0]
-                #'movements'
-                movements_dom = len(durations_RW)
-                
-                ## Hesitations and Halts
-                dat = s.gyro_data_RW[:,0]
-                t0 = s.gyro_timestamps_RW[0]
-                dt = s.gyro_timestamps_RW[1] - s.gyro_timestamps_RW[0]
-                t = s.gyro_timestamps_RW
-
-                # Normalize signal
-                p = np.polyfit(s.gyro_timestamps_RW - s.gyro_timestamps_RW[0], s.gyro_data_RW[:,0], 1)
-                dat_notrend = s.gyro_data_RW[:,0] - np.polyval(p, s.gyro_timestamps_RW - s.gyro_timestamps_RW[0])
-                std = dat_notrend.std()  # Standard deviation
-                var = std ** 2  # Variance
-                dat_norm = dat_notrend / std  # Normalized dataset
-
-                w = 1. # central frequency
-                freq = np.linspace(1, s.gyro_FS_RW/2, 100)
-                widths = w*s.gyro_FS_RW / (2*freq*np.pi)
-                cwtm = signal.cwt(dat_norm, signal.morlet2, widths, w=w) # continuous wavelet transform
-                
-                (x, y) = np.where(np.abs(cwtm) == np.amax(np.abs(cwtm))) # get index of frequency characteristic
-                f1_dom = freq[x]
-                
-                # Compute cross-sectional area by summing the CWT coefficients perpendicular to the time axis
-                # Normalize with respect to its maximum value and is expressed as a percentage
-                CSA_T = np.sum(np.abs(cwtm), 0)/np.max(np.sum(np.abs(cwtm), 0)) * 100
-
-                # Compute thresholds
-                hesitation_threshold = 0.5*np.mean(CSA_T)
-                freeze_threshold = 0.25*np.mean(CSA_T)
+    def iterSubjects(self):
+        """
+        Returns the subjects: the kept subjects, or the subjects loaded again one at a time if keep_subjects is False.
 
-                hesitations_dom = findHesitationsFreezing(CSA_T, hesitation_threshold, freq[x], dt)
-                freezes_dom =  findHesitationsFreezing(CSA_T, freeze_threshold, freq[x], dt)
+        Returns:
+            iterable: subjects
+        """
+        if self.keep_subjects:
+            return self.subjects
+        return Subjects(self.timeslot_choice, self.manifest, self.io_workers, self.prefetch, load = False, keep_subjects = False).iterSubjects()
+    
+    def loadUPDRS(self, subjects = None):
+        """
+        Computes the features of both hands of all subjects. At most prefetch subjects wait for their features; the integrals and extrema of the subjects are kept for the plots only if keep_subjects is set.
 
-                del integral_RW, amplitudes_RW, durations_RW 
+        Parameters:
+            subjects(iterable): subjects (None: see iterSubjects); an iterator that loads the subjects (see Subjects.iterSubjects) is consumed while the features of the subjects loaded before are computed
+        """
+        table = TableBuilder(['subject_id', 'handedness', 'diagnosis', 'UPDRS', 'typist', 'years', 'dominant', 'affected', 'mean_amplitude', 'var_amplitude', 'decrement_amplitude', 'main_freq', 'var_periods', 'decrement_periods', 'movements', 'hesitations', 'freezes', 'f1']) # add features: hesitations, halts, wavelets
+        options = {"integration_rule" : self.integration_rule, "uniform_spacing" : self.uniform_spacing, "cwt_precision" : self.cwt_precision, "segmentation" : True}
+        # integrals and extrema of both wrists by subject id, reused by the plots
+        self.segmentations = {}
+        if (subjects is None):
+            subjects = self.iterSubjects()
+        
+        # both wrists of a subject are computed concurrently, in threads or in worker processes
+        if (self.n_jobs is None or self.n_jobs == 1):
+            pool = ThreadPoolExecutor(max_workers = self.wrist_workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers = os.cpu_count() if self.n_jobs < 0 else self.n_jobs)
+        with pool:
+            pending = deque()
+            for s in subjects:
+                print(s.subject_id)
                 
-                # Right affected
-                if (s.side == 1):
-                    affected_dom = True
-                    affected_ndom = False
-                # Left affected
-                elif (s.side == 2):
-                    affected_dom = False
-                    affected_ndom = True
-                # Both sides affected
-                elif (s.side == 3):
-                    affected_dom = True
-                    affected_ndom = True
-                # No information
-                else:
-                    affected_dom = False
-                    affected_ndom = False
-
-            # append dom hand
-            df = df.append({'subject_id' : s.subject_id, 
-                            'handedness' : s.handedness, 
-                            'diagnosis' : s.diagnosis, 
-                            'UPDRS' : s.UPDRS_dom, 
-                            'typist' : s.typist, 
-                            'years' : s.years, 
-                            'dominant' : True, 
-                            'affected' : affected_dom,
-                            'mean_amplitude' : mean_amplitude_dom, 
-                            'var_amplitude' : var_amplitude_dom, 
-                            'decrement_amplitude' : decrement_amplitude_dom, 
-                            'main_freq' : main_freq_dom, 
-                            'var_periods' : var_periods_dom, 
-                            'decrement_periods' : decrement_periods_dom, 
-                            'movements' : movements_dom,
-                            'hesitations' : hesitations_dom, 
-                            'freezes' : freezes_dom, 
-                            'f1' : f1_dom}, ignore_index=True) 
-            # append ndom hand        
-            df = df.append({'subject_id' : s.subject_id, 
-                            'handedness' : s.handedness, 
-                            'diagnosis' : s.diagnosis, 
-                            'UPDRS' : s.UPDRS_ndom, 
-                            'typist' : s.typist, 
-                            'years' : s.years, 
-                            'dominant' : False, 
-                            'affected' : affected_ndom,
-                            'mean_amplitude' : mean_amplitude_ndom, 
-                            'var_amplitude' : var_amplitude_ndom, 
-                            'decrement_amplitude' : decrement_amplitude_ndom, 
-                            'main_freq' : main_freq_ndom, 
-                            'var_periods' : var_periods_ndom, 
-                            'decrement_periods' : decrement_periods_ndom, 
-                            'movements' : movements_ndom,
-                            'hesitations' : hesitations_ndom, 
-                            'freezes' : freezes_ndom, 
-                            'f1' : f1_ndom}, ignore_index=True) 
+                # left hand and right hand y-axis
+                features_LW = pool.submit(computeWristFeatures, s.gyro_timestamps_LW, s.gyro_data_LW[:,0], s.gyro_FS_LW, **options)
+                features_RW = pool.submit(computeWristFeatures, s.gyro_timestamps_RW, s.gyro_data_RW[:,0], s.gyro_FS_RW, **options)
+                pending.append((s, features_LW, features_RW))
+                # the rows are added in the order of the subjects
+                while (len(pending) > max(1, self.prefetch)):
+                    self.appendSubject(table, *pending.popleft())
+            while pending:
+                self.appendSubject(table, *pending.popleft())
         
         # Pre-process the data
+        df = table.toDataFrame()
         self.df_raw = df.copy(deep=True)
         self.df = self.preprocess(df)
         
         self.X = self.df.drop(columns=["subject_id", "UPDRS", "diagnosis", "handedness", "years", "dominant", "affected"]).to_numpy()
         self.y = self.df['UPDRS'].to_numpy()
         self.label_dict = dict(zip([0, 1, 2, 3], ['UPDRS_0', 'UPDRS_1', 'UPDRS_2','UPDRS_3']))
+    
+    def appendSubject(self, table, s, features_LW, features_RW):
+        """
+        Adds the rows of the dominant and the non-dominant hand of a subject to the table of features.
+
+        Parameters:
+            table(TableBuilder): table of features
+            s(Subject): subject
+            features_LW(Future): features of the left wrist
+            features_RW(Future): features of the right wrist
+        """
+        (features_LW, segmentation_LW), (features_RW, segmentation_RW) = features_LW.result(), features_RW.result()
+        if self.keep_subjects:
+            self.segmentations[s.subject_id] = (segmentation_LW, segmentation_RW)
+        (dom, affected_dom), (ndom, affected_ndom) = mapWrists(s.handedness, s.side, (features_LW, features_RW))
+        
+        # append dom hand
+        table.append({'subject_id' : s.subject_id, 
+                      'handedness' : s.handedness, 
+                      'diagnosis' : s.diagnosis, 
+                      'UPDRS' : s.UPDRS_dom, 
+                      'typist' : s.typist, 
+                      'years' : s.years, 
+                      'dominant' : True, 
+                      'affected' : affected_dom,
+                      'mean_amplitude' : dom.mean_amplitude, 
+                      'var_amplitude' : dom.var_amplitude, 
+                      'decrement_amplitude' : dom.decrement_amplitude, 
+                      'main_freq' : dom.main_freq, 
+                      'var_periods' : dom.var_periods, 
+                      'decrement_periods' : dom.decrement_periods, 
+                      'movements' : dom.movements,
+                      'hesitations' : dom.hesitations, 
+                      'freezes' : dom.freezes, 
+                      'f1' : dom.f1}) 
+        # append ndom hand        
+        table.append({'subject_id' : s.subject_id, 
+                      'handedness' : s.handedness, 
+                      'diagnosis' : s.diagnosis, 
+                      'UPDRS' : s.UPDRS_ndom, 
+                      'typist' : s.typist, 
+                      'years' : s.years, 
+                      'dominant' : False, 
+                      'affected' : affected_ndom,
+                      'mean_amplitude' : ndom.mean_amplitude, 
+                      'var_amplitude' : ndom.var_amplitude, 
+                      'decrement_amplitude' : ndom.decrement_amplitude, 
+                      'main_freq' : ndom.main_freq, 
+                      'var_periods' : ndom.var_periods, 
+                      'decrement_periods' : ndom.decrement_periods, 
+                      'movements' : ndom.movements,
+                      'hesitations' : ndom.hesitations, 
+                      'freezes' : ndom.freezes, 
+                      'f1' : ndom.f1})
             
-    def plotIntegrals(self):
-        for s in self.subjects:
-            if (s.handedness == "left"):
-                # Right affected
-                if (s.side == 1):
-                    right_side = " (affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                    left_side = " (not affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
-                # Left affected
-                elif (s.side == 2):
-                    right_side = " (not affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                    left_side = " (affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
-                # Both sides affected
-                elif (s.side == 3):
-                    right_side = " (affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                    left_side = " (affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
-                # No information
-                else:
-                    right_side = " (not affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                    left_side = " (not affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
+    def getIntegralPlot(self, s, directory = "Plots", max_points = None):
+        """
+        Collects the data of the plot of the integrals of a subject (see drawIntegrals); the integrals and extrema of loadUPDRS are reused.
+
+        Parameters:
+            s(Subject): subject
+            directory(string): directory of the image
+            max_points(int): maximum number of samples per line (None: all samples, see decimateSignal)
+
+        Returns:
+            dict: data of the plot
+        """
+        segmentations = getattr(self, "segmentations", {}).get(s.subject_id)
+        plot = {"subject_id" : s.subject_id, "filename" : os.path.join(directory, s.subject_id + '_Integrals.png'), "max_points" : max_points}
+        for i, (wrist, timestamps, data) in enumerate([("LW", s.gyro_timestamps_LW, s.gyro_data_LW), ("RW", s.gyro_timestamps_RW, s.gyro_data_RW)]):
+            if (segmentations is None):
+                integral = F(timestamps, data[:,0], self.integration_rule, self.uniform_spacing)
+                (maxi,), (mini,) = segmentIntegrals(integral)
             else:
-                # Right affected
-                if (s.side == 1):
-                    right_side = " (affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
-                    left_side = " (not affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                # Left affected
-                elif (s.side == 2):
-                    right_side = " (not affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
-                    left_side = " (affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                # Both sides affected
-                elif (s.side == 3):
-                    right_side = " (affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
-                    left_side = " (affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                # No information
-                else:
-                    right_side = " (not affected, dominant, UPDRS " + str(s.UPDRS_dom) + ")"
-                    left_side = " (not affected, non-dominant, UPDRS " + str(s.UPDRS_ndom) + ")"
-                    
-            integral_RW, absAmp_RW, durations_RW = getAmplitudes(s.gyro_timestamps_RW, s.gyro_data_RW[:,0])
-            integral_LW, absAmp_LW, durations_LW = getAmplitudes(s.gyro_timestamps_LW, s.gyro_data_LW[:,0])
-            (maxi_RW,), (mini_RW,) = segmentIntegrals(integral_RW)
-            (maxi_LW,), (mini_LW,) = segmentIntegrals(integral_LW)
-
-            fig, axs = plt.subplots(2, 2, figsize = (20,10))
-            fig.suptitle(s.subject_id + ' Integrals', fontsize=18)
-            # left hand y-axis raw
-            axs[0, 0].plot(s.gyro_timestamps_LW, s.gyro_data_LW[:,0])
-            axs[0, 0].set_ylabel('Angular Velocity [deg/s]', fontsize = 14)
-            axs[0, 0].set_title('Left Hand Y-Axis' + left_side + ", Nr of Periods: " + str(len(durations_LW)/2), fontsize=16)
-
-            # right hand y-axis raw
-            axs[0, 1].plot(s.gyro_timestamps_RW, s.gyro_data_RW[:,0])
-            axs[0, 1].set_title('Right Hand Y-Axis' + right_side + ", Nr of Periods: " + str(len(durations_RW)/2), fontsize=16)
-
-            # left hand y-axis integral
-            axs[1, 0].plot(s.gyro_timestamps_LW, integral_LW)
-            axs[1, 0].plot(s.gyro_timestamps_LW[mini_LW], integral_LW[mini_LW], "or")
-            axs[1, 0].plot(s.gyro_timestamps_LW[maxi_LW], integral_LW[maxi_LW], "og")
-            axs[1, 0].set_ylabel('Angular Displacement [deg]', fontsize = 14)
-            axs[1, 0].set_xlabel('Time [s]', fontsize = 14)
-            axs[1, 0].set_title('Left Hand Y-Axis Integral' + left_side + ", Nr of Periods: " + str(len(durations_LW)/2), fontsize=16)
-
-            # right hand y-axis integral
-            axs[1, 1].plot(s.gyro_timestamps_RW, integral_RW)
-            axs[1, 1].plot(s.gyro_timestamps_RW[mini_RW], integral_RW[mini_RW], "or")
-            axs[1, 1].plot(s.gyro_timestamps_RW[maxi_RW], integral_RW[maxi_RW], "og")
-            axs[1, 1].set_xlabel('Time [s]', fontsize = 14)
-            axs[1, 1].set_title('Right Hand Y-Axis Integral' + right_side + ", Nr of Periods: " + str(len(durations_RW)/2), fontsize=16)
-
-            # Hide x labels and tick labels for top plots and y ticks for right plots.
-            for ax in axs.flat:
-                ax.label_outer()
-
-            fig.savefig('Plots/' + s.subject_id + '_Integrals.png')
-        
\ No newline at end of file
+                integral, maxi, mini = segmentations[i]
+            _, durations, _, _ = segmentMovements(timestamps, integral, maxi, mini)
+            
+            dominant = (s.handedness == "left") == (wrist == "LW")
+            affected = (s.side in (2, 3)) if (wrist == "LW") else (s.side in (1, 3))
+            label = " (" + ("affected" if affected else "not affected") + ", " + ("dominant" if dominant else "non-dominant") + ", UPDRS " + str(s.UPDRS_dom if dominant else s.UPDRS_ndom) + ")"
+            plot[wrist] = {"label" : label, "timestamps" : timestamps, "signal" : data[:,0], "integral" : integral, "maxima" : maxi, "minima" : mini, "periods" : len(durations)/2}
+        return plot
+    
+    def plotIntegrals(self, directory = "Plots", batch = False, n_jobs = None, max_points = None):
+        """
+        Plots the angular velocities and their integrals with the local extrema of all subjects and saves the plots as images. If keep_subjects is False, the subjects are loaded again and their integrals computed again one subject at a time.
+
+        Parameters:
+            directory(string): directory of the images
+            batch(boolean): render the images on the non-interactive Agg backend and close the figures (False: pyplot figures, which stay open)
+            n_jobs(int): number of worker processes rendering the images in batch mode (None or 1: serial, -1: all CPUs)
+            max_points(int): maximum number of samples per line (None: all samples, see decimateSignal)
+
+        Returns:
+            list: filenames of the images
+        """
+        plots = (self.getIntegralPlot(s, directory, max_points) for s in self.iterSubjects())
+        if not batch:
+            filenames = []
+            for plot in plots:
+                fig = plt.figure(figsize = (20,10))
+                drawIntegrals(fig, plot)
+                fig.savefig(plot["filename"])
+                filenames.append(plot["filename"])
+            return filenames
+        if (n_jobs is None or n_jobs == 1):
+            return [renderIntegrals(plot) for plot in plots]
+        filenames = []
+        with ProcessPoolExecutor(max_workers = os.cpu_count() if n_jobs < 0 else n_jobs) as pool:
+            # at most prefetch plots wait for their images
+            pending = deque()
+            for plot in plots:
+                pending.append(pool.submit(renderIntegrals, plot))
+                while (len(pending) > max(1, self.prefetch)):
+                    filenames.append(pending.popleft().result())
+            while pending:
+                filenames.append(pending.popleft().result())
+        return filenames
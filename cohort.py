@@ -0,0 +1,174 @@
+import os
+import re
+import glob
+import pandas as pd
+import numpy as np
+
+
+# Groups of the cohort in loading order and their diagnosis codes
+GROUPS = {"PD_OFF" : 0, "PD_ON" : 1, "HC" : 3, "CA" : 2}
+
+# Files of a session: name -> (directory argument of scanCohort, filename pattern)
+FILES = {"data" : ("data_dir", "{}.txt"),
+         "sensor_LW" : ("sensor_dir", "{}_LW_sensorData.mat"),
+         "sensor_RW" : ("sensor_dir", "{}_RW_sensorData.mat"),
+         "header_LW" : ("sensor_dir", "{}_LW_header.mat"),
+         "header_RW" : ("sensor_dir", "{}_RW_header.mat")}
+
+SUBJECT_ID = re.compile(r"^(PD|HC|CA)(\d+)(?:_(ON|OFF))?$")
+
+def getGroup(subject_id):
+    """Returns the group of a subject id.
+
+    Parameters:
+        subject_id(string): subject id, e.g. "PD01_OFF" or "HC08"
+
+    Returns:
+        string: group ("PD_OFF", "PD_ON", "HC" or "CA"; None if the id is not a subject id)
+    """
+    match = SUBJECT_ID.match(subject_id)
+    if (match is None):
+        return None
+    prefix, _, session = match.groups()
+    if (prefix == "PD"):
+        return "PD_" + session if session else None
+    return prefix
+
+def scanCohort(data_dir = "Data", sensor_dir = "SensorData"):
+    """Builds the manifest of the cohort by scanning the directories of the keyboard and wearable sensor recordings.
+
+    Parameters:
+        data_dir(string): directory of the JSON files of the keyboard tests and clinical data
+        sensor_dir(string): directory of the .mat files of the wearable sensors
+
+    Returns:
+        dataframe: one row per session with subject id, group, diagnosis, patient, session (ON/OFF, empty for HC and CA) and path, size and modification time of every file (empty path and NaN if the file is missing)
+    """
+    dirs = {"data_dir" : data_dir, "sensor_dir" : sensor_dir}
+    ids = set()
+    for name, (directory, pattern) in FILES.items():
+        for path in glob.glob(os.path.join(dirs[directory], pattern.format("*"))):
+            subject_id = os.path.basename(path)[:-len(pattern.format(""))]
+            if (getGroup(subject_id) is not None):
+                ids.add(subject_id)
+
+    rows = []
+    for subject_id in ids:
+        prefix, number, session = SUBJECT_ID.match(subject_id).groups()
+        group = getGroup(subject_id)
+        row = {"subject_id" : subject_id, "group" : group, "diagnosis" : GROUPS[group], "patient" : prefix + number, "session" : session or ""}
+        for name, (directory, pattern) in FILES.items():
+            path = os.path.join(dirs[directory], pattern.format(subject_id))
+            if os.path.exists(path):
+                stat = os.stat(path)
+                row[name + "_path"], row[name + "_size"], row[name + "_mtime"] = path, stat.st_size, stat.st_mtime
+            else:
+                row[name + "_path"], row[name + "_size"], row[name + "_mtime"] = "", np.nan, np.nan
+        rows.append(row)
+    return sortManifest(pd.DataFrame(rows, columns = getManifestColumns()))
+
+def getSessionPaths(subject_id, data_dir = "Data", sensor_dir = "SensorData"):
+    """Returns the filenames of the files of a session in the directories of scanCohort.
+
+    Parameters:
+        subject_id(string): subject id, e.g. "PD01_OFF"
+        data_dir(string): directory of the JSON files of the keyboard tests and clinical data
+        sensor_dir(string): directory of the .mat files of the wearable sensors
+
+    Returns:
+        dict: filename of every file of the session by name (see FILES)
+    """
+    dirs = {"data_dir" : data_dir, "sensor_dir" : sensor_dir}
+    return {name : os.path.join(dirs[directory], pattern.format(subject_id)) for name, (directory, pattern) in FILES.items()}
+
+def getManifestPaths(manifest):
+    """Returns the filenames of the files of every session of a manifest.
+
+    Parameters:
+        manifest(dataframe): manifest
+
+    Returns:
+        dict: per subject id the filename of every file of the session by name (see FILES, empty if the file is missing)
+    """
+    return {row["subject_id"] : {name : row[name + "_path"] for name in FILES} for row in manifest.to_dict("records")}
+
+def getManifestColumns():
+    """Returns the columns of a manifest."""
+    return ["subject_id", "group", "diagnosis", "patient", "session"] + [name + field for name in FILES for field in ["_path", "_size", "_mtime"]]
+
+def sortManifest(manifest):
+    """Sorts a manifest by group (in the order of GROUPS) and subject id."""
+    order = manifest["group"].map(list(GROUPS).index)
+    return manifest.assign(order = order).sort_values(["order", "subject_id"]).drop(columns = ["order"]).reset_index(drop = True)
+
+def saveManifest(manifest, filename):
+    """Saves a manifest as CSV or Parquet file (by the extension of the filename).
+
+    Parameters:
+        manifest(dataframe): manifest
+        filename(string): filename ending with .csv or .parquet
+    """
+    if filename.endswith(".parquet"):
+        manifest.to_parquet(filename, index = False)
+    else:
+        manifest.to_csv(filename, index = False)
+
+def loadManifest(filename):
+    """Loads a manifest saved with saveManifest.
+
+    Parameters:
+        filename(string): filename ending with .csv or .parquet
+
+    Returns:
+        dataframe: manifest
+    """
+    if filename.endswith(".parquet"):
+        manifest = pd.read_parquet(filename)
+    else:
+        manifest = pd.read_csv(filename, dtype = {"subject_id" : str, "group" : str, "patient" : str, "session" : str}, float_precision = "round_trip")
+    text = ["session"] + [name + "_path" for name in FILES]
+    manifest[text] = manifest[text].fillna("").astype(str)
+    return manifest
+
+def filterManifest(manifest, groups = None, ids = None, keyboard = False, sensors = False, changed_since = None, previous = None):
+    """Selects sessions of a manifest.
+
+    Parameters:
+        manifest(dataframe): manifest
+        groups(list): groups to keep, e.g. ["PD_OFF"] (None: all groups)
+        ids(list): subject ids to keep (None: all subject ids)
+        keyboard(boolean): keep only sessions with a JSON file
+        sensors(boolean): keep only sessions with all wearable sensor files
+        changed_since(float/datetime): keep only sessions with a file modified after this time (seconds since the epoch or datetime)
+        previous(dataframe/string): manifest of an earlier run (or its filename), keep only sessions that are new or whose files changed since then
+
+    Returns:
+        dataframe: selected sessions
+    """
+    keep = pd.Series(True, index = manifest.index)
+    if (groups is not None):
+        keep &= manifest["group"].isin(groups)
+    if (ids is not None):
+        keep &= manifest["subject_id"].isin(ids)
+    if keyboard:
+        keep &= manifest["data_path"] != ""
+    if sensors:
+        for name in FILES:
+            if (name != "data"):
+                keep &= manifest[name + "_path"] != ""
+    if (changed_since is not None):
+        if hasattr(changed_since, "timestamp"):
+            changed_since = changed_since.timestamp()
+        keep &= (manifest[[name + "_mtime" for name in FILES]] > changed_since).any(axis = 1)
+    if (previous is not None):
+        if isinstance(previous, str):
+            previous = loadManifest(previous)
+        fields = [name + field for name in FILES for field in ["_path", "_size", "_mtime"]]
+        before = manifest[["subject_id"]].merge(previous[["subject_id"] + fields], on = "subject_id", how = "left", indicator = True)
+        before.index = manifest.index
+        same = (before["_merge"] == "both")
+        for field in fields:
+            # missing files (NaN) are equal to missing files
+            same &= (manifest[field] == before[field]) | (manifest[field].isna() & before[field].isna())
+        keep &= ~same
+    return manifest[keep]
@@ -0,0 +1,20 @@
+from sklearn.model_selection import train_test_split
+
+
+def splitDataset(X, y, random_state = 0, test_size = 0.2):
+    """
+        Stratified train/test split of a dataset, used by Key2PD.split and by Evaluator, so that both draw the same splits
+
+        Parameters:
+            X(array): features
+            y(array): labels
+            random_state(int): seed of the split
+            test_size(float): fraction of the test set
+
+        Output:
+            array: X_train
+            array: X_test
+            array: y_train
+            array: y_test
+    """
+    return train_test_split(X, y, test_size=test_size, random_state=random_state, stratify=y)
@@ -1,41 +1,308 @@
+import io
+import os
+import warnings
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
+import joblib
+from joblib import Parallel, delayed
 
-from classifier import Classifier
+from datasplit import splitDataset
+
+
+def evaluate_run(clf, X, y, random_state, test_size=0.2):
+    """
+    Evaluate the classifier on one train/test split.
+
+    The split is drawn by datasplit.splitDataset, as data.split does, so it
+    is identical to data.split(random_state=random_state,
+    test_size=test_size). Unlike data.split, it does not set the X_train,
+    X_test, y_train and y_test attributes of the dataset.
+
+    Args:
+        clf          = [Classifier] classifier instance
+        X            = [np.array] features of the dataset
+        y            = [np.array] labels of the dataset
+        random_state = [int] seed of the split
+        test_size    = [float] fraction of the test set (default=0.2)
+
+    Returns [dict]:
+        Scores of the run.
+    """
+    X_train, X_test, y_train, y_test = splitDataset(X, y, random_state=random_state, test_size=test_size)
+    BCA_train, BCA_test, mAUC_train, mAUC_test = clf.fit_predict(X_train,
+                                                                  y_train,
+                                                                  X_test,
+                                                                  y_test)
+    return {
+            'BCA_train': BCA_train,
+            'BCA_test': BCA_test,
+            'mAUC_train': mAUC_train,
+            'mAUC_test': mAUC_test
+           }
+
+
+SCORE_COLUMNS = ['BCA_train', 'BCA_test', 'mAUC_train', 'mAUC_test']
+LOG_COLUMNS = ['name', 'run', 'fingerprint'] + SCORE_COLUMNS
+
+
+def get_fingerprint(clf, X, y, test_size):
+    """
+    Fingerprint of an evaluation setup, stored with every run in the score log.
+
+    The classifier is described by its type and get_params(). A classifier
+    without get_params is described by its attributes, with a warning: an
+    attribute without a stable repr (e.g. one showing a memory address)
+    gives a new fingerprint in every session, so its runs are never reused.
+
+    Args:
+        clf       = [Classifier] classifier instance
+        X         = [np.array] features of the dataset
+        y         = [np.array] labels of the dataset
+        test_size = [float] fraction of the test set
+
+    Returns [string]:
+        Hash of the classifier, the test size and the dataset.
+    """
+    if hasattr(clf, 'get_params'):
+        params = clf.get_params()
+    else:
+        warnings.warn(type(clf).__qualname__ + ' has no get_params, its fingerprint is built from the repr of its '
+                      'attributes and changes between sessions if one of them has no stable repr')
+        params = vars(clf) if hasattr(clf, '__dict__') else clf
+    description = type(clf).__module__ + '.' + type(clf).__qualname__ + repr(params)
+    return joblib.hash([description, test_size, np.asarray(X), np.asarray(y)])
+
+
+def get_complete_size(filename):
+    """
+    Size of a score log up to the end of its last complete row.
+
+    A last row without line end was cut off by a crash while it was written
+    (see Evaluator.save_run) and is not part of the complete rows.
+
+    Args:
+        filename = [string] filename of the score log
+
+    Returns [int]:
+        Number of bytes up to and including the last line end.
+    """
+    with open(filename, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            f.seek(start)
+            block = f.read(position - start)
+            if position == end and block.endswith(b'\n'):
+                return end
+            newline = block.rfind(b'\n')
+            if newline >= 0:
+                return start + newline + 1
+            position = start
+        return 0
+
+
+class CompleteRows(io.RawIOBase):
+    """Read a file only up to a given size, e.g. the complete rows of a score log."""
+
+
+    def __init__(self, f, size):
+        """
+        Initialize CompleteRows instance.
+
+        Args:
+            f    = [file] binary file, positioned at its start
+            size = [int] number of bytes to read
+        """
+        self.f = f
+        self.remaining = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.f.read(min(len(buffer), self.remaining))
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+
+
+def read_scores(filenames, chunksize=10000):
+    """
+    Stream the rows of score logs (see Evaluator checkpoint) in chunks.
+
+    A last row without line end is skipped; the logs are not modified.
+
+    Args:
+        filenames = [string/list] filename(s) of the score logs
+        chunksize = [int] number of rows per chunk (default=10000)
+
+    Returns [generator]:
+        Dataframes with the columns name, run, fingerprint and the scores.
+    """
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    for filename in filenames:
+        size = get_complete_size(filename)
+        if size == 0:
+            continue
+        with open(filename, 'rb') as f:
+            for chunk in pd.read_csv(io.BufferedReader(CompleteRows(f, size)), chunksize=chunksize,
+                                     dtype={'name': str, 'fingerprint': str}, float_precision='round_trip'):
+                chunk['name'] = chunk['name'].fillna('')
+                chunk['fingerprint'] = chunk['fingerprint'].fillna('')
+                yield chunk
+
+
+def summarize_scores(filenames, chunksize=10000):
+    """
+    Aggregate score logs per evaluation without loading them at once.
+
+    Args:
+        filenames = [string/list] filename(s) of the score logs
+        chunksize = [int] number of rows per chunk (default=10000)
+
+    Returns [pd.DataFrame]:
+        Number of runs, mean and standard deviation of every score per name and fingerprint.
+    """
+    count, total, squares = None, None, None
+    for chunk in read_scores(filenames, chunksize):
+        chunk = chunk.dropna(subset=['run'] + SCORE_COLUMNS)
+        keys = [chunk['name'], chunk['fingerprint']]
+        groups = chunk.groupby(keys)[SCORE_COLUMNS]
+        parts = [groups.count(), groups.sum(), (chunk[SCORE_COLUMNS] ** 2).groupby(keys).sum()]
+        if count is None:
+            count, total, squares = parts
+        else:
+            count, total, squares = [a.add(b, fill_value=0) for a, b in zip([count, total, squares], parts)]
+    if count is None:
+        return pd.DataFrame()
+    mean = total / count
+    std = np.sqrt(((squares - count * mean ** 2) / (count - 1)).clip(lower=0))
+    return pd.concat({'count': count.astype(int), 'mean': mean, 'std': std}, axis=1)
 
 
 class Evaluator:
     """Evaluate a classifier on the dataset."""
 
 
-    def __init__(self, clf, data, n_runs=30):
+    def __init__(self, clf, data, n_runs=30, n_jobs=None, test_size=0.2, checkpoint=None, name=''):
         """
         Initialize Evaluator instance.
 
         Args:
-            clf    = [Classifier] classifier instance
-            data   = [Key2PD] dataset class instance
-            n_runs = [int] number of evaluation runs (default=30)
+            clf        = [Classifier] classifier instance
+            data       = [Key2PD] dataset class instance
+            n_runs     = [int] number of evaluation runs (default=30)
+            n_jobs     = [int] number of worker processes (default=None: serial, -1: all CPUs)
+            test_size  = [float] fraction of the test set of every run (default=0.2, as Key2PD.split)
+            checkpoint = [string] CSV score log, every finished run is appended to it (default=None: scores are kept in memory only)
+            name       = [string] name of the evaluation in the score log, several evaluations can share a log (default='')
+
+        Runs in the score log are only reused if their name and the
+        fingerprint of the classifier, the test size and the dataset
+        (see get_fingerprint) match. Evaluations sharing a log must run one
+        after the other: a log must have only one writer at a time.
         """
         self.clf = clf
         self.data = data
         self.n_runs = n_runs
+        self.n_jobs = n_jobs
+        self.test_size = test_size
+        self.checkpoint = checkpoint
+        self.name = str(name)
+        # computed before the classifier is fitted by the first run
+        self.fingerprint = None if checkpoint is None else get_fingerprint(clf, data.X, data.y, test_size)
         self.scores = []
 
     def evaluate(self):
-        """Evaluate the classifier."""
-        for i in tqdm(range(self.n_runs)):         
-            X_train, X_test, y_train, y_test = self.data.split(random_state=i)
-            BCA_train, BCA_test, mAUC_train, mAUC_test = self.clf.fit_predict(X_train, 
-                                                                              y_train, 
-                                                                              X_test, 
-                                                                              y_test)
-            self.scores.append({ 
-                                'BCA_train': BCA_train, 
-                                'BCA_test': BCA_test, 
-                                'mAUC_train': mAUC_train, 
-                                'mAUC_test': mAUC_test 
-                               })
+        """
+        Evaluate the classifier.
+
+        Both modes evaluate run i with evaluate_run on the split with
+        random_state=i, so the scores are the same and in the same order. In
+        parallel mode, X and y of the dataset are memory-mapped by the
+        workers instead of being copied for every run. Afterwards, the
+        X_train, X_test, y_train and y_test attributes of the dataset hold
+        the split of the last evaluated run in both modes.
+
+        In serial mode the classifier is fitted in place, so it is left
+        fitted on the split of the last evaluated run. In parallel mode the
+        workers fit copies of the classifier and it is left as it was.
+
+        With a checkpoint, runs of this evaluation that are already in the
+        score log are not repeated; their scores are read from the log.
+        """
+        done = self.load_checkpoint()
+        runs = [i for i in range(self.n_runs) if i not in done]
+        for i, scores in self.iter_runs(runs):
+            self.save_run(i, scores)
+            done[i] = scores
+        if runs:
+            self.data.split(random_state=runs[-1], test_size=self.test_size)
+        self.scores.extend(done[i] for i in range(self.n_runs))
+
+    def iter_runs(self, runs):
+        """
+        Evaluate the classifier on the splits of the given runs.
+
+        Args:
+            runs = [list] indices of the runs
+
+        Returns [generator]:
+            Index and scores of every run, in the order of the runs.
+        """
+        if self.n_jobs is None or self.n_jobs == 1:
+            for i in tqdm(runs):
+                yield i, evaluate_run(self.clf, self.data.X, self.data.y, i, self.test_size)
+        else:
+            X, y = np.asarray(self.data.X), np.asarray(self.data.y)
+            scores = Parallel(n_jobs=self.n_jobs, mmap_mode='r', return_as='generator')(
+                delayed(evaluate_run)(self.clf, X, y, i, self.test_size) for i in runs)
+            yield from zip(runs, tqdm(scores, total=len(runs)))
+
+    def load_checkpoint(self):
+        """
+        Read the finished runs of this evaluation from the score log.
+
+        Returns [dict]:
+            Scores by run index.
+        """
+        done = {}
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return done
+        for chunk in read_scores(self.checkpoint):
+            # rows with missing values are incomplete and computed again
+            chunk = chunk.dropna(subset=['run'] + SCORE_COLUMNS)
+            chunk = chunk[(chunk['name'] == self.name) & (chunk['fingerprint'] == self.fingerprint) & (chunk['run'] < self.n_runs)]
+            for row in chunk.to_dict('records'):
+                done.setdefault(int(row['run']), {column: row[column] for column in SCORE_COLUMNS})
+        return done
+
+    def save_run(self, i, scores):
+        """
+        Append the scores of a finished run to the score log.
+
+        A last row without line end, cut off by a crash while it was written,
+        is removed first (see get_complete_size).
+
+        Args:
+            i      = [int] index of the run
+            scores = [dict] scores of the run
+        """
+        if self.checkpoint is None:
+            return
+        if os.path.exists(self.checkpoint):
+            size = get_complete_size(self.checkpoint)
+            if size != os.path.getsize(self.checkpoint):
+                os.truncate(self.checkpoint, size)
+        header = not os.path.exists(self.checkpoint) or os.path.getsize(self.checkpoint) == 0
+        row = pd.DataFrame([dict(name=self.name, run=i, fingerprint=self.fingerprint, **scores)], columns=LOG_COLUMNS)
+        with open(self.checkpoint, 'a') as f:
+            f.write(row.to_csv(index=False, header=header))
+            f.flush()
+            os.fsync(f.fileno())
 
 
     def get_scores(self):
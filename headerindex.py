@@ -0,0 +1,178 @@
+import os
+import re
+import glob
+import functools
+import simplejson as json
+import numpy as np
+import pandas as pd
+import scipy.io as sio
+from sensorstore import writeAtomic
+
+
+# Fields of a header (see createHeaderDict)
+HEADER_FIELDS = ["gyro_scale", "gyro_sensorID", "gyro_FS", "gyro_dataPayload", "gyro_calib", "gyro_nbSamples", "deviceID", "deviceType", "bodyLocation", "firmwareVersion", "startDate", "baseFrequency", "stopDate", "measureID"]
+
+HEADER_FILE = re.compile(r"^(.+)_(LW|RW)_header\.mat$")
+
+def createHeaderDict(header):
+    """Creates a dictionary with the header information
+
+        Parameters:
+            header(mat structure): header containing additional information
+
+        Returns:
+            dict: header information
+    """
+    gyro_scale = header['header'][0][0][6][0][0][1][0][0][0][0][0]
+    gyro_sensorID = header['header'][0][0][6][0][0][1][0][0][1][0][0]
+    gyro_FS = header['header'][0][0][6][0][0][1][0][0][2][0][0]
+    gyro_dataPayload = header['header'][0][0][6][0][0][1][0][0][3][0][0]
+    gyro_calib = header['header'][0][0][6][0][0][1][0][0][4][0]
+    gyro_nbSamples = header['header'][0][0][6][0][0][1][0][0][5][0][0]
+
+    deviceID = header['header'][0][0][0][0][0]
+    deviceType = header['header'][0][0][1][0][0]
+    bodyLocation = header['header'][0][0][2][0]
+    firmwareVersion = header['header'][0][0][3][0]
+    startDate = header['header'][0][0][4]
+    baseFrequency = header['header'][0][0][5][0][0]
+    stopDate = header['header'][0][0][7]
+    measureID = header['header'][0][0][8][0][0]
+
+    # Create dict
+    header_df = {"gyro_scale" : gyro_scale, "gyro_sensorID" : gyro_sensorID, "gyro_FS" : gyro_FS, "gyro_dataPayload" : gyro_dataPayload, "gyro_calib" : gyro_calib, "gyro_nbSamples" : gyro_nbSamples, "deviceID" : deviceID, "deviceType" : deviceType, "bodyLocation" : bodyLocation, "firmwareVersion" : firmwareVersion, "startDate" : startDate, "baseFrequency" : baseFrequency, "stopDate" : stopDate, "measureID" : measureID}
+
+    return header_df
+
+def getHeaderIndexFilename(sensor_dir = "SensorData"):
+    """Returns the default filename of the header index of a directory."""
+    return os.path.join(sensor_dir, "header_index.csv")
+
+def getIndexColumns():
+    """Returns the columns of a header index."""
+    return ["subject_id", "wrist", "path", "size", "mtime"] + HEADER_FIELDS + ["dtypes"]
+
+def headerToRow(header):
+    """Converts a header into a row of the header index: scalars and strings are kept, arrays become JSON lists (NaN included) and the numpy types of all fields are kept in the column dtypes.
+
+    Parameters:
+        header(dict): header (see createHeaderDict)
+
+    Returns:
+        dict: row
+    """
+    row = {}
+    dtypes = {}
+    for field in HEADER_FIELDS:
+        value = np.asarray(header[field])
+        dtypes[field] = value.dtype.str
+        row[field] = value.item() if (value.ndim == 0) else json.dumps(value.tolist(), allow_nan = True)
+    row["dtypes"] = json.dumps(dtypes)
+    return row
+
+def rowToHeader(row):
+    """Converts a row of the header index back into a header (see headerToRow).
+
+    Parameters:
+        row(dict/series): row
+
+    Returns:
+        dict: header
+    """
+    dtypes = json.loads(row["dtypes"])
+    header = {}
+    for field in HEADER_FIELDS:
+        dtype = np.dtype(dtypes[field])
+        value = row[field]
+        if isinstance(value, str) and value.startswith("["):
+            header[field] = np.asarray(json.loads(value, allow_nan = True), dtype = dtype)
+        else:
+            header[field] = np.asarray(value, dtype = dtype)[()]
+    return header
+
+def scanHeaders(sensor_dir = "SensorData", index_file = None):
+    """Builds or refreshes the header index of a directory: only header files that are new or whose size or modification time changed are parsed, rows of deleted files are dropped, and the index is saved.
+
+    Parameters:
+        sensor_dir(string): directory of the .mat files of the wearable sensors
+        index_file(string): filename of the index (None: header_index.csv in sensor_dir)
+
+    Returns:
+        dataframe: one row per header file with subject id, wrist, path, size, modification time and the header fields
+    """
+    if (index_file is None):
+        index_file = getHeaderIndexFilename(sensor_dir)
+    previous = {}
+    if os.path.exists(index_file):
+        previous = {row["path"] : row for row in loadHeaderIndex(index_file).to_dict("records")}
+
+    rows = []
+    for path in sorted(glob.glob(os.path.join(sensor_dir, "*_header.mat"))):
+        path = os.path.normpath(path)
+        match = HEADER_FILE.match(os.path.basename(path))
+        if (match is None):
+            continue
+        stat = os.stat(path)
+        row = previous.get(path)
+        if (row is None or row["size"] != stat.st_size or row["mtime"] != stat.st_mtime):
+            row = {"subject_id" : match.group(1), "wrist" : match.group(2), "path" : path, "size" : stat.st_size, "mtime" : stat.st_mtime}
+            row.update(headerToRow(createHeaderDict(sio.loadmat(path))))
+        rows.append(row)
+
+    index = pd.DataFrame(rows, columns = getIndexColumns())
+    writeAtomic(index_file, lambda f: index.to_csv(f, index = False), 'w')
+    return index
+
+def loadHeaderIndex(index_file):
+    """Loads a header index saved by scanHeaders.
+
+    Parameters:
+        index_file(string): filename of the index
+
+    Returns:
+        dataframe: header index
+    """
+    text = ["subject_id", "wrist", "path", "bodyLocation", "firmwareVersion", "dtypes"]
+    # empty cells of the text columns are empty strings, not NaN
+    return pd.read_csv(index_file, dtype = {column : str for column in text}, keep_default_na = False,
+                       na_values = {column : [""] for column in getIndexColumns() if column not in text}, float_precision = "round_trip")
+
+@functools.lru_cache(maxsize = None)
+def getHeaderRows(index_file, mtime):
+    """Returns the rows of a header index by path, loaded once per file and modification time."""
+    return {row["path"] : row for row in loadHeaderIndex(index_file).to_dict("records")}
+
+def readHeader(filename, index_file = None):
+    """Reads the header of a wearable sensor recording from the header index, or from the .mat file if it is not in the index or changed since the index was built.
+
+    Parameters:
+        filename(string): filename of the header .mat file
+        index_file(string): filename of the index (None: header_index.csv next to the header file)
+
+    Returns:
+        dict: header (see createHeaderDict)
+    """
+    if (index_file is None):
+        index_file = getHeaderIndexFilename(os.path.dirname(filename))
+    if os.path.exists(index_file):
+        row = getHeaderRows(index_file, os.path.getmtime(index_file)).get(os.path.normpath(filename))
+        if (row is not None):
+            stat = os.stat(filename)
+            if (row["size"] == stat.st_size and row["mtime"] == stat.st_mtime):
+                return rowToHeader(row)
+    return createHeaderDict(sio.loadmat(filename))
+
+def filterHeaders(index, **fields):
+    """Selects header files by their header fields, e.g. filterHeaders(index, deviceID = [12, 15], firmwareVersion = ["2.1"]).
+
+    Parameters:
+        index(dataframe): header index (see scanHeaders)
+        fields(list): accepted values of header fields (or of subject_id and wrist)
+
+    Returns:
+        dataframe: selected rows; their subject ids can be passed to cohort.filterManifest
+    """
+    keep = pd.Series(True, index = index.index)
+    for field, values in fields.items():
+        keep &= index[field].isin(values)
+    return index[keep]
@@ -0,0 +1,248 @@
+import os
+import glob
+import tempfile
+import simplejson as json
+import numpy as np
+import scipy.io as sio
+
+
+def getStoreFilenames(filename):
+    """Returns the filenames of the memory-mappable version of a wearable sensor recording (SensorData/PD01_OFF_LW_sensorData.mat -> SensorData/PD01_OFF_LW_sensorData_gyro.npy, ..._timestamps.npy and ..._meta.json).
+
+    Parameters:
+        filename(string): filename of the .mat file
+
+    Returns:
+        dict: filenames of the gyroscope data, the timestamps and the meta data
+    """
+    base = os.path.splitext(filename)[0]
+    return {"gyro" : base + "_gyro.npy", "timestamps" : base + "_timestamps.npy", "meta" : base + "_meta.json"}
+
+def extractSensorData(data):
+    """Extracts the gyroscope data of a loaded .mat file.
+
+    Parameters:
+        data(dict): data of the .mat file (see scipy.io.loadmat)
+
+    Returns:
+        array: gyroscope data along x-, y-, and z-axis
+        int: sampling frequency
+        array: timestamps
+    """
+    gyro_data = data['sensorData'][0][1][3]
+    gyro_FS = data['sensorData'][0][1][2][0][0]
+    gyro_timestamps = np.concatenate(data['sensorData'][0][1][4]).ravel()
+    return gyro_data, gyro_FS, gyro_timestamps
+
+def writeAtomic(filename, write, mode = 'wb'):
+    """Writes a file through a temporary file so that readers never see a partial file.
+
+    Parameters:
+        filename(string): filename
+        write(function): function that writes the content to an open file
+        mode(string): file mode
+    """
+    directory = os.path.dirname(filename) or "."
+    fd, tmp = tempfile.mkstemp(dir = directory, suffix = ".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+def convertSensorData(filename):
+    """Converts a wearable sensor recording (.mat file) into .npy files of the gyroscope data and the timestamps, which can be memory-mapped, and a JSON file with the sampling frequency and whether the timestamps are sorted.
+
+    Parameters:
+        filename(string): filename of the .mat file
+
+    Returns:
+        dict: filenames of the converted recording
+    """
+    filenames = getStoreFilenames(filename)
+    gyro_data, gyro_FS, gyro_timestamps = extractSensorData(sio.loadmat(filename))
+    gyro_FS = np.asarray(gyro_FS)
+    meta = {"FS" : gyro_FS.item(), "FS_dtype" : gyro_FS.dtype.str, "samples" : len(gyro_timestamps),
+            "sorted" : bool(np.all(np.diff(gyro_timestamps) >= 0))}
+
+    writeAtomic(filenames["gyro"], lambda f: np.save(f, np.ascontiguousarray(gyro_data)))
+    writeAtomic(filenames["timestamps"], lambda f: np.save(f, np.ascontiguousarray(gyro_timestamps)))
+    # the meta data is written last and marks the conversion as complete
+    writeAtomic(filenames["meta"], lambda f: json.dump(meta, f), 'w')
+    return filenames
+
+def convertSensorDirectory(directory = "SensorData", force = False):
+    """Converts all wearable sensor recordings of a directory whose converted files are missing or older than the .mat file.
+
+    Parameters:
+        directory(string): directory of the .mat files
+        force(boolean): convert all recordings
+
+    Returns:
+        list: filenames of the converted recordings
+    """
+    converted = []
+    for filename in sorted(glob.glob(os.path.join(directory, "*_sensorData.mat"))):
+        if (force or not hasStore(filename)):
+            convertSensorData(filename)
+            converted.append(filename)
+    return converted
+
+def hasStore(filename):
+    """Returns whether an up-to-date converted version of a wearable sensor recording exists.
+
+    Parameters:
+        filename(string): filename of the .mat file
+
+    Returns:
+        boolean: True if the converted files exist and are not older than the .mat file
+    """
+    filenames = getStoreFilenames(filename)
+    if not all(os.path.exists(f) for f in filenames.values()):
+        return False
+    return os.path.getmtime(filenames["meta"]) >= os.path.getmtime(filename)
+
+class TimestampIndex:
+    """
+    This class finds the samples of time intervals in the timestamps of a recording with binary search. Unsorted timestamps are sorted once (stable, so that equal timestamps keep their order); the index of a time is the first sample with the timestamp closest to the time (as in Wear4PD.getSensorData).
+    """
+    def __init__(self, timestamps, is_sorted = None):
+        """
+            Initialise class
+
+            Parameters:
+                timestamps(array): timestamps
+                is_sorted(boolean): whether the timestamps are sorted (None: checked); a sorted memory-mapped array is only read where searched
+        """
+        self.timestamps = timestamps
+        if (is_sorted is None):
+            is_sorted = bool(np.all(np.diff(timestamps) >= 0))
+        if is_sorted:
+            self.order = None
+            self.sorted_timestamps = timestamps
+        else:
+            self.order = np.argsort(timestamps, kind = "stable")
+            self.sorted_timestamps = np.asarray(timestamps)[self.order]
+
+    def indices(self, values):
+        """Returns the index of the first sample with the timestamp closest to every time.
+
+        Parameters:
+            values(array): times
+
+        Returns:
+            array: indices of the samples
+        """
+        values = np.asarray(values, dtype = float)
+        s = self.sorted_timestamps
+        idx = np.searchsorted(s, values, side = "left")
+        lower = np.maximum(idx - 1, 0)
+        upper = np.minimum(idx, len(s) - 1)
+        # the lower neighbour only if it is strictly closer (or there is no upper neighbour)
+        use_lower = (idx > 0) & ((idx == len(s)) | (np.abs(values - s[lower]) < np.abs(values - s[upper])))
+        nearest = np.where(use_lower, lower, upper)
+        # first of the equal timestamps
+        first = np.searchsorted(s, s[nearest], side = "left")
+        return first if (self.order is None) else self.order[first]
+
+    def window(self, start, end):
+        """Returns the indices of the samples closest to the start and the end of a time interval.
+
+        Parameters:
+            start(float): start time of interval
+            end(float): end time of interval
+
+        Returns:
+            int: index of the start
+            int: index of the end
+        """
+        start_index, end_index = self.indices([start, end])
+        return int(start_index), int(end_index)
+
+    def windows(self, starts, ends):
+        """Returns the indices of the samples closest to the starts and the ends of several time intervals at once.
+
+        Parameters:
+            starts(array): start times of the intervals
+            ends(array): end times of the intervals
+
+        Returns:
+            array: indices of the starts
+            array: indices of the ends
+        """
+        starts, ends = np.broadcast_arrays(np.asarray(starts, dtype = float), np.asarray(ends, dtype = float))
+        indices = self.indices(np.concatenate([starts.ravel(), ends.ravel()]))
+        return indices[:starts.size].reshape(starts.shape), indices[starts.size:].reshape(starts.shape)
+
+def slidingWindows(start, end, length, step):
+    """Returns the start and end times of sliding windows, e.g. of 10 seconds across a recording.
+
+    Parameters:
+        start(float): start time of the first window
+        end(float): latest end time of a window
+        length(float): length of the windows
+        step(float): time between the starts of consecutive windows
+
+    Returns:
+        array: start times of the windows
+        array: end times of the windows
+    """
+    starts = start + step*np.arange(max(0, int(np.floor((end - start - length)/step + 1e-9)) + 1))
+    return starts, starts + length
+
+def getTimestampIndex(data):
+    """Returns the timestamp index of a loaded .mat file, which is built on the first call and cached in the data dictionary.
+
+    Parameters:
+        data(dict): data of the .mat file (see scipy.io.loadmat)
+
+    Returns:
+        TimestampIndex: index of the timestamps
+    """
+    if '__timestamp_index__' not in data:
+        data['__timestamp_index__'] = TimestampIndex(np.concatenate(data['sensorData'][0][1][4]).ravel())
+    return data['__timestamp_index__']
+
+def readSensorWindow(filename, start, end):
+    """Reads the gyroscope data of a time interval of a wearable sensor recording (see readSensorWindows).
+
+    Parameters:
+        filename(string): filename of the .mat file
+        start(float): start time of interval
+        end(float): end time of interval
+
+    Returns:
+        array: gyroscope data along the y-axis and z-axis
+        int: sampling frequency
+        array: timestamps
+    """
+    return readSensorWindows(filename, [start], [end])[0]
+
+def readSensorWindows(filename, starts, ends):
+    """Reads the gyroscope data of several time intervals of a wearable sensor recording. If the recording was converted (see convertSensorDirectory), only the intervals of the gyroscope data are mapped into memory; otherwise the .mat file is loaded once.
+
+    Parameters:
+        filename(string): filename of the .mat file
+        starts(list): start times of the intervals
+        ends(list): end times of the intervals
+
+    Returns:
+        list: gyroscope data along the y-axis and z-axis, sampling frequency and timestamps of every interval
+    """
+    if not hasStore(filename):
+        data = sio.loadmat(filename)
+        gyro_data, gyro_FS, _ = extractSensorData(data)
+        index = getTimestampIndex(data)
+    else:
+        filenames = getStoreFilenames(filename)
+        with open(filenames["meta"]) as f:
+            meta = json.load(f)
+        gyro_data = np.load(filenames["gyro"], mmap_mode = 'r')
+        gyro_FS = np.dtype(meta["FS_dtype"]).type(meta["FS"])
+        index = TimestampIndex(np.load(filenames["timestamps"], mmap_mode = 'r'), meta["sorted"])
+
+    start_indices, end_indices = index.windows(starts, ends)
+    # copy the intervals so that the memory maps can be closed
+    return [(np.array(gyro_data[a:b,1:3]), gyro_FS, np.array(index.timestamps[a:b])) for a, b in zip(start_indices, end_indices)]
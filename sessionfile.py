@@ -0,0 +1,107 @@
+import os
+import glob
+import tempfile
+import simplejson as json
+import numpy as np
+
+
+def getBinaryFilename(filename):
+    """Returns the filename of the binary version of a JSON recording (Data/PD01_OFF.txt -> Data/PD01_OFF.npz).
+
+    Parameters:
+        filename(string): filename of the JSON file
+
+    Returns:
+        string: filename of the binary file
+    """
+    return os.path.splitext(filename)[0] + ".npz"
+
+def convertSession(filename, binary_filename = None):
+    """Converts a JSON recording into a binary file with the clinical data as JSON and the key presses/releases of all tests as three concatenated columns (key codes, positions and timestamps) plus the offsets of the tests.
+
+    Parameters:
+        filename(string): filename of the JSON file
+        binary_filename(string): filename of the binary file (None: next to the JSON file)
+
+    Returns:
+        string: filename of the binary file
+    """
+    if (binary_filename is None):
+        binary_filename = getBinaryFilename(filename)
+    with open(filename) as f:
+        data = json.load(f)
+
+    tests = data['d']
+    names = list(tests)
+    offsets = np.cumsum([0] + [len(tests[name]) for name in names])
+    events = [d for name in names for d in tests[name]]
+    arrays = {"meta" : np.asarray(json.dumps({key : value for key, value in data.items() if key != 'd'})),
+              "tests" : np.asarray(json.dumps(names)),
+              "offsets" : offsets,
+              "k" : np.asarray([d['k'] for d in events], dtype=np.int16),
+              "p" : np.asarray([d['p'] for d in events], dtype=np.int8),
+              "e" : np.asarray([d['e'] for d in events])}
+
+    # write to a temporary file first so that readers never see a partial file
+    directory = os.path.dirname(binary_filename) or "."
+    fd, tmp = tempfile.mkstemp(dir = directory, suffix = ".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, binary_filename)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return binary_filename
+
+def convertCohort(directory = "Data", force = False):
+    """Converts all JSON recordings of a directory whose binary file is missing or older than the JSON file.
+
+    Parameters:
+        directory(string): directory of the JSON files
+        force(boolean): convert all recordings
+
+    Returns:
+        list: filenames of the converted recordings
+    """
+    converted = []
+    for filename in sorted(glob.glob(os.path.join(directory, "*.txt"))):
+        if (force or not hasBinary(filename)):
+            convertSession(filename)
+            converted.append(filename)
+    return converted
+
+def hasBinary(filename):
+    """Returns whether an up-to-date binary file exists for a JSON recording.
+
+    Parameters:
+        filename(string): filename of the JSON file
+
+    Returns:
+        boolean: True if the binary file exists and is not older than the JSON file
+    """
+    binary_filename = getBinaryFilename(filename)
+    return os.path.exists(binary_filename) and os.path.getmtime(binary_filename) >= os.path.getmtime(filename)
+
+def readSession(filename, events = True):
+    """Reads a recording from its binary file, or from the JSON file if there is no up-to-date binary file.
+
+    Parameters:
+        filename(string): filename of the JSON file
+        events(boolean): read the key presses/releases of the tests as well (False: clinical data only)
+
+    Returns:
+        dict: data of the recording; the tests in data['d'] are (key codes, positions, timestamps) arrays when read from the binary file and lists of {'k', 'p', 'e'} dictionaries when read from JSON
+    """
+    if not hasBinary(filename):
+        with open(filename) as f:
+            return json.load(f)
+
+    with np.load(getBinaryFilename(filename), allow_pickle = False) as f:
+        data = json.loads(str(f["meta"]))
+        if events:
+            names = json.loads(str(f["tests"]))
+            offsets = f["offsets"].tolist()
+            k, p, e = f["k"], f["p"], f["e"]
+            data['d'] = {name : (k[a:b], p[a:b], e[a:b]) for name, a, b in zip(names, offsets[:-1], offsets[1:])}
+    return data
@@ -0,0 +1,46 @@
+import pandas as pd
+
+
+class TableBuilder:
+    """Collect the rows of a feature table and materialize the dataframe once."""
+
+
+    def __init__(self, columns):
+        """
+        Initialize TableBuilder instance.
+
+        Args:
+            columns = [list] column names of the table
+        """
+        self.columns = list(columns)
+        self.rows = []
+
+    def append(self, row):
+        """
+        Add a row to the table.
+
+        Args:
+            row = [dict/list] values by column name, or values in the order of the columns
+        """
+        self.rows.append(row)
+
+    def __len__(self):
+        return len(self.rows)
+
+
+    def toDataFrame(self):
+        """
+        Build the dataframe of all collected rows.
+
+        Returns [pd.DataFrame]:
+            Dataframe with one row per appended row and a dtype inferred per column.
+            Missing values of dictionary rows are NaN.
+        """
+        if not self.rows:
+            return pd.DataFrame(columns=self.columns)
+        if isinstance(self.rows[0], dict):
+            df = pd.DataFrame.from_records(self.rows, columns=self.columns)
+        else:
+            # object cells (lists/arrays) are kept as they are instead of being broadcast
+            df = pd.DataFrame.from_records([tuple(row) for row in self.rows], columns=self.columns)
+        return df.infer_objects()
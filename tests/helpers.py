@@ -0,0 +1,215 @@
+"""
+Synthetic recordings and reference implementations shared by the tests.
+"""
+import math
+
+import numpy as np
+import scipy.io as sio
+import scipy.signal
+
+import Bradykinesia as B
+import cohort
+import timeslots
+
+
+def make_events(seed, layout, duration=62000, unsorted=False):
+    """Finger tapping test: mostly alternating target keys, some adjacent and other keys, overlapping and unreleased presses and equal timestamps."""
+    rng = np.random.default_rng(seed)
+    layout = B.getLayout(layout)
+    others = [k for k in range(30, 100) if k not in layout.targets and k not in layout.adjacent]
+    events = [(0, 0, others[0])]
+    t, n = int(rng.integers(10, 300)), 0
+    while t < duration:
+        r = rng.random()
+        if r < 0.85:
+            key, n = layout.targets[n % len(layout.targets)], n + 1
+        elif r < 0.93:
+            key = int(rng.choice(layout.adjacent))
+        else:
+            key = int(rng.choice(others))
+        events.append((t, 0, key))
+        if rng.random() > 0.02:
+            events.append((t + int(rng.integers(3, 25)) * 10, 1, key))
+        t += int(rng.integers(6, 40)) * 10
+    events.sort(key=lambda event: event[0])
+    if unsorted:
+        for i in rng.integers(1, len(events) - 1, 20):
+            events[i], events[i + 1] = events[i + 1], events[i]
+    return [{'k': k, 'p': p, 'e': e} for e, p, k in events]
+
+
+# Removed keyboard implementation (lists of {'k', 'p', 'e'} dictionaries)
+
+def reference_flight_times(datalist, target1, target2, time, starttime=0):
+    targets = (target1, target1 if target2 is None else target2)
+    ft = []
+    nrOfErrors = 0
+    start = datalist[0]['e'] + starttime
+    end = start + time
+    i = 0
+    while (datalist[i]['p'] != 1 or datalist[i]['k'] not in targets or datalist[i]['e'] < start):
+        if datalist[i]['k'] not in targets:
+            nrOfErrors = nrOfErrors + 1
+        i = i + 1
+        if (i > len(datalist) - 1):
+            return [], 0
+    currentTargetKey = datalist[i]['k']
+    currentKeyTime = datalist[i]['e']
+    for d in datalist[i + 1:]:
+        nextTargetKey = target1 if target2 is None else B.getOtherTargetKey(target1, target2, currentTargetKey)
+        if (d['p'] == 0 and d['e'] < end):
+            if (d['k'] == nextTargetKey):
+                ft.append(d['e'] - currentKeyTime)
+                currentTargetKey = d['k']
+                currentKeyTime = d['e']
+            elif d['k'] not in targets:
+                nrOfErrors = nrOfErrors + 1
+        elif (d['p'] == 1 and d['e'] < end):
+            if (d['k'] == currentTargetKey):
+                currentKeyTime = d['e']
+            elif d['k'] not in targets:
+                nrOfErrors = nrOfErrors + 1
+    return ft, nrOfErrors
+
+
+def make_subject():
+    tests = [make_events(10 + i, layout) for i, (layout, _) in enumerate(B.SUBJECT_TESTS.values())]
+    return B.Subject("S01", 0, "yes", 1, 10, 1.0, 2.0, np.nan, 1.0, 2.0, 3.0, "serial", "right", 5, *tests)
+
+
+def make_session(seed, hand='right', side=1):
+    """Session file of the keyboard tests with the clinical data of a subject."""
+    return {'typist': 'yes', 'side': side, 'years': 10, 'UPDRS-3_4a': 1, 'UPDRS-3_4b': 2, 'UPDRS-3_5a': 1, 'UPDRS-3_5b': 2,
+            'UPDRS-3_6a': 2, 'UPDRS-3_6b': 3, 'serial': 'serial', 'hand': hand, 'tm': 5,
+            'd': {str(i): make_events(seed + i, layout) for i, (layout, _) in enumerate(B.SUBJECT_TESTS.values())}}
+
+
+def write_session(filename, seed=0, hand='right', side=1):
+    with open(filename, "w") as f:
+        B.json.dump(make_session(seed, hand, side), f)
+    return filename
+
+
+def make_sensor_data(n=6000, fs=200.0, unsorted=False, seed=0):
+    rng = np.random.default_rng(seed)
+    timestamps = np.round(np.arange(n) / fs, 4)
+    timestamps[100] = timestamps[101]
+    timestamps[2000:2003] = timestamps[2000]
+    if unsorted:
+        timestamps[n // 2:n // 2 + 50] = timestamps[n // 2:n // 2 + 50][::-1]
+    record = np.empty((1, 2), dtype=[(name, 'O') for name in "abcde"])
+    for j in range(2):
+        record[0, j] = (0, 0, np.array([[fs]]), rng.standard_normal((n, 3)), timestamps.reshape(-1, 1))
+    return {"sensorData": record}
+
+
+def make_gyro_data(start, end, seed=0, fs=200.0):
+    """Wearable sensor recording from start to end: pronation/supination at about 1.5 Hz with a decrement, noise and pauses."""
+    rng = np.random.default_rng(seed)
+    timestamps = np.round(start + np.arange(int((end - start) * fs)) / fs, 4)
+    t = timestamps - start
+    gyro = rng.normal(0, 5, (len(t), 3))
+    gyro[:, 1] += 200 * (1 - 0.02 * t) * np.sin(2 * np.pi * rng.uniform(1.2, 1.8) * t)
+    for pause in rng.uniform(0, t[-1] - 1, 3):
+        gyro[(t > pause) & (t < pause + 0.6), 1] *= 0.05
+    record = np.empty((1, 2), dtype=[(name, 'O') for name in "abcde"])
+    for j in range(2):
+        record[0, j] = (0, 0, np.array([[fs]]), gyro, timestamps.reshape(-1, 1))
+    return {"sensorData": record}
+
+
+def make_header(i, location):
+    return {"deviceID": np.uint32(100 + i), "deviceType": np.uint8(2), "bodyLocation": location, "firmwareVersion": "2.%d" % i,
+            "startDate": np.array([[2020., 1, 1 + i, 10, 0, 0.5]]), "baseFrequency": np.uint16(1000),
+            "sensors": {"acc": {"x": 1.0}, "gyro": {"scale": np.float64(2000.0), "sensorID": np.uint8(3), "FS": np.float64(200.0),
+                                                    "dataPayload": np.uint8(6), "calib": np.array([[1.5, np.nan, 3.0]]), "nbSamples": np.int32(240000)}},
+            "stopDate": np.array([[2020., 1, 1 + i, 10, 20, 0]]), "measureID": np.int16(7 + i)}
+
+
+# subject ids of timeslots.csv with handedness and affected side of every group and side
+WEAR_SUBJECTS = [("HC01", "right", 1), ("CA01", "left", 2), ("PD01_OFF", "left", 1), ("PD01_ON", "right", 3), ("HC08", "right", 0)]
+
+
+def write_wear_cohort(directory, subjects):
+    """Keyboard sessions, wearable sensor recordings covering all time slots of timeslots.csv and headers of (subject id, handedness, side) in directory/Data and directory/SensorData; returns the manifest."""
+    data_dir, sensor_dir = directory / "Data", directory / "SensorData"
+    data_dir.mkdir()
+    sensor_dir.mkdir()
+    for i, (subject_id, hand, side) in enumerate(subjects):
+        write_session(str(data_dir / (subject_id + ".txt")), seed=10 * i, hand=hand, side=side)
+        for j, wrist in enumerate(["LW", "RW"]):
+            starts, ends = timeslots.lookupTimeslots([subject_id] * 2, wrist, ["full", "10_seconds"])
+            sio.savemat(str(sensor_dir / (subject_id + "_" + wrist + "_sensorData.mat")), make_gyro_data(starts.min() - 1, ends.max() + 1, seed=2 * i + j))
+            sio.savemat(str(sensor_dir / (subject_id + "_" + wrist + "_header.mat")), {"header": make_header(2 * i + j, wrist)})
+    return cohort.scanCohort(str(data_dir), str(sensor_dir))
+
+
+def make_integral(n=4000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n) / 200.0
+    y = np.sin(2 * np.pi * 1.5 * x) * (1 + 0.3 * rng.standard_normal(n)) + 0.05 * rng.standard_normal(n)
+    return x, y
+
+
+# Removed wearable implementations
+
+def reference_F(x, y):
+    integral = np.array([])
+    old = 0.0
+    for velocity in y:
+        integral = np.append(integral, old + np.diff(x)[0] * velocity)
+        old = old + np.diff(x)[0] * velocity
+    return integral
+
+
+def reference_amplitudes(x, integral, maxi, mini):
+    absAmp = np.array([])
+    durations = np.array([])
+    while (mini.size != 0 and maxi.size != 0):
+        if (min(mini) < min(maxi)):
+            absAmp = np.append(absAmp, integral[mini[0]] - integral[maxi[0]])
+            durations = np.append(durations, x[maxi[0]] - x[mini[0]])
+            mini = mini[1:]
+        else:
+            absAmp = np.append(absAmp, integral[maxi[0]] - integral[mini[0]])
+            durations = np.append(durations, x[mini[0]] - x[maxi[0]])
+            maxi = maxi[1:]
+    return absAmp, durations
+
+
+def reference_hesitations(CSA_T, threshold, main_freq, dt):
+    steps = int(((1 / float(main_freq)) / dt) / 3)
+    counter = 0
+    i = 0
+    for e in CSA_T < threshold:
+        if e:
+            i = i + 1
+        else:
+            if (i > steps):
+                counter = counter + 1
+            i = 0
+    return counter
+
+
+def reference_cwt(data, widths, w):
+    # scipy.signal.cwt(data, scipy.signal.morlet2, widths, w=w) of SciPy < 1.15
+    output = np.empty((len(widths), len(data)), dtype=np.complex128)
+    for ind, width in enumerate(widths):
+        M = np.min([10 * width, len(data)])
+        x = (np.arange(0, M) - (M - 1.0) / 2) / width
+        wavelet = np.sqrt(1 / width) * np.exp(1j * w * x) * np.exp(-0.5 * x**2) * np.pi**(-0.25)
+        output[ind] = scipy.signal.convolve(data, np.conj(wavelet[::-1]), mode='same', method='direct')
+    return output
+
+
+def reference_sensor_data(data, start, end):
+    def find_nearest(array, value):
+        idx = np.searchsorted(array, value, side="left")
+        if idx > 0 and (idx == len(array) or math.fabs(value - array[idx - 1]) < math.fabs(value - array[idx])):
+            return array[idx - 1]
+        return array[idx]
+    gyro_data = data['sensorData'][0][1][3]
+    gyro_timestamps = np.concatenate(data['sensorData'][0][1][4]).ravel()
+    start_index = np.where(gyro_timestamps == find_nearest(gyro_timestamps, start))[0][0]
+    end_index = np.where(gyro_timestamps == find_nearest(gyro_timestamps, end))[0][0]
+    return gyro_data[start_index:end_index, 1:3], gyro_timestamps[start_index:end_index]
@@ -0,0 +1,90 @@
+"""
+Cohort manifest built by scanning the data directories.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cohort
+
+
+def touch(path, size=1):
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    # relative directories, as the default Data and SensorData
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("Data")
+    os.mkdir("SensorData")
+    for subject_id in ["HC01", "PD01_OFF", "PD01_ON", "CA02", "HC10"]:
+        touch(tmp_path / "Data" / (subject_id + ".txt"))
+    for subject_id in ["HC01", "PD01_ON"]:
+        for wrist in ["LW", "RW"]:
+            touch(tmp_path / "SensorData" / (subject_id + "_" + wrist + "_sensorData.mat"), 10)
+            touch(tmp_path / "SensorData" / (subject_id + "_" + wrist + "_header.mat"), 2)
+    # only one sensor file, a sensor session without keyboard test and files that are no sessions
+    touch(tmp_path / "SensorData" / "CA02_LW_sensorData.mat")
+    touch(tmp_path / "SensorData" / "CA03_LW_header.mat")
+    touch(tmp_path / "Data" / "PD02.txt")
+    touch(tmp_path / "Data" / "notes.txt")
+    return tmp_path
+
+
+def test_groups():
+    assert [cohort.getGroup(subject_id) for subject_id in ["PD01_OFF", "PD12_ON", "PD01", "HC08", "CA59", "XY01", "HC08_OFF"]] == ["PD_OFF", "PD_ON", None, "HC", "CA", None, "HC"]
+
+
+def test_scan(dirs):
+    manifest = cohort.scanCohort()
+    assert list(manifest.columns) == cohort.getManifestColumns()
+    # in the loading order of the groups, by subject id within a group
+    assert manifest["subject_id"].tolist() == ["PD01_OFF", "PD01_ON", "HC01", "HC10", "CA02", "CA03"]
+    assert manifest["diagnosis"].tolist() == [0, 1, 3, 3, 2, 2]
+    assert manifest["patient"].tolist() == ["PD01", "PD01", "HC01", "HC10", "CA02", "CA03"]
+    assert manifest["session"].tolist() == ["OFF", "ON", "", "", "", ""]
+    # the paths of the keyboard loader (Data/<subject id>.txt)
+    assert manifest["data_path"].tolist() == [os.path.join("Data", subject_id + ".txt") for subject_id in ["PD01_OFF", "PD01_ON", "HC01", "HC10", "CA02"]] + [""]
+    row = manifest.set_index("subject_id").loc["HC01"]
+    assert row["sensor_RW_path"] == os.path.join("SensorData", "HC01_RW_sensorData.mat")
+    assert row["sensor_RW_size"] == 10 and row["header_LW_size"] == 2
+    assert row["sensor_LW_mtime"] == os.path.getmtime(row["sensor_LW_path"])
+    row = manifest.set_index("subject_id").loc["CA02"]
+    assert row["sensor_RW_path"] == "" and np.isnan(row["sensor_RW_size"]) and np.isnan(row["sensor_RW_mtime"])
+    assert cohort.getManifestPaths(manifest)["PD01_ON"] == cohort.getSessionPaths("PD01_ON")
+
+
+def test_filter(dirs):
+    manifest = cohort.scanCohort()
+    assert cohort.filterManifest(manifest, groups=["HC", "CA"])["subject_id"].tolist() == ["HC01", "HC10", "CA02", "CA03"]
+    assert cohort.filterManifest(manifest, ids=["HC10", "PD01_OFF", "XY"])["subject_id"].tolist() == ["PD01_OFF", "HC10"]
+    assert cohort.filterManifest(manifest, keyboard=True)["subject_id"].tolist() == ["PD01_OFF", "PD01_ON", "HC01", "HC10", "CA02"]
+    assert cohort.filterManifest(manifest, keyboard=True, sensors=True)["subject_id"].tolist() == ["PD01_ON", "HC01"]
+
+    later = max(os.path.getmtime(os.path.join("Data", name)) for name in os.listdir("Data")) + 100
+    os.utime(os.path.join("Data", "HC10.txt"), (later, later))
+    changed = cohort.scanCohort()
+    assert cohort.filterManifest(changed, changed_since=later - 1)["subject_id"].tolist() == ["HC10"]
+    assert cohort.filterManifest(changed, changed_since=pd.Timestamp(later - 1, unit="s"))["subject_id"].tolist() == ["HC10"]
+
+
+def test_filter_previous(dirs, tmp_path):
+    previous = str(tmp_path / "manifest.csv")
+    cohort.saveManifest(cohort.scanCohort(), previous)
+    assert cohort.filterManifest(cohort.scanCohort(), previous=previous).empty
+    # a new session, a changed file and a new file of a session
+    touch(tmp_path / "Data" / "HC11.txt")
+    touch(tmp_path / "Data" / "CA02.txt", 5)
+    touch(tmp_path / "SensorData" / "HC10_LW_header.mat")
+    assert cohort.filterManifest(cohort.scanCohort(), previous=previous)["subject_id"].tolist() == ["HC10", "HC11", "CA02"]
+
+
+def test_save_load(dirs, tmp_path):
+    manifest = cohort.scanCohort()
+    filename = str(tmp_path / "manifest.csv")
+    cohort.saveManifest(manifest, filename)
+    pd.testing.assert_frame_equal(cohort.loadManifest(filename), manifest, check_dtype=False)
@@ -0,0 +1,175 @@
+"""
+Parallel evaluation of Evaluator against the serial runs, and the
+checkpointed evaluation against an uninterrupted one.
+"""
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import balanced_accuracy_score
+
+from Key2PD import Key2PD
+import evaluator
+from evaluator import Evaluator, evaluate_run, get_fingerprint, read_scores, summarize_scores, SCORE_COLUMNS
+
+
+class CentroidClassifier:
+    """Nearest centroid classifier with the fit_predict interface of Classifier; the scores depend on the exact split."""
+
+    def get_params(self):
+        return {}
+
+    def fit_predict(self, X_train, y_train, X_test, y_test):
+        labels = np.unique(y_train)
+        centroids = np.stack([X_train[y_train == label].mean(axis=0) for label in labels])
+
+        def predict(X):
+            return labels[np.argmin(((X[:, np.newaxis, :] - centroids) ** 2).sum(axis=2), axis=1)]
+
+        BCA_train = balanced_accuracy_score(y_train, predict(X_train))
+        BCA_test = balanced_accuracy_score(y_test, predict(X_test))
+        # checksum and size of the test set stand in for the AUC, so that a different split changes them
+        return BCA_train, BCA_test, float(X_test.sum()), float(len(y_test))
+
+
+def make_dataset(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    data = Key2PD.__new__(Key2PD)
+    data.y = np.repeat([0, 1, 2], n // 3)
+    data.X = rng.standard_normal((n, 4)) + data.y[:, np.newaxis]
+    return data
+
+
+def test_evaluate_run_matches_split():
+    data = make_dataset()
+    scores = evaluate_run(CentroidClassifier(), data.X, data.y, 3, test_size=0.4)
+    X_train, X_test, y_train, y_test = data.split(random_state=3, test_size=0.4)
+    assert scores == dict(zip(['BCA_train', 'BCA_test', 'mAUC_train', 'mAUC_test'], CentroidClassifier().fit_predict(X_train, y_train, X_test, y_test)))
+
+
+@pytest.mark.parametrize("test_size", [0.2, 0.4])
+def test_parallel_matches_serial(test_size):
+    serial = Evaluator(CentroidClassifier(), make_dataset(), n_runs=4, test_size=test_size)
+    serial.evaluate()
+    parallel = Evaluator(CentroidClassifier(), make_dataset(), n_runs=4, n_jobs=2, test_size=test_size)
+    parallel.evaluate()
+    assert serial.get_scores().equals(parallel.get_scores())
+    assert (serial.get_scores()['mAUC_test'] == round(60 * test_size)).all()
+    # both modes leave the split of the last run on the dataset
+    reference = make_dataset().split(random_state=3, test_size=test_size)
+    for evaluator in [serial, parallel]:
+        for name, split in zip(['X_train', 'X_test', 'y_train', 'y_test'], reference):
+            np.testing.assert_array_equal(getattr(evaluator.data, name), split)
+
+
+def test_import_without_key2pd():
+    # the evaluator needs neither Key2PD with its feature pipeline nor the classifier
+    code = "import sys, evaluator; assert not {'Key2PD', 'Bradykinesia', 'classifier'} & set(sys.modules)"
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(evaluator.__file__)), check=True)
+
+
+# Checkpointed evaluation
+
+def read_log(filename):
+    return pd.read_csv(filename, dtype={'name': str, 'fingerprint': str}, float_precision='round_trip')
+
+
+def test_checkpoint_resume_matches_uninterrupted(tmp_path):
+    checkpoint = str(tmp_path / "scores.csv")
+    uninterrupted = Evaluator(CentroidClassifier(), make_dataset(), n_runs=5, test_size=0.4)
+    uninterrupted.evaluate()
+    # interrupted after 3 runs in serial mode, resumed in parallel mode
+    Evaluator(CentroidClassifier(), make_dataset(), n_runs=3, test_size=0.4, checkpoint=checkpoint).evaluate()
+    resumed = Evaluator(CentroidClassifier(), make_dataset(), n_runs=5, n_jobs=2, test_size=0.4, checkpoint=checkpoint)
+    assert sorted(resumed.load_checkpoint()) == [0, 1, 2]
+    resumed.evaluate()
+    assert resumed.get_scores().equals(uninterrupted.get_scores())
+    # every run is logged once
+    assert read_log(checkpoint)['run'].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_checkpoint_runs_are_not_repeated(tmp_path):
+    checkpoint = str(tmp_path / "scores.csv")
+    first = Evaluator(CentroidClassifier(), make_dataset(), n_runs=3, checkpoint=checkpoint)
+    first.evaluate()
+    class UnusedClassifier(CentroidClassifier):
+        def fit_predict(self, X_train, y_train, X_test, y_test):
+            raise AssertionError("run evaluated again")
+
+    again = Evaluator(UnusedClassifier(), make_dataset(), n_runs=3, checkpoint=checkpoint)
+    again.fingerprint = first.fingerprint
+    again.evaluate()
+    assert again.get_scores().equals(first.get_scores())
+    assert len(read_log(checkpoint)) == 3
+
+
+def test_checkpoint_fingerprint_mismatch(tmp_path):
+    checkpoint = str(tmp_path / "scores.csv")
+    Evaluator(CentroidClassifier(), make_dataset(), n_runs=2, checkpoint=checkpoint).evaluate()
+    for evaluator in [Evaluator(CentroidClassifier(), make_dataset(), n_runs=2, test_size=0.4, checkpoint=checkpoint),
+                      Evaluator(CentroidClassifier(), make_dataset(seed=1), n_runs=2, checkpoint=checkpoint),
+                      Evaluator(CentroidClassifier(), make_dataset(), n_runs=2, checkpoint=checkpoint, name='other')]:
+        assert evaluator.load_checkpoint() == {}
+    assert len({evaluator.fingerprint for evaluator in [Evaluator(CentroidClassifier(), make_dataset(), checkpoint=checkpoint),
+                                                         Evaluator(CentroidClassifier(), make_dataset(), test_size=0.4, checkpoint=checkpoint),
+                                                         Evaluator(CentroidClassifier(), make_dataset(seed=1), checkpoint=checkpoint)]}) == 3
+
+
+def test_fingerprint_without_get_params_warns():
+    class Plain:
+        pass
+
+    data = make_dataset()
+    with pytest.warns(UserWarning, match="get_params"):
+        get_fingerprint(Plain(), data.X, data.y, 0.2)
+
+
+@pytest.mark.parametrize("partial", ["", "n", ",3,abc,0.5,0.2", ",3,abc,0.5,0.25,0.75,0.12"])
+def test_checkpoint_partial_row(tmp_path, partial):
+    checkpoint = str(tmp_path / "scores.csv")
+    uninterrupted = Evaluator(CentroidClassifier(), make_dataset(), n_runs=3)
+    uninterrupted.evaluate()
+    first = Evaluator(CentroidClassifier(), make_dataset(), n_runs=2, checkpoint=checkpoint)
+    first.evaluate()
+    # a row cut off by a crash while it was written
+    with open(checkpoint, 'a') as f:
+        f.write(partial)
+    with open(checkpoint) as f:
+        before = f.read()
+    resumed = Evaluator(CentroidClassifier(), make_dataset(), n_runs=3, checkpoint=checkpoint)
+    assert sorted(resumed.load_checkpoint()) == [0, 1]
+    assert len(pd.concat(read_scores(checkpoint))) == 2
+    # reading does not modify the log
+    with open(checkpoint) as f:
+        assert f.read() == before
+    resumed.evaluate()
+    assert resumed.get_scores().equals(uninterrupted.get_scores())
+    log = read_log(checkpoint)
+    assert log['run'].tolist() == [0, 1, 2]
+    assert not log[SCORE_COLUMNS].isna().any().any()
+
+
+def test_checkpoint_partial_header(tmp_path):
+    checkpoint = str(tmp_path / "scores.csv")
+    with open(checkpoint, 'w') as f:
+        f.write("name,ru")
+    evaluator = Evaluator(CentroidClassifier(), make_dataset(), n_runs=2, checkpoint=checkpoint)
+    evaluator.evaluate()
+    assert read_log(checkpoint)['run'].tolist() == [0, 1]
+
+
+def test_summarize_scores(tmp_path):
+    filenames = [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]
+    Evaluator(CentroidClassifier(), make_dataset(), n_runs=5, checkpoint=filenames[0], name='a').evaluate()
+    Evaluator(CentroidClassifier(), make_dataset(), n_runs=3, test_size=0.4, checkpoint=filenames[0], name='a').evaluate()
+    Evaluator(CentroidClassifier(), make_dataset(seed=1), n_runs=4, checkpoint=filenames[1], name='b').evaluate()
+    summary = summarize_scores(filenames, chunksize=2)
+    logs = pd.concat([read_log(filename) for filename in filenames])
+    groups = logs.groupby(['name', 'fingerprint'])[SCORE_COLUMNS]
+    assert summary['count'].equals(groups.count())
+    pd.testing.assert_frame_equal(summary['mean'], groups.mean(), rtol=1e-12)
+    pd.testing.assert_frame_equal(summary['std'], groups.std(), rtol=1e-9)
+    assert summarize_scores([]).empty
@@ -0,0 +1,62 @@
+"""
+On-disk feature cache of the keyboard subjects against computing the
+features again.
+"""
+import os
+
+import numpy as np
+import pytest
+
+import Bradykinesia as B
+from helpers import make_subject, write_session
+
+
+def assert_same_subject(s, reference):
+    assert set(vars(s)) == set(vars(reference))
+    for name, value in vars(reference).items():
+        if isinstance(value, B.KeyEvents):
+            for column in "kpe":
+                np.testing.assert_array_equal(getattr(getattr(s, name), column), getattr(value, column))
+        else:
+            assert type(getattr(s, name)) == type(value), name
+            np.testing.assert_array_equal(getattr(s, name), value)
+
+
+def test_round_trip(tmp_path):
+    s = make_subject().precompute()
+    path = str(tmp_path / "s.npz")
+    B.saveCachedSubject(s, path)
+    assert_same_subject(B.loadCachedSubject(path), s)
+    assert B.loadCachedSubject(str(tmp_path / "missing.npz")) is None
+
+
+def test_cached_subject_matches_computed(tmp_path):
+    filename = write_session(str(tmp_path / "HC01.txt"))
+    cache_dir = str(tmp_path / "cache")
+    computed = B.createSubjectFromData(filename).precompute()
+    first = B.createSubjectFromData(filename, cache_dir)
+    assert os.listdir(cache_dir) == [B.getCacheKey(filename) + ".npz"]
+    second = B.createSubjectFromData(filename, cache_dir)
+    assert_same_subject(first, computed)
+    assert_same_subject(second, computed)
+
+
+def test_changed_file_is_computed_again(tmp_path):
+    filename = write_session(str(tmp_path / "HC01.txt"))
+    cache_dir = str(tmp_path / "cache")
+    B.createSubjectFromData(filename, cache_dir)
+    write_session(filename, seed=1)
+    assert_same_subject(B.createSubjectFromData(filename, cache_dir), B.createSubjectFromData(filename).precompute())
+    assert len(os.listdir(cache_dir)) == 2
+    # the diagnosis is part of the key as well
+    assert B.getCacheKey(filename, 0) != B.getCacheKey(filename)
+
+
+def test_unwritable_cache_warns(tmp_path):
+    filename = write_session(str(tmp_path / "HC01.txt"))
+    cache_dir = tmp_path / "cache"
+    # a file where the cache directory should be
+    cache_dir.write_text("")
+    with pytest.warns(UserWarning, match="Could not cache"):
+        s = B.createSubjectFromData(filename, str(cache_dir))
+    assert_same_subject(s, B.createSubjectFromData(filename).precompute())
@@ -0,0 +1,78 @@
+"""
+Header index of the wearable sensor headers against parsing the .mat files.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import scipy.io as sio
+
+import Wear4PD as W
+import headerindex
+from helpers import make_header
+
+
+def write_headers(directory, keys):
+    filenames = []
+    for i, (subject_id, wrist) in enumerate(keys):
+        filenames.append(str(directory / (subject_id + "_" + wrist + "_header.mat")))
+        sio.savemat(filenames[-1], {"header": make_header(i, wrist)})
+    return filenames
+
+
+def assert_same_header(header, reference):
+    for field in headerindex.HEADER_FIELDS:
+        assert type(header[field]) == type(reference[field]), field
+        assert np.asarray(header[field]).dtype == np.asarray(reference[field]).dtype, field
+        np.testing.assert_array_equal(header[field], reference[field])
+
+
+def test_header_index_round_trip(tmp_path):
+    filenames = write_headers(tmp_path, [("HC01", "LW"), ("HC01", "RW"), ("PD01_OFF", "LW")])
+    index = headerindex.scanHeaders(str(tmp_path))
+    assert len(index) == 3
+    for filename in filenames:
+        assert_same_header(headerindex.readHeader(filename), headerindex.createHeaderDict(sio.loadmat(filename)))
+
+    # empty strings stay empty strings
+    header = headerindex.createHeaderDict(sio.loadmat(filenames[0]))
+    header["firmwareVersion"] = np.str_("")
+    row = {"subject_id": "HC01", "wrist": "LW", "path": filenames[0], "size": 1, "mtime": 1.0}
+    row.update(headerindex.headerToRow(header))
+    pd.DataFrame([row], columns=headerindex.getIndexColumns()).to_csv(tmp_path / "index.csv", index=False)
+    assert_same_header(headerindex.rowToHeader(headerindex.loadHeaderIndex(str(tmp_path / "index.csv")).iloc[0]), header)
+
+
+def test_header_index_refresh(tmp_path):
+    filenames = write_headers(tmp_path, [("HC01", "LW"), ("HC01", "RW"), ("CA01", "LW")])
+    index = headerindex.scanHeaders(str(tmp_path))
+    assert list(index["subject_id"]) == ["CA01", "HC01", "HC01"] and list(index["wrist"]) == ["LW", "LW", "RW"]
+    # a changed file is parsed again, a deleted file is dropped and a file that is not a header is ignored
+    sio.savemat(filenames[0], {"header": make_header(5, "LW")})
+    os.utime(filenames[0], (os.path.getmtime(filenames[0]) + 10,) * 2)
+    os.remove(filenames[2])
+    sio.savemat(str(tmp_path / "notes_header.mat"), {"header": make_header(6, "LW")})
+    index = headerindex.scanHeaders(str(tmp_path))
+    assert list(index["path"]) == [os.path.normpath(filename) for filename in filenames[:2]]
+    assert_same_header(headerindex.readHeader(filenames[0]), headerindex.createHeaderDict(sio.loadmat(filenames[0])))
+    assert headerindex.readHeader(filenames[0])["deviceID"] == 105
+    # a file changed after the index was built is read from the .mat file
+    sio.savemat(filenames[1], {"header": make_header(7, "RW")})
+    os.utime(filenames[1], (os.path.getmtime(filenames[1]) + 20,) * 2)
+    assert headerindex.readHeader(filenames[1])["deviceID"] == 107
+
+
+def test_filter_headers(tmp_path):
+    write_headers(tmp_path, [("HC01", "LW"), ("HC01", "RW"), ("CA01", "LW")])
+    index = headerindex.scanHeaders(str(tmp_path))
+    selected = headerindex.filterHeaders(index, deviceID=[100, 102])
+    assert list(selected["subject_id"]) == ["CA01", "HC01"] and list(selected["wrist"]) == ["LW", "LW"]
+    assert list(headerindex.filterHeaders(index, wrist=["RW"], firmwareVersion=["2.1"])["subject_id"]) == ["HC01"]
+    assert headerindex.filterHeaders(index, firmwareVersion=["3.0"]).empty
+
+
+def test_wear_header_matches_mat(tmp_path):
+    # Wear4PD reads the headers of createSubjectFromData through the index
+    filename = write_headers(tmp_path, [("HC01", "LW")])[0]
+    headerindex.scanHeaders(str(tmp_path))
+    assert_same_header(W.readHeader(filename), headerindex.createHeaderDict(sio.loadmat(filename)))
@@ -0,0 +1,65 @@
+"""
+Hesitation/halt detection for several thresholds against the removed
+per-threshold loop over the samples.
+"""
+import numpy as np
+import pytest
+
+import Wear4PD as W
+from helpers import reference_hesitations
+
+
+def make_CSA(seed, n=3000):
+    rng = np.random.default_rng(seed)
+    return np.convolve(rng.random(n), np.ones(40) / 40, mode='same') * 100
+
+
+def reference_events(CSA_T, threshold, main_freq, dt):
+    # brute-force runs below the threshold, including a run that lasts until the end
+    steps = int(((1 / float(main_freq)) / dt) / 3)
+    events = []
+    start = None
+    for i, value in enumerate(list(CSA_T) + [np.inf]):
+        if value < threshold and start is None:
+            start = i
+        elif value >= threshold and start is not None:
+            if i - start > steps:
+                events.append((start, i, threshold - min(CSA_T[start:i])))
+            start = None
+    return events
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_hesitations(seed):
+    CSA_T = make_CSA(seed)
+    thresholds = [0.5 * np.mean(CSA_T), 0.25 * np.mean(CSA_T), 0.9 * np.mean(CSA_T)]
+    counts, events = W.detectHesitationsFreezing(CSA_T, thresholds, 1.3, 0.005, legacy=True)
+    assert counts == [reference_hesitations(CSA_T, threshold, 1.3, 0.005) for threshold in thresholds]
+    assert W.findHesitationsFreezing(CSA_T, thresholds[0], 1.3, 0.005) == counts[0]
+    assert len(events) == sum(counts)
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_hesitation_events(seed):
+    CSA_T = make_CSA(seed)
+    # a run below the thresholds until the end of the signal
+    CSA_T[-200:] = 0
+    thresholds = [0.5 * np.mean(CSA_T), 0.9 * np.mean(CSA_T)]
+    counts, events = W.detectHesitationsFreezing(CSA_T, thresholds, 1.3, 0.005, t0=2.0)
+    legacy_counts, _ = W.detectHesitationsFreezing(CSA_T, thresholds, 1.3, 0.005, t0=2.0, legacy=True)
+    assert [count - 1 for count in counts] == legacy_counts
+    for threshold, count in zip(thresholds, counts):
+        rows = events[events['threshold'] == threshold]
+        reference = reference_events(CSA_T, threshold, 1.3, 0.005)
+        assert len(rows) == len(reference) == count
+        np.testing.assert_allclose(rows['start'], [2.0 + start * 0.005 for start, _, _ in reference])
+        np.testing.assert_allclose(rows['end'], [2.0 + end * 0.005 for _, end, _ in reference])
+        np.testing.assert_allclose(rows['duration'], [(end - start) * 0.005 for start, end, _ in reference])
+        np.testing.assert_allclose(rows['depth'], [depth for _, _, depth in reference])
+
+
+def test_no_hesitations():
+    CSA_T = np.ones(500)
+    counts, events = W.detectHesitationsFreezing(CSA_T, [0.5, 0.25], np.array([1.3]), 0.005)
+    assert counts == [0, 0]
+    assert events.empty and list(events.columns) == ['threshold', 'start', 'end', 'duration', 'depth']
@@ -0,0 +1,28 @@
+"""
+Vectorized integration of the angular velocities against the removed
+per-sample loop and the SciPy integration rules.
+"""
+import numpy as np
+import pytest
+import scipy.integrate
+
+import Wear4PD as W
+from helpers import make_integral, reference_F
+
+
+def test_rectangle_matches_loop():
+    x, y = make_integral()
+    np.testing.assert_array_equal(W.F(x, y), reference_F(x, y))
+    np.testing.assert_array_equal(W.F(list(x[:10]), list(y[:10])), reference_F(x[:10], y[:10]))
+    assert len(W.F(x[:0], y[:0])) == 0
+
+
+def test_rules():
+    x, y = make_integral()
+    np.testing.assert_allclose(W.F(x, y, "trapezoid"), scipy.integrate.cumulative_trapezoid(y, dx=x[1] - x[0], initial=0), rtol=1e-12, atol=1e-12)
+    jittered = x + np.random.default_rng(0).uniform(0, 0.002, len(x))
+    np.testing.assert_allclose(W.F(jittered, y, "trapezoid", uniform=False), scipy.integrate.cumulative_trapezoid(y, jittered, initial=0), rtol=1e-12, atol=1e-12)
+    dx = np.diff(jittered, prepend=2 * jittered[0] - jittered[1])
+    np.testing.assert_allclose(W.F(jittered, y, "rectangle", uniform=False), np.cumsum(dx * y), rtol=1e-12, atol=1e-12)
+    with pytest.raises(ValueError):
+        W.F(x, y, "simpson")
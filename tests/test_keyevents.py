@@ -0,0 +1,56 @@
+"""
+Columnar key events against the lists of {'k', 'p', 'e'} dictionaries.
+"""
+import pickle
+
+import numpy as np
+import pytest
+
+import Bradykinesia as B
+from helpers import make_events
+
+
+def test_round_trip():
+    datalist = make_events(0, "QP")
+    events = B.KeyEvents.fromList(datalist)
+    assert len(events) == len(datalist)
+    assert events.toList() == datalist
+    assert events.columns() == ([d['k'] for d in datalist], [d['p'] for d in datalist], [d['e'] for d in datalist])
+    # the lists are not kept next to the arrays
+    assert events.columns()[0] is not events.columns()[0]
+    assert not hasattr(events, "__dict__")
+
+
+def test_pickle():
+    events = B.KeyEvents.fromList(make_events(0, "MN"))
+    copy = pickle.loads(pickle.dumps(events))
+    for column in "kpe":
+        np.testing.assert_array_equal(getattr(copy, column), getattr(events, column))
+    assert copy.toList() == events.toList()
+
+
+def test_as_key_events():
+    datalist = make_events(0, "M")
+    events = B.asKeyEvents(datalist)
+    assert B.asKeyEvents(events) is events
+    assert B.asKeyEvents((events.k, events.p, events.e)).toList() == datalist
+
+
+@pytest.mark.parametrize("layout", ["QP", "MN", "M"])
+def test_features_of_lists_and_columns(layout):
+    datalist = make_events(1, layout, unsorted=True)
+    events = B.KeyEvents.fromList(datalist)
+    targets = B.getLayout(layout).targets
+    target2 = targets[1] if len(targets) > 1 else None
+    assert B.computeWindowFeatures(events, layout, [10000, 60000]) == B.computeWindowFeatures(datalist, layout, [10000, 60000])
+    assert B.computeDwellTimes(events, targets[0], 30000, target2) == B.computeDwellTimes(datalist, targets[0], 30000, target2)
+    assert B.computeVelocityScore(targets[0], events, target2) == B.computeVelocityScore(targets[0], datalist, target2)
+
+
+def test_subject_row_has_lists():
+    # the test columns of Subjects.df keep the {'k', 'p', 'e'} dictionaries of the JSON files
+    tests = [make_events(10 + i, layout) for i, (layout, _) in enumerate(B.SUBJECT_TESTS.values())]
+    s = B.Subject("S01", 0, "yes", 1, 10, 1.0, 2.0, np.nan, 1.0, 2.0, 3.0, "serial", "right", 5, *tests)
+    assert s.toRow()[10:16] == tests
+    df = s.toDataframe()
+    assert [df[test][0] for test in B.SUBJECT_TESTS] == tests
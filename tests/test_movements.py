@@ -0,0 +1,53 @@
+"""
+Vectorized movement segmentation against the removed extrema merge loop.
+"""
+import numpy as np
+import pytest
+from scipy.signal import argrelextrema
+
+import Wear4PD as W
+from helpers import make_integral, reference_amplitudes, reference_F
+
+
+def test_segment_movements():
+    x, y = make_integral()
+    integral = W.F(x, y)
+    (maxi,), (mini,) = argrelextrema(integral, np.greater, order=50), argrelextrema(integral, np.less, order=50)
+    amplitudes, durations, starts, ends = W.segmentMovements(x, integral, maxi, mini)
+    ref_amplitudes, ref_durations = reference_amplitudes(x, integral, maxi, mini)
+    np.testing.assert_array_equal(amplitudes, ref_amplitudes)
+    np.testing.assert_array_equal(durations, ref_durations)
+    np.testing.assert_array_equal(amplitudes, integral[starts] - integral[ends])
+    assert (np.diff(starts) > 0).all() and (ends > starts).all()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_irregular_extrema(seed):
+    # runs of extrema of the same kind and extrema without a later extremum of the other kind
+    rng = np.random.default_rng(seed)
+    x = np.arange(300) / 100.0
+    integral = rng.standard_normal(300)
+    extrema = rng.choice(300, 60, replace=False)
+    kinds = rng.random(60) < 0.5
+    maxi, mini = np.sort(extrema[kinds]), np.sort(extrema[~kinds])
+    amplitudes, durations, _, _ = W.segmentMovements(x, integral, maxi, mini)
+    ref_amplitudes, ref_durations = reference_amplitudes(x, integral, maxi, mini)
+    np.testing.assert_array_equal(amplitudes, ref_amplitudes)
+    np.testing.assert_array_equal(durations, ref_durations)
+
+
+def test_no_extrema():
+    x, y = make_integral(n=100)
+    amplitudes, durations, _, _ = W.segmentMovements(x, y, np.array([], dtype=int), np.array([10, 20]))
+    assert len(amplitudes) == len(durations) == 0
+
+
+def test_amplitudes_match_removed_pipeline():
+    x, y = make_integral(seed=3)
+    integral, amplitudes, durations = W.getAmplitudes(x, y)
+    ref_integral = reference_F(x, y)
+    (maxi,), (mini,) = argrelextrema(ref_integral, np.greater, order=50), argrelextrema(ref_integral, np.less, order=50)
+    ref_amplitudes, ref_durations = reference_amplitudes(x, ref_integral, maxi, mini)
+    np.testing.assert_array_equal(integral, ref_integral)
+    np.testing.assert_array_equal(amplitudes, ref_amplitudes)
+    np.testing.assert_array_equal(durations, ref_durations)
@@ -0,0 +1,41 @@
+"""
+Online keystroke features against the batch features of the same events.
+"""
+import numpy as np
+import pytest
+
+import Bradykinesia as B
+from helpers import make_events, make_subject
+
+
+WINDOWS = [10000, 30000, 60000]
+
+
+@pytest.mark.parametrize("layout", ["QP", "MN", "M"])
+def test_online_test_matches_batch(layout):
+    datalist = make_events(3, layout)
+    online = B.OnlineKeyTest(layout, WINDOWS)
+    online.pushMany(datalist[:len(datalist) // 2])
+    online.pushMany(datalist[len(datalist) // 2:])
+    targets = B.getLayout(layout).targets
+    assert online.features() == B.computeWindowFeatures(datalist, layout, WINDOWS)
+    assert online.velocityScore() == B.computeVelocityScore(targets[0], datalist, targets[1] if len(targets) > 1 else None)
+
+
+@pytest.mark.parametrize("layout", ["QP", "M"])
+def test_features_while_running(layout):
+    datalist = make_events(7, layout)
+    online = B.OnlineKeyTest(layout, WINDOWS)
+    for i, d in enumerate(datalist, 1):
+        online.push(d['k'], d['p'], d['e'])
+        if i % 97 == 0:
+            assert online.features() == B.computeWindowFeatures(datalist[:i], layout, WINDOWS)
+
+
+def test_online_subject_matches_subject():
+    s = make_subject()
+    online = B.OnlineSubject()
+    for test in B.SUBJECT_TESTS:
+        online.pushMany(test, getattr(s, test))
+    for name, value in online.features().items():
+        np.testing.assert_array_equal(value, getattr(s, name))
@@ -0,0 +1,125 @@
+"""
+Batch rendering of the integral plots against the removed pyplot plots of
+plotIntegrals.
+"""
+import os
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.image as mpimg
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+import Wear4PD as W
+from helpers import reference_F, write_wear_cohort, WEAR_SUBJECTS
+
+
+def reference_label(s, wrist):
+    # labels of the removed if-chains of plotIntegrals
+    dominant = (s.handedness == "left") == (wrist == "LW")
+    affected = s.side == 3 or s.side == (2 if wrist == "LW" else 1)
+    return " (" + ("affected" if affected else "not affected") + ", " + ("dominant" if dominant else "non-dominant") + ", UPDRS " + str(s.UPDRS_dom if dominant else s.UPDRS_ndom) + ")"
+
+
+def reference_plot_integrals(s, filename):
+    # one subject of plotIntegrals before the batch mode
+    fig, axs = plt.subplots(2, 2, figsize=(20, 10))
+    fig.suptitle(s.subject_id + ' Integrals', fontsize=18)
+    for j, (wrist, name, timestamps, data) in enumerate([("LW", "Left", s.gyro_timestamps_LW, s.gyro_data_LW), ("RW", "Right", s.gyro_timestamps_RW, s.gyro_data_RW)]):
+        integral, _, durations = W.getAmplitudes(timestamps, data[:, 0])
+        (maxi,), (mini,) = W.segmentIntegrals(integral)
+        title = reference_label(s, wrist) + ", Nr of Periods: " + str(len(durations) / 2)
+        axs[0, j].plot(timestamps, data[:, 0])
+        axs[0, j].set_title(name + ' Hand Y-Axis' + title, fontsize=16)
+        axs[1, j].plot(timestamps, integral)
+        axs[1, j].plot(timestamps[mini], integral[mini], "or")
+        axs[1, j].plot(timestamps[maxi], integral[maxi], "og")
+        axs[1, j].set_xlabel('Time [s]', fontsize=14)
+        axs[1, j].set_title(name + ' Hand Y-Axis Integral' + title, fontsize=16)
+    axs[0, 0].set_ylabel('Angular Velocity [deg/s]', fontsize=14)
+    axs[1, 0].set_ylabel('Angular Displacement [deg]', fontsize=14)
+    for ax in axs.flat:
+        ax.label_outer()
+    fig.savefig(filename)
+    plt.close(fig)
+
+
+def assert_same_images(filenames, reference):
+    assert [os.path.basename(filename) for filename in filenames] == [os.path.basename(filename) for filename in reference]
+    for filename, ref in zip(filenames, reference):
+        np.testing.assert_array_equal(mpimg.imread(filename), mpimg.imread(ref))
+
+
+@pytest.fixture(scope="module")
+def manifest(tmp_path_factory):
+    return write_wear_cohort(tmp_path_factory.mktemp("cohort"), WEAR_SUBJECTS[:3])
+
+
+@pytest.fixture(scope="module")
+def wear(manifest):
+    return W.Wear4PD(manifest=manifest)
+
+
+@pytest.fixture(scope="module")
+def reference(wear, tmp_path_factory):
+    directory = tmp_path_factory.mktemp("reference")
+    filenames = []
+    for s in wear.subjects:
+        filenames.append(str(directory / (s.subject_id + '_Integrals.png')))
+        reference_plot_integrals(s, filenames[-1])
+    return filenames
+
+
+def test_pyplot_matches_removed_plots(wear, reference, tmp_path):
+    filenames = wear.plotIntegrals(str(tmp_path))
+    plt.close("all")
+    assert_same_images(filenames, reference)
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_batch_matches_removed_plots(wear, reference, tmp_path, n_jobs):
+    figures = plt.get_fignums()
+    filenames = wear.plotIntegrals(str(tmp_path), batch=True, n_jobs=n_jobs)
+    # no pyplot figure is left open
+    assert plt.get_fignums() == figures
+    assert_same_images(filenames, reference)
+
+
+def test_batch_without_kept_subjects(manifest, reference, tmp_path):
+    wear = W.Wear4PD(manifest=manifest, keep_subjects=False)
+    assert_same_images(wear.plotIntegrals(str(tmp_path), batch=True), reference)
+
+
+def test_reused_segmentations(wear):
+    for s in wear.subjects:
+        reused = wear.getIntegralPlot(s)
+        segmentations, wear.segmentations = wear.segmentations, {}
+        try:
+            recomputed = wear.getIntegralPlot(s)
+        finally:
+            wear.segmentations = segmentations
+        assert reused["filename"] == recomputed["filename"] == os.path.join("Plots", s.subject_id + '_Integrals.png')
+        for wrist in ["LW", "RW"]:
+            assert reused[wrist]["label"] == recomputed[wrist]["label"] == reference_label(s, wrist)
+            assert reused[wrist]["periods"] == recomputed[wrist]["periods"]
+            for name in ["timestamps", "signal", "integral", "maxima", "minima"]:
+                np.testing.assert_array_equal(reused[wrist][name], recomputed[wrist][name])
+        np.testing.assert_allclose(reused["LW"]["integral"], reference_F(s.gyro_timestamps_LW, s.gyro_data_LW[:, 0]), rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("n, max_points", [(1000, 100), (1001, 64), (50, 100), (999, 3)])
+def test_decimate_signal(n, max_points):
+    rng = np.random.default_rng(n)
+    x, y = np.arange(n) * 0.005, rng.standard_normal(n)
+    kept_x, kept_y = W.decimateSignal(x, y, max_points)
+    assert len(kept_y) <= max(max_points, 2)
+    np.testing.assert_array_equal(kept_y, y[np.searchsorted(x, kept_x)])
+    if n <= max_points:
+        np.testing.assert_array_equal(kept_y, y)
+    else:
+        # the minimum and the maximum of every bucket are kept
+        edges = np.linspace(0, n, max(1, max_points // 2) + 1).astype(int)
+        for a, b in zip(edges[:-1], edges[1:]):
+            assert y[a:b].min() in kept_y and y[a:b].max() in kept_y
+        assert y.min() == kept_y.min() and y.max() == kept_y.max()
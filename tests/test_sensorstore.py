@@ -0,0 +1,70 @@
+"""
+Memory-mapped sensor recordings against the windows of the .mat files.
+"""
+import os
+
+import numpy as np
+import pytest
+import scipy.io as sio
+
+import sensorstore
+from helpers import make_sensor_data, reference_sensor_data
+
+
+def write_sensor_data(directory, name="S01_LW", **kwargs):
+    filename = str(directory / (name + "_sensorData.mat"))
+    sio.savemat(filename, make_sensor_data(**kwargs))
+    return filename
+
+
+def make_windows(seed=0):
+    rng = np.random.default_rng(seed)
+    starts = np.concatenate([rng.uniform(-5, 35, 100), [0.0, 0.5, 10.0, 15.0, 29.995]])
+    return starts, starts + 2.5
+
+
+@pytest.mark.parametrize("unsorted", [False, True])
+def test_store_matches_mat(unsorted, tmp_path):
+    filename = write_sensor_data(tmp_path, unsorted=unsorted)
+    starts, ends = make_windows()
+    assert not sensorstore.hasStore(filename)
+    from_mat = sensorstore.readSensorWindows(filename, starts, ends)
+    sensorstore.convertSensorData(filename)
+    assert sensorstore.hasStore(filename)
+    from_store = sensorstore.readSensorWindows(filename, starts, ends)
+    data = sio.loadmat(filename)
+    for (gyro, fs, timestamps), (mat_gyro, mat_fs, mat_timestamps), start, end in zip(from_store, from_mat, starts, ends):
+        np.testing.assert_array_equal(gyro, mat_gyro)
+        np.testing.assert_array_equal(timestamps, mat_timestamps)
+        assert fs == mat_fs and type(fs) == type(mat_fs)
+        if not unsorted:
+            # searchsorted of the removed code is only defined for sorted timestamps
+            ref_gyro, ref_timestamps = reference_sensor_data(data, start, end)
+            np.testing.assert_array_equal(gyro, ref_gyro)
+            np.testing.assert_array_equal(timestamps, ref_timestamps)
+    assert sensorstore.readSensorWindow(filename, starts[0], ends[0])[0].shape == from_store[0][0].shape
+
+
+def test_convert_directory(tmp_path):
+    filenames = [write_sensor_data(tmp_path, name, seed=i) for i, name in enumerate(["S01_LW", "S01_RW"])]
+    assert sensorstore.convertSensorDirectory(str(tmp_path)) == filenames
+    assert all(sensorstore.hasStore(filename) for filename in filenames)
+    assert sensorstore.convertSensorDirectory(str(tmp_path)) == []
+    # a newer .mat file makes its conversion outdated
+    meta = sensorstore.getStoreFilenames(filenames[1])["meta"]
+    os.utime(filenames[1], (os.path.getmtime(meta) + 10,) * 2)
+    assert not sensorstore.hasStore(filenames[1])
+    assert sensorstore.convertSensorDirectory(str(tmp_path)) == [filenames[1]]
+    assert sensorstore.convertSensorDirectory(str(tmp_path), force=True) == filenames
+
+
+def test_incomplete_conversion(tmp_path):
+    filename = write_sensor_data(tmp_path)
+    filenames = sensorstore.convertSensorData(filename)
+    os.remove(filenames["meta"])
+    assert not sensorstore.hasStore(filename)
+    # without the meta data the .mat file is read
+    starts, ends = make_windows()
+    for (gyro, _, _), (ref_gyro, ref_timestamps) in zip(sensorstore.readSensorWindows(filename, starts, ends),
+                                                         [reference_sensor_data(sio.loadmat(filename), start, end) for start, end in zip(starts, ends)]):
+        np.testing.assert_array_equal(gyro, ref_gyro)
@@ -0,0 +1,47 @@
+"""
+Binary session files against the JSON recordings they are converted from.
+"""
+import os
+
+import numpy as np
+
+import Bradykinesia as B
+import sessionfile
+from helpers import make_session, write_session
+
+
+def test_read_binary_matches_json(tmp_path):
+    filename = write_session(str(tmp_path / "HC01.txt"))
+    data = make_session(0)
+    assert sessionfile.readSession(filename) == data
+    sessionfile.convertSession(filename)
+    assert sessionfile.hasBinary(filename)
+    binary = sessionfile.readSession(filename)
+    assert {key: value for key, value in binary.items() if key != 'd'} == {key: value for key, value in data.items() if key != 'd'}
+    assert list(binary['d']) == list(data['d'])
+    for name, events in data['d'].items():
+        assert B.KeyEvents(*binary['d'][name]).toList() == events
+    assert 'd' not in sessionfile.readSession(filename, events=False)
+
+
+def test_subject_from_binary_matches_json(tmp_path):
+    filename = write_session(str(tmp_path / "HC01.txt"))
+    from_json = B.createSubjectFromData(filename).precompute()
+    sessionfile.convertSession(filename)
+    from_binary = B.createSubjectFromData(filename).precompute()
+    for name in ["typist", "UPDRS_dom", "UPDRS_ndom"] + list(B.FEATURE_FAMILIES):
+        np.testing.assert_array_equal(getattr(from_binary, name), getattr(from_json, name))
+
+
+def test_outdated_binary_is_not_read(tmp_path):
+    filenames = [write_session(str(tmp_path / (subject_id + ".txt")), seed) for seed, subject_id in enumerate(["HC01", "HC02"])]
+    assert sessionfile.convertCohort(str(tmp_path)) == filenames
+    assert sessionfile.convertCohort(str(tmp_path)) == []
+    # the JSON file changed after the conversion
+    write_session(filenames[0], seed=5)
+    binary = sessionfile.getBinaryFilename(filenames[0])
+    os.utime(binary, (os.path.getmtime(filenames[0]) - 10,) * 2)
+    assert not sessionfile.hasBinary(filenames[0])
+    assert sessionfile.readSession(filenames[0]) == make_session(5)
+    assert sessionfile.convertCohort(str(tmp_path)) == filenames[:1]
+    assert sessionfile.convertCohort(str(tmp_path), force=True) == filenames
@@ -0,0 +1,39 @@
+"""
+Lazily computed features of Subject against computing all of them in
+advance.
+"""
+import numpy as np
+import pytest
+
+import Bradykinesia as B
+from helpers import make_subject
+
+
+def computed(s):
+    return set(s.__dict__) & set(B.FEATURE_FAMILIES)
+
+
+def test_lazy_families_match_precompute():
+    lazy, eager = make_subject(), make_subject().precompute()
+    assert computed(eager) == set(B.FEATURE_FAMILIES)
+    for name in B.FEATURE_FAMILIES:
+        np.testing.assert_array_equal(getattr(lazy, name), eager.__dict__[name])
+
+
+def test_only_the_family_is_computed():
+    s = make_subject()
+    assert computed(s) == set()
+    s.qp_dom_ft_10
+    assert computed(s) == {name for name, family in B.FEATURE_FAMILIES.items() if family == ("qp_dom", 10000)}
+    s.m_ndom_vs
+    assert "m_ndom_vs" in computed(s) and "m_ndom_err" not in computed(s)
+
+
+def test_precompute_subset():
+    s = make_subject().precompute(["mn_dom_ft", "qp_ndom_DS_30"])
+    assert computed(s) == {name for name, family in B.FEATURE_FAMILIES.items() if family in [("mn_dom", "outliers"), ("qp_ndom", 30000)]}
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        make_subject().qp_dom_unknown
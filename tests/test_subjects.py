@@ -0,0 +1,69 @@
+"""
+Parallel loading of the keyboard cohort against the serial loading.
+"""
+import numpy as np
+import pytest
+
+import Bradykinesia as B
+import cohort
+from helpers import make_session, write_session
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    data_dir = tmp_path / "Data"
+    data_dir.mkdir()
+    for i, subject_id in enumerate(["PD01_OFF", "PD01_ON", "HC01", "CA01", "HC02"]):
+        write_session(str(data_dir / (subject_id + ".txt")), seed=10 * i, hand="left" if i % 2 else "right")
+    # a session that cannot be loaded
+    (data_dir / "CA02.txt").write_text("{")
+    return cohort.scanCohort(str(data_dir), str(tmp_path / "SensorData"))
+
+
+def assert_same_subjects(subjects, reference):
+    assert [s.subject_id for s in subjects.subjects] == [s.subject_id for s in reference.subjects]
+    for s, r in zip(subjects.subjects, reference.subjects):
+        for name in ["diagnosis", "hand", "UPDRS_dom", "UPDRS_ndom"] + list(B.FEATURE_FAMILIES):
+            np.testing.assert_array_equal(getattr(s, name), getattr(r, name))
+
+
+def test_parallel_matches_serial(manifest):
+    with pytest.warns(UserWarning, match="CA02"):
+        serial = B.Subjects(manifest=manifest)
+    with pytest.warns(UserWarning, match="CA02"):
+        parallel = B.Subjects(n_jobs=2, manifest=manifest)
+    assert_same_subjects(parallel, serial)
+    assert [s.subject_id.split("/")[-1] for s in serial.subjects] == ["PD01_OFF.txt", "PD01_ON.txt", "HC01.txt", "HC02.txt", "CA01.txt"]
+    assert list(parallel.failed) == list(serial.failed) == [manifest.loc[manifest["subject_id"] == "CA02", "data_path"].item()]
+
+
+def test_cached_parallel_matches_serial(manifest, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    with pytest.warns(UserWarning):
+        serial = B.Subjects(manifest=manifest)
+    for _ in range(2):
+        # the second load reads the cache written by the first one
+        with pytest.warns(UserWarning):
+            parallel = B.Subjects(n_jobs=2, cache_dir=cache_dir, manifest=manifest)
+        assert_same_subjects(parallel, serial)
+
+
+def test_zero_jobs(manifest):
+    with pytest.raises(ValueError):
+        B.Subjects(n_jobs=0, manifest=manifest)
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_failing_features(manifest, n_jobs):
+    # a session that can be read, but whose features cannot be computed
+    filename = manifest.loc[manifest["subject_id"] == "HC02", "data_path"].item()
+    session = make_session(0)
+    session['d']['0'] = []
+    with open(filename, "w") as f:
+        B.json.dump(session, f)
+    with pytest.warns(UserWarning) as record:
+        subjects = B.Subjects(n_jobs=n_jobs, manifest=manifest)
+    assert sorted(str(w.message).split(":")[0].split("/")[-1] for w in record) == ["CA02.txt", "HC02.txt"]
+    assert sorted(subjects.failed) == sorted([filename, manifest.loc[manifest["subject_id"] == "CA02", "data_path"].item()])
+    assert "HC02" not in [s.subject_id.split("/")[-1][:-4] for s in subjects.subjects]
+    assert list(subjects.df["subject_id"]) == [s.subject_id for s in subjects.subjects]
@@ -0,0 +1,74 @@
+"""
+Batched table building against the repeated DataFrame.append it replaced.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tablebuilder import TableBuilder
+
+
+COLUMNS = ["subject_id", "dominant", "movements", "mean_amplitude", "f1"]
+
+
+def reference_table(columns, rows):
+    # DataFrame.append(row, ignore_index=True) of pandas < 2, one row at a time
+    df = pd.DataFrame(columns=columns)
+    for row in rows:
+        other = pd.DataFrame([row]) if isinstance(row, dict) else pd.DataFrame([list(row)], columns=columns)
+        with warnings.catch_warnings():
+            # concatenating with the empty initial table is deprecated
+            warnings.simplefilter("ignore", FutureWarning)
+            df = pd.concat([df, other], ignore_index=True)
+    return df[columns].infer_objects()
+
+
+def make_rows(n=20, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n):
+        row = {"f1": np.array([rng.random()]), "movements": int(rng.integers(5, 30)), "subject_id": "S%02d" % i,
+               "dominant": bool(i % 2), "mean_amplitude": rng.random() if i % 7 else np.nan}
+        if i == 3:
+            # missing values are NaN
+            del row["mean_amplitude"]
+        rows.append(row)
+    return rows
+
+
+def assert_same_table(df, reference):
+    assert list(df.columns) == list(reference.columns)
+    assert len(df) == len(reference)
+    for column in df.columns:
+        for value, expected in zip(df[column], reference[column]):
+            np.testing.assert_array_equal(value, expected)
+    numeric = [column for column in df.columns if column != "f1"]
+    pd.testing.assert_frame_equal(df[numeric], reference[numeric], check_dtype=False)
+
+
+@pytest.mark.parametrize("kind", ["dict", "list"])
+def test_matches_append(kind):
+    rows = make_rows()
+    if kind == "list":
+        rows = [[row.get(column, np.nan) for column in COLUMNS] for row in rows]
+    table = TableBuilder(COLUMNS)
+    for row in rows:
+        table.append(row)
+    assert len(table) == len(rows)
+    assert_same_table(table.toDataFrame(), reference_table(COLUMNS, rows))
+
+
+def test_list_cells_are_kept():
+    table = TableBuilder(["subject_id", "ft"])
+    table.append(["S01", [120, 130, 125]])
+    table.append(["S02", []])
+    df = table.toDataFrame()
+    assert df["ft"].tolist() == [[120, 130, 125], []]
+
+
+def test_empty():
+    df = TableBuilder(COLUMNS).toDataFrame()
+    assert list(df.columns) == COLUMNS
+    assert len(df) == 0
@@ -0,0 +1,255 @@
+"""
+Time slots of timeslots.csv against the dict literals they replaced in
+createSubjectFromData, and the lookup, validation and reload of the table.
+"""
+import os
+
+import numpy as np
+import pytest
+
+import Wear4PD as W
+import timeslots
+
+
+# Removed dict literals of createSubjectFromData (commented-out entries included as they were)
+
+REFERENCE_10_SECONDS = {"CA01_LW_start" : 358.0, "CA01_LW_end" : 368.0, "CA01_RW_start" : 318.7, "CA01_RW_end" : 328.7,
+             "CA02_LW_start" : 235.6, "CA02_LW_end" : 245.6, "CA02_RW_start" : 206.5, "CA02_RW_end" : 216.5,
+            "CA03_LW_start" : 552.0, "CA03_LW_end" : 562.0, "CA03_RW_start" : 510.0, "CA03_RW_end" : 520.0,
+            "CA11_LW_start" : 244.3, "CA11_LW_end" : 254.3, "CA11_RW_start" : 216.7, "CA11_RW_end" : 226.7,
+            "CA13_LW_start" : 357.0, "CA13_LW_end" : 367.0, "CA13_RW_start" : 326.0, "CA13_RW_end" : 336.0,
+            "CA15_LW_start" : 356.4, "CA15_LW_end" : 366.4, "CA15_RW_start" : 330.6, "CA15_RW_end" : 340.6,
+            "CA16_LW_start" : 281.5, "CA16_LW_end" : 291.5, "CA16_RW_start" : 254.9, "CA16_RW_end" : 264.9,
+            "CA25_LW_start" : 324.6, "CA25_LW_end" : 334.6, "CA25_RW_start" : 301.7, "CA25_RW_end" : 311.7,
+            "CA29_LW_start" : 252.0, "CA29_LW_end" : 262.0, "CA29_RW_start" : 266.5, "CA29_RW_end" : 276.5,
+            "CA37_LW_start" : 505.4, "CA37_LW_end" : 515.4, "CA37_RW_start" : 459.0, "CA37_RW_end" : 469.0,
+            "CA39_LW_start" : 435.3, "CA39_LW_end" : 445.3, "CA39_RW_start" : 381.2, "CA39_RW_end" : 391.2,
+            "CA40_LW_start" : 363.0, "CA40_LW_end" : 373.0, "CA40_RW_start" : 327.1, "CA40_RW_end" : 337.1,
+            "CA41_LW_start" : 296.4, "CA41_LW_end" : 306.4, "CA41_RW_start" : 258.5, "CA41_RW_end" : 268.5,
+            "CA44_LW_start" : 247.5, "CA44_LW_end" : 257.5, "CA44_RW_start" : 216.0, "CA44_RW_end" : 226.0,
+            "CA46_LW_start" : 346.0, "CA46_LW_end" : 356.0, "CA46_RW_start" : 314.0, "CA46_RW_end" : 324.0,
+            "CA52_LW_start" : 413.6, "CA52_LW_end" : 423.6, "CA52_RW_start" : 419.0, "CA52_RW_end" : 429.0,
+            "CA55_LW_start" : 391.6, "CA55_LW_end" : 401.6, "CA55_RW_start" : 362.5, "CA55_RW_end" : 372.5,
+            "CA56_LW_start" : 293.4, "CA56_LW_end" : 303.4, "CA56_RW_start" : 290.0, "CA56_RW_end" : 300.0,
+            "CA59_LW_start" : 294.3, "CA59_LW_end" : 304.3, "CA59_RW_start" : 298.5, "CA59_RW_end" : 308.5,
+            "HC01_LW_start" : 650.5, "HC01_LW_end" : 660.5, "HC01_RW_start" : 621.0, "HC01_RW_end" : 631.0,
+            "HC08_LW_start" : 294.4, "HC08_LW_end" : 304.4, "HC08_RW_start" : 278.5, "HC08_RW_end" : 288.5,
+            "HC09_LW_start" : 214.7, "HC09_LW_end" : 224.7, "HC09_RW_start" : 194.2, "HC09_RW_end" : 204.2,
+            "HC11_LW_start" : 300.0, "HC11_LW_end" : 310.0, "HC11_RW_start" : 289.5, "HC11_RW_end" : 299.5,
+            "HC12_LW_start" : 358.0, "HC12_LW_end" : 368.0, "HC12_RW_start" : 332.0, "HC12_RW_end" : 342.0,
+            "HC13_LW_start" : 356.3, "HC13_LW_end" : 366.3, "HC13_RW_start" : 318.0, "HC13_RW_end" : 328.0,
+            "HC14_LW_start" : 293.0, "HC14_LW_end" : 303.0, "HC14_RW_start" : 269.9, "HC14_RW_end" : 279.9,
+            "HC17_LW_start" : 448.8, "HC17_LW_end" : 458.8, "HC17_RW_start" : 422.7, "HC17_RW_end" : 432.7,
+            "HC20_LW_start" : 439.0, "HC20_LW_end" : 449.0, "HC20_RW_start" : 383.8, "HC20_RW_end" : 393.8,
+            "HC22_LW_start" : 550.0, "HC22_LW_end" : 560.0, "HC22_RW_start" : 422.0, "HC22_RW_end" : 432.0,
+            "HC23_LW_start" : 325.7, "HC23_LW_end" : 335.7, "HC23_RW_start" : 303.0, "HC23_RW_end" : 313.0,
+            "HC25_LW_start" : 482.3, "HC25_LW_end" : 492.3, "HC25_RW_start" : 463.7, "HC25_RW_end" : 473.7,
+            "HC27_LW_start" : 379.7, "HC27_LW_end" : 389.7, "HC27_RW_start" : 366.0, "HC27_RW_end" : 376.0,
+#                 "HC28_LW_start" : 0.0, "HC28_LW_end" : 10.0, "HC28_RW_start" : 358.6, "HC28_RW_end" : 368.6,
+            "HC30_LW_start" : 347.5, "HC30_LW_end" : 357.5, "HC30_RW_start" : 295.0, "HC30_RW_end" : 305.0,
+            "HC33_LW_start" : 360.7, "HC33_LW_end" : 370.7, "HC33_RW_start" : 344.8, "HC33_RW_end" : 354.8,
+            "HC35_LW_start" : 398.3, "HC35_LW_end" : 408.3, "HC35_RW_start" : 392.9, "HC35_RW_end" : 402.9,
+            "HC36_LW_start" : 328.3, "HC36_LW_end" : 338.3, "HC36_RW_start" : 301.0, "HC36_RW_end" : 311.0,
+            "HC37_LW_start" : 321.4, "HC37_LW_end" : 331.4, "HC37_RW_start" : 303.8, "HC37_RW_end" : 313.8,
+
+            "PD01_OFF_LW_start" : 241.0, "PD01_OFF_LW_end" : 251.0, "PD01_OFF_RW_start" : 207.8, "PD01_OFF_RW_end" : 217.8,
+            "PD03_OFF_LW_start" : 1155.3, "PD03_OFF_LW_end" : 1165.3, "PD03_OFF_RW_start" : 1117.0, "PD03_OFF_RW_end" : 1127.0,
+            "PD04_OFF_LW_start" : 368.7, "PD04_OFF_LW_end" : 378.7, "PD04_OFF_RW_start" : 324.3, "PD04_OFF_RW_end" : 334.3,
+            "PD05_OFF_LW_start" : 345.4, "PD05_OFF_LW_end" : 355.4, "PD05_OFF_RW_start" : 314.5, "PD05_OFF_RW_end" : 324.5,
+            "PD09_OFF_LW_start" : 428.5, "PD09_OFF_LW_end" : 438.5, "PD09_OFF_RW_start" : 383.3, "PD09_OFF_RW_end" : 393.3,
+            "PD13_OFF_LW_start" : 475.3, "PD13_OFF_LW_end" : 485.3, "PD13_OFF_RW_start" : 481.6, "PD13_OFF_RW_end" : 491.6,
+            "PD16_OFF_LW_start" : 355.44, "PD16_OFF_LW_end" : 365.44, "PD16_OFF_RW_start" : 330.7, "PD16_OFF_RW_end" : 340.7,
+            "PD17_OFF_LW_start" : 404.5, "PD17_OFF_LW_end" : 414.5, "PD17_OFF_RW_start" : 418.2, "PD17_OFF_RW_end" : 428.2,
+            "PD22_OFF_LW_start" : 342.6, "PD22_OFF_LW_end" : 352.6, "PD22_OFF_RW_start" : 311.0, "PD22_OFF_RW_end" : 321.0,
+            "PD25_OFF_LW_start" : 350.8, "PD25_OFF_LW_end" : 360.8, "PD25_OFF_RW_start" : 360.7, "PD25_OFF_RW_end" : 370.7,
+            "PD29_OFF_LW_start" : 365.4, "PD29_OFF_LW_end" : 375.4, "PD29_OFF_RW_start" : 307.1, "PD29_OFF_RW_end" : 317.1,
+            "PD31_OFF_LW_start" : 315.0, "PD31_OFF_LW_end" : 325.0, "PD31_OFF_RW_start" : 291.5, "PD31_OFF_RW_end" : 301.5,
+            "PD33_OFF_LW_start" : 399.6, "PD33_OFF_LW_end" : 409.6, "PD33_OFF_RW_start" : 357.5, "PD33_OFF_RW_end" : 367.5,
+            "PD34_OFF_LW_start" : 389.35, "PD34_OFF_LW_end" : 399.35, "PD34_OFF_RW_start" : 355.1, "PD34_OFF_RW_end" : 365.1,
+            "PD36_OFF_LW_start" : 326.3, "PD36_OFF_LW_end" : 336.3, "PD36_OFF_RW_start" : 297.55, "PD36_OFF_RW_end" : 307.55,
+            "PD37_OFF_LW_start" : 293.3, "PD37_OFF_LW_end" : 303.3, "PD37_OFF_RW_start" : 267.6, "PD37_OFF_RW_end" : 277.6,
+            "PD38_OFF_LW_start" : 322.26, "PD38_OFF_LW_end" : 332.26, "PD38_OFF_RW_start" : 287.6, "PD38_OFF_RW_end" : 297.6,
+            "PD39_OFF_LW_start" : 307.8, "PD39_OFF_LW_end" : 317.8, "PD39_OFF_RW_start" : 281.0, "PD39_OFF_RW_end" : 291.0,
+
+            "PD01_ON_LW_start" : 414.0, "PD01_ON_LW_end" : 424.0, "PD01_ON_RW_start" : 374.2, "PD01_ON_RW_end" : 384.2,
+            "PD03_ON_LW_start" : 249.0, "PD03_ON_LW_end" : 259.0, "PD03_ON_RW_start" : 221.9, "PD03_ON_RW_end" : 231.9,
+            "PD04_ON_LW_start" : 367.0, "PD04_ON_LW_end" : 377.0, "PD04_ON_RW_start" : 337.8, "PD04_ON_RW_end" : 347.8,
+            "PD05_ON_LW_start" : 247.785, "PD05_ON_LW_end" : 257.785, "PD05_ON_RW_start" : 209.0, "PD05_ON_RW_end" : 219.0,
+            "PD08_ON_LW_start" : 351.96, "PD08_ON_LW_end" : 361.96, "PD08_ON_RW_start" : 331.484, "PD08_ON_RW_end" : 341.484,
+            "PD09_ON_LW_start" : 295.49, "PD09_ON_LW_end" : 305.49, "PD09_ON_RW_start" : 266.22, "PD09_ON_RW_end" : 276.22,
+            "PD13_ON_LW_start" : 232.9, "PD13_ON_LW_end" : 242.9, "PD13_ON_RW_start" : 246.65, "PD13_ON_RW_end" : 256.65,
+#                 "PD16_ON_LW_start" : 191.75, "PD16_ON_LW_end" : 201.75, "PD16_ON_RW_start" : 0.0, "PD16_ON_RW_end" : 10.0,
+            "PD17_ON_LW_start" : 241.4, "PD17_ON_LW_end" : 251.4, "PD17_ON_RW_start" : 213.7, "PD17_ON_RW_end" : 223.7,
+            "PD22_ON_LW_start" : 291.2, "PD22_ON_LW_end" : 301.2, "PD22_ON_RW_start" : 217.8, "PD22_ON_RW_end" : 227.8,
+            "PD25_ON_LW_start" : 229.95, "PD25_ON_LW_end" : 239.95, "PD25_ON_RW_start" : 197.1, "PD25_ON_RW_end" : 207.1,
+            "PD29_ON_LW_start" : 212.75, "PD29_ON_LW_end" : 222.75, "PD29_ON_RW_start" : 194.0, "PD29_ON_RW_end" : 204.0,
+            "PD31_ON_LW_start" : 394.4, "PD31_ON_LW_end" : 404.4, "PD31_ON_RW_start" : 376.15, "PD31_ON_RW_end" : 386.15,
+            "PD33_ON_LW_start" : 257.4, "PD33_ON_LW_end" : 267.4, "PD33_ON_RW_start" : 223.75, "PD33_ON_RW_end" : 233.75,
+            "PD34_ON_LW_start" : 454.0, "PD34_ON_LW_end" : 464.0, "PD34_ON_RW_start" : 432.0, "PD34_ON_RW_end" : 442.0,
+            "PD36_ON_LW_start" : 277.35, "PD36_ON_LW_end" : 287.35, "PD36_ON_RW_start" : 244.2, "PD36_ON_RW_end" : 254.2,
+           # "PD37_ON_LW_start" : 287.5, "PD37_ON_LW_end" : 297.5, "PD37_ON_RW_start" : 0.0, "PD37_ON_RW_end" : 10.0,
+            "PD38_ON_LW_start" : 229.84, "PD38_ON_LW_end" : 239.84, "PD38_ON_RW_start" : 207.84, "PD38_ON_RW_end" : 217.84,
+            "PD39_ON_LW_start" : 222.4, "PD39_ON_LW_end" : 232.4, "PD39_ON_RW_start" : 196.58, "PD39_ON_RW_end" : 206.58}
+
+REFERENCE_FULL = {"CA01_LW_start" : 358.0, "CA01_LW_end" : 367.0, "CA01_RW_start" : 318.7, "CA01_RW_end" : 327.3,
+             "CA02_LW_start" : 235.6, "CA02_LW_end" : 243.0, "CA02_RW_start" : 206.5, "CA02_RW_end" : 216.0,
+            "CA03_LW_start" : 552.0, "CA03_LW_end" : 565.6, "CA03_RW_start" : 503.9, "CA03_RW_end" : 520.3,
+            "CA11_LW_start" : 244.3, "CA11_LW_end" : 256.1, "CA11_RW_start" : 216.7, "CA11_RW_end" : 227.1,
+            "CA13_LW_start" : 355.5, "CA13_LW_end" : 368.0, "CA13_RW_start" : 326.3, "CA13_RW_end" : 334.6,
+            "CA15_LW_start" : 356.4, "CA15_LW_end" : 368.9, "CA15_RW_start" : 330.6, "CA15_RW_end" : 345.9,
+            "CA16_LW_start" : 281.5, "CA16_LW_end" : 293.8, "CA16_RW_start" : 254.9, "CA16_RW_end" : 267.3,
+            "CA25_LW_start" : 324.6, "CA25_LW_end" : 338.0, "CA25_RW_start" : 301.7, "CA25_RW_end" : 315.1,
+            "CA29_LW_start" : 251.5, "CA29_LW_end" : 262.6, "CA29_RW_start" : 266.5, "CA29_RW_end" : 274.4,
+            "CA37_LW_start" : 505.4, "CA37_LW_end" : 516.5, "CA37_RW_start" : 459.0, "CA37_RW_end" : 471.0,
+            "CA39_LW_start" : 435.3, "CA39_LW_end" : 444.2, "CA39_RW_start" : 381.2, "CA39_RW_end" : 389.0,
+            "CA40_LW_start" : 363.0, "CA40_LW_end" : 375.0, "CA40_RW_start" : 327.1, "CA40_RW_end" : 336.95,
+            "CA41_LW_start" : 296.4, "CA41_LW_end" : 306.7, "CA41_RW_start" : 258.5, "CA41_RW_end" : 268.66,
+            "CA44_LW_start" : 247.5, "CA44_LW_end" : 255.6, "CA44_RW_start" : 217.7, "CA44_RW_end" : 225.6,
+            "CA46_LW_start" : 346.7, "CA46_LW_end" : 355.9, "CA46_RW_start" : 313.6, "CA46_RW_end" : 327.0,
+            "CA52_LW_start" : 413.6, "CA52_LW_end" : 424.0, "CA52_RW_start" : 418.3, "CA52_RW_end" : 430.2,
+            "CA55_LW_start" : 391.6, "CA55_LW_end" : 407.4, "CA55_RW_start" : 362.5, "CA55_RW_end" : 373.8,
+            "CA56_LW_start" : 293.4, "CA56_LW_end" : 309.9, "CA56_RW_start" : 289.9, "CA56_RW_end" : 302.5,
+            "CA59_LW_start" : 294.3, "CA59_LW_end" : 304.2, "CA59_RW_start" : 298.5, "CA59_RW_end" : 308.65,
+            "HC01_LW_start" : 650.5, "HC01_LW_end" : 662.8, "HC01_RW_start" : 621.0, "HC01_RW_end" : 634.3,
+            "HC08_LW_start" : 294.4, "HC08_LW_end" : 302.1, "HC08_RW_start" : 278.6, "HC08_RW_end" : 287.7,
+            "HC09_LW_start" : 214.7, "HC09_LW_end" : 222.5, "HC09_RW_start" : 194.2, "HC09_RW_end" : 204.5,
+            "HC11_LW_start" : 300.3, "HC11_LW_end" : 308.5, "HC11_RW_start" : 289.5, "HC11_RW_end" : 298.8,
+            "HC12_LW_start" : 358.0, "HC12_LW_end" : 368.0, "HC12_RW_start" : 332.0, "HC12_RW_end" : 341.4,
+            "HC13_LW_start" : 356.3, "HC13_LW_end" : 367.3, "HC13_RW_start" : 318.0, "HC13_RW_end" : 330.8,
+            "HC14_LW_start" : 293.3, "HC14_LW_end" : 302.8, "HC14_RW_start" : 269.9, "HC14_RW_end" : 281.6,
+            "HC17_LW_start" : 448.8, "HC17_LW_end" : 457.6, "HC17_RW_start" : 422.7, "HC17_RW_end" : 432.9,
+            "HC20_LW_start" : 439.0, "HC20_LW_end" : 446.0, "HC20_RW_start" : 384.0, "HC20_RW_end" : 390.0,
+            "HC22_LW_start" : 550.5, "HC22_LW_end" : 563.0, "HC22_RW_start" : 422.0, "HC22_RW_end" : 431.2,
+            "HC23_LW_start" : 325.8, "HC23_LW_end" : 333.9, "HC23_RW_start" : 303.1, "HC23_RW_end" : 310.6,
+            "HC25_LW_start" : 482.3, "HC25_LW_end" : 490.4, "HC25_RW_start" : 463.8, "HC25_RW_end" : 470.24,
+            "HC27_LW_start" : 379.95, "HC27_LW_end" : 389.7, "HC27_RW_start" : 365.9, "HC27_RW_end" : 376.37,
+#                 "HC28_LW_start" : 0.0, "HC28_LW_end" : 10.0, "HC28_RW_start" : 358.6, "HC28_RW_end" : 368.6,
+            "HC30_LW_start" : 347.6, "HC30_LW_end" : 360.8, "HC30_RW_start" : 295.0, "HC30_RW_end" : 306.6,
+            "HC33_LW_start" : 360.8, "HC33_LW_end" : 370.3, "HC33_RW_start" : 344.9, "HC33_RW_end" : 353.6,
+            "HC35_LW_start" : 398.3, "HC35_LW_end" : 407.9, "HC35_RW_start" : 393.0, "HC35_RW_end" : 402.2,
+            "HC36_LW_start" : 328.4, "HC36_LW_end" : 337.7, "HC36_RW_start" : 301.0, "HC36_RW_end" : 311.0,
+            "HC37_LW_start" : 321.5, "HC37_LW_end" : 331.1, "HC37_RW_start" : 303.8, "HC37_RW_end" : 311.6,
+
+            "PD01_OFF_LW_start" : 241.0, "PD01_OFF_LW_end" : 251.5, "PD01_OFF_RW_start" : 207.8, "PD01_OFF_RW_end" : 222.3,
+            "PD03_OFF_LW_start" : 1155.3, "PD03_OFF_LW_end" : 1173.1, "PD03_OFF_RW_start" : 1116.9, "PD03_OFF_RW_end" : 1135.9,
+            "PD04_OFF_LW_start" : 368.8, "PD04_OFF_LW_end" : 381.8, "PD04_OFF_RW_start" : 324.3, "PD04_OFF_RW_end" : 334.9,
+            "PD05_OFF_LW_start" : 345.3, "PD05_OFF_LW_end" : 361.3, "PD05_OFF_RW_start" : 314.5, "PD05_OFF_RW_end" : 330.0,
+            "PD09_OFF_LW_start" : 428.5, "PD09_OFF_LW_end" : 443.6, "PD09_OFF_RW_start" : 383.3, "PD09_OFF_RW_end" : 401.4,
+            "PD13_OFF_LW_start" : 475.3, "PD13_OFF_LW_end" : 493.3, "PD13_OFF_RW_start" : 481.6, "PD13_OFF_RW_end" : 493.4,
+            "PD16_OFF_LW_start" : 355.44, "PD16_OFF_LW_end" : 372.9, "PD16_OFF_RW_start" : 330.7, "PD16_OFF_RW_end" : 341.6,
+            "PD17_OFF_LW_start" : 404.5, "PD17_OFF_LW_end" : 417.1, "PD17_OFF_RW_start" : 418.2, "PD17_OFF_RW_end" : 429.7,
+            "PD22_OFF_LW_start" : 342.6, "PD22_OFF_LW_end" : 354.2, "PD22_OFF_RW_start" : 311.0, "PD22_OFF_RW_end" : 329.7,
+            "PD25_OFF_LW_start" : 350.8, "PD25_OFF_LW_end" : 364.8, "PD25_OFF_RW_start" : 360.7, "PD25_OFF_RW_end" : 373.5,
+            "PD29_OFF_LW_start" : 365.4, "PD29_OFF_LW_end" : 380.4, "PD29_OFF_RW_start" : 307.1, "PD29_OFF_RW_end" : 318.1,
+            "PD31_OFF_LW_start" : 315.0, "PD31_OFF_LW_end" : 326.4, "PD31_OFF_RW_start" : 291.5, "PD31_OFF_RW_end" : 301.5,
+            "PD33_OFF_LW_start" : 399.6, "PD33_OFF_LW_end" : 410.6, "PD33_OFF_RW_start" : 357.5, "PD33_OFF_RW_end" : 366.3,
+            "PD34_OFF_LW_start" : 389.35, "PD34_OFF_LW_end" : 401.8, "PD34_OFF_RW_start" : 355.1, "PD34_OFF_RW_end" : 368.9,
+            "PD36_OFF_LW_start" : 326.3, "PD36_OFF_LW_end" : 337.55, "PD36_OFF_RW_start" : 297.55, "PD36_OFF_RW_end" : 309.6,
+            "PD37_OFF_LW_start" : 293.3, "PD37_OFF_LW_end" : 304.1, "PD37_OFF_RW_start" : 267.6, "PD37_OFF_RW_end" : 277.6,
+            "PD38_OFF_LW_start" : 322.26, "PD38_OFF_LW_end" : 333.5, "PD38_OFF_RW_start" : 287.6, "PD38_OFF_RW_end" : 296.7,
+            "PD39_OFF_LW_start" : 307.8, "PD39_OFF_LW_end" : 321.25, "PD39_OFF_RW_start" : 281.0, "PD39_OFF_RW_end" : 297.3,
+
+            "PD01_ON_LW_start" : 414.0, "PD01_ON_LW_end" : 432.2, "PD01_ON_RW_start" : 374.2, "PD01_ON_RW_end" : 394.2,
+            "PD03_ON_LW_start" : 249.0, "PD03_ON_LW_end" : 260.9, "PD03_ON_RW_start" : 221.9, "PD03_ON_RW_end" : 235.3,
+            "PD04_ON_LW_start" : 367.0, "PD04_ON_LW_end" : 379.7, "PD04_ON_RW_start" : 337.8, "PD04_ON_RW_end" : 348.9,
+            "PD05_ON_LW_start" : 244.2, "PD05_ON_LW_end" : 263.4, "PD05_ON_RW_start" : 209.0, "PD05_ON_RW_end" : 229.6,
+            "PD08_ON_LW_start" : 351.96, "PD08_ON_LW_end" : 366.45, "PD08_ON_RW_start" : 331.484, "PD08_ON_RW_end" : 343.25,
+            "PD09_ON_LW_start" : 295.49, "PD09_ON_LW_end" : 309.6, "PD09_ON_RW_start" : 266.22, "PD09_ON_RW_end" : 277.6,
+            "PD13_ON_LW_start" : 232.9, "PD13_ON_LW_end" : 246.4, "PD13_ON_RW_start" : 246.65, "PD13_ON_RW_end" : 255.8,
+#                 "PD16_ON_LW_start" : 191.75, "PD16_ON_LW_end" : 199.66, "PD16_ON_RW_start" : 0.0, "PD16_ON_RW_end" : 10.0,
+            "PD17_ON_LW_start" : 241.4, "PD17_ON_LW_end" : 252.0, "PD17_ON_RW_start" : 213.7, "PD17_ON_RW_end" : 224.2,
+            "PD22_ON_LW_start" : 291.2, "PD22_ON_LW_end" : 301.55, "PD22_ON_RW_start" : 217.8, "PD22_ON_RW_end" : 229.1,
+            "PD25_ON_LW_start" : 229.95, "PD25_ON_LW_end" : 241.2, "PD25_ON_RW_start" : 197.1, "PD25_ON_RW_end" : 209.3,
+            "PD29_ON_LW_start" : 212.75, "PD29_ON_LW_end" : 224.2, "PD29_ON_RW_start" : 194.0, "PD29_ON_RW_end" : 207.2,
+            "PD31_ON_LW_start" : 394.4, "PD31_ON_LW_end" : 408.4, "PD31_ON_RW_start" : 376.15, "PD31_ON_RW_end" : 387.4,
+            "PD33_ON_LW_start" : 257.4, "PD33_ON_LW_end" : 266.9, "PD33_ON_RW_start" : 223.75, "PD33_ON_RW_end" : 232.66,
+            "PD34_ON_LW_start" : 454.0, "PD34_ON_LW_end" : 463.2, "PD34_ON_RW_start" : 432.0, "PD34_ON_RW_end" : 441.9,
+            "PD36_ON_LW_start" : 277.35, "PD36_ON_LW_end" : 289.5, "PD36_ON_RW_start" : 244.2, "PD36_ON_RW_end" : 257.3,
+           # "PD37_ON_LW_start" : 287.5, "PD37_ON_LW_end" : 297.5, "PD37_ON_RW_start" : 0.0, "PD37_ON_RW_end" : 10.0,
+            "PD38_ON_LW_start" : 229.84, "PD38_ON_LW_end" : 239.2, "PD38_ON_RW_start" : 207.84, "PD38_ON_RW_end" : 219.84,
+            "PD39_ON_LW_start" : 222.4, "PD39_ON_LW_end" : 235.2, "PD39_ON_RW_start" : 196.58, "PD39_ON_RW_end" : 210.5}
+
+# Extract gyro data (only the time slot is read if the recordings were converted, see sensorstore.convertSensorDirectory)
+
+
+def reference_timeslots(kind):
+    return REFERENCE_FULL if (kind == "full") else REFERENCE_10_SECONDS
+
+
+def split_key(key):
+    # "PD01_OFF_LW_start" -> ("PD01_OFF", "LW", "start")
+    subject_id, wrist, bound = key.rsplit("_", 2)
+    return subject_id, wrist, bound
+
+
+@pytest.mark.parametrize("kind", ["full", "10_seconds"])
+def test_timeslots_match_literals(kind):
+    reference = reference_timeslots(kind)
+    table = timeslots.getTimeslots().xs((kind, timeslots.DEFAULT_TASK), level=["kind", "task"])
+    assert 2 * len(table) == len(reference)
+    for key, value in reference.items():
+        subject_id, wrist, bound = split_key(key)
+        assert table.loc[(subject_id, wrist), bound] == value
+        assert timeslots.getTimeslot(subject_id, wrist, kind)[0 if bound == "start" else 1] == value
+
+
+def test_lookup_timeslots():
+    keys = sorted({split_key(key)[:2] for key in REFERENCE_FULL}) + [("PD16_ON", "RW"), ("XX01", "LW")]
+    subject_ids, wrists = zip(*keys)
+    for kind in ["full", "10_seconds"]:
+        reference = reference_timeslots(kind)
+        starts, ends = timeslots.lookupTimeslots(subject_ids, wrists, kind)
+        expected_starts = [reference.get(subject_id + "_" + wrist + "_start", np.nan) for subject_id, wrist in keys]
+        expected_ends = [reference.get(subject_id + "_" + wrist + "_end", np.nan) for subject_id, wrist in keys]
+        np.testing.assert_array_equal(starts, expected_starts)
+        np.testing.assert_array_equal(ends, expected_ends)
+    # one wrist and kind for all subject ids
+    starts, _ = timeslots.lookupTimeslots(["CA01", "CA02"], "RW", "10_seconds")
+    np.testing.assert_array_equal(starts, [318.7, 206.5])
+
+
+def test_every_subject_has_timeslots():
+    kinds = timeslots.getTimeslotKinds()
+    assert sorted(kinds) == ["10_seconds", "full"]
+    # the subjects listed in Wear4PD.Subjects
+    for subject_id in sum(W.Subjects("full", load=False).subject_groups, []):
+        for kind in kinds:
+            starts, ends = timeslots.lookupTimeslots([subject_id, subject_id], ["LW", "RW"], kind)
+            assert not np.isnan(starts).any() and not np.isnan(ends).any(), (subject_id, kind)
+
+
+def write_timeslots(filename, rows):
+    with open(filename, "w") as f:
+        f.write("subject_id,wrist,kind,task,start,end\n# comment\n")
+        f.writelines(",".join(map(str, row)) + "\n" for row in rows)
+
+
+def test_missing_timeslot(tmp_path):
+    filename = str(tmp_path / "timeslots.csv")
+    write_timeslots(filename, [("S01", "LW", "full", "pronation_supination", 1.0, 2.0)])
+    assert timeslots.getTimeslot("S01", "LW", "full", filename=filename) == (1.0, 2.0)
+    with pytest.raises(KeyError):
+        timeslots.getTimeslot("S01", "RW", "full", filename=filename)
+    with pytest.raises(KeyError):
+        timeslots.getTimeslot("S01", "LW", "full", task="finger_tapping", filename=filename)
+
+
+def test_duplicated_timeslots(tmp_path):
+    filename = str(tmp_path / "timeslots.csv")
+    write_timeslots(filename, [("S01", "LW", "full", "pronation_supination", 1.0, 2.0),
+                               ("S01", "LW", "full", "pronation_supination", 3.0, 4.0)])
+    with pytest.raises(ValueError, match="S01"):
+        timeslots.loadTimeslots(filename)
+
+
+def test_reload_on_change(tmp_path):
+    filename = str(tmp_path / "timeslots.csv")
+    write_timeslots(filename, [("S01", "LW", "full", "pronation_supination", 1.0, 2.0)])
+    assert timeslots.getTimeslots(filename) is timeslots.getTimeslots(filename)
+    write_timeslots(filename, [("S01", "LW", "full", "pronation_supination", 5.0, 6.0),
+                               ("S01", "LW", "tremor", "rest", 7.0, 8.0)])
+    os.utime(filename, (os.path.getmtime(filename) + 10,) * 2)
+    assert timeslots.getTimeslot("S01", "LW", "full", filename=filename) == (5.0, 6.0)
+    # a new kind or task is a new row
+    assert timeslots.getTimeslot("S01", "LW", "tremor", task="rest", filename=filename) == (7.0, 8.0)
+    assert sorted(timeslots.getTimeslotKinds(filename)) == ["full", "tremor"]
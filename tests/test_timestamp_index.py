@@ -0,0 +1,64 @@
+"""
+Binary search in the cached timestamp index against find_nearest and the
+removed getSensorData.
+"""
+import numpy as np
+import pytest
+
+import Wear4PD as W
+import sensorstore
+from helpers import make_sensor_data, reference_sensor_data
+
+
+def reference_nearest(timestamps, value):
+    # first sample of the closest timestamp, the larger timestamp on ties (as find_nearest)
+    distance = np.abs(timestamps - value)
+    closest = timestamps[distance == distance.min()].max()
+    return np.flatnonzero(timestamps == closest)[0]
+
+
+def make_values(timestamps, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.concatenate([rng.uniform(-5, 35, 200), timestamps[[0, 100, 101, 2000, 2001, 3000, 3020, -1]], timestamps[[100, 2000]] + 0.0025])
+
+
+@pytest.mark.parametrize("unsorted", [False, True])
+def test_timestamp_index(unsorted):
+    data = make_sensor_data(unsorted=unsorted)
+    timestamps = np.concatenate(data['sensorData'][0][1][4]).ravel()
+    values = make_values(timestamps)
+    index = sensorstore.TimestampIndex(timestamps)
+    np.testing.assert_array_equal(index.indices(values), [reference_nearest(timestamps, value) for value in values])
+    # the sorting check can be skipped for sorted timestamps
+    if not unsorted:
+        np.testing.assert_array_equal(sensorstore.TimestampIndex(timestamps, True).indices(values), index.indices(values))
+    starts, ends = index.windows(values[:-1], values[1:])
+    np.testing.assert_array_equal(starts, index.indices(values[:-1]))
+    np.testing.assert_array_equal(ends, index.indices(values[1:]))
+
+
+def test_sensor_windows():
+    data = make_sensor_data()
+    timestamps = np.concatenate(data['sensorData'][0][1][4]).ravel()
+    values = make_values(timestamps)
+    starts, ends = values[:-1], values[:-1] + 2.5
+    windows = W.getSensorWindows(data, starts, ends)
+    for (gyro, fs, window_timestamps), start, end in zip(windows, starts, ends):
+        ref_gyro, ref_timestamps = reference_sensor_data(data, start, end)
+        np.testing.assert_array_equal(gyro, ref_gyro)
+        np.testing.assert_array_equal(window_timestamps, ref_timestamps)
+        assert fs == 200.0
+    # the index is built once per recording
+    index = data['__timestamp_index__']
+    gyro, _, _ = W.getSensorData(data, starts[0], ends[0])
+    assert data['__timestamp_index__'] is index
+    np.testing.assert_array_equal(gyro, windows[0][0])
+
+
+def test_sliding_windows():
+    starts, ends = sensorstore.slidingWindows(1.0, 31.0, 10.0, 2.5)
+    np.testing.assert_allclose(starts, 1.0 + 2.5 * np.arange(9))
+    np.testing.assert_allclose(ends - starts, 10.0)
+    assert ends[-1] <= 31.0
+    starts, _ = sensorstore.slidingWindows(0.0, 5.0, 10.0, 1.0)
+    assert len(starts) == 0
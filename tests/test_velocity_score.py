@@ -0,0 +1,44 @@
+"""
+Indexed velocity score against the per-interval flight time calls of the
+removed implementation.
+"""
+import numpy as np
+import pytest
+import scipy.stats
+
+import Bradykinesia as B
+from helpers import make_events, reference_flight_times
+
+
+# Removed velocity score: one flight time extraction per time interval
+
+def reference_velocity_score(datalist, target1, target2=None):
+    step = 2000
+    secs = step / 1000
+    counts = [len(reference_flight_times(datalist, target1, target2, step, starttime=start)[0]) for start in range(0, 60000, step)]
+    baselineVS = counts[0] / secs + 0.000000000001
+    vss = [((count / secs) / baselineVS) * 100.0 for count in counts[1:]]
+    slope, intercept, _, _, std_err = scipy.stats.linregress(range(len(vss)), vss)
+    return slope, intercept, std_err
+
+
+@pytest.mark.parametrize("layout", ["QP", "MN", "M"])
+@pytest.mark.parametrize("unsorted", [False, True])
+def test_velocity_score(layout, unsorted):
+    datalist = make_events(2, layout, unsorted=unsorted)
+    targets = B.getLayout(layout).targets
+    target2 = targets[1] if len(targets) > 1 else None
+    assert B.computeVelocityScore(targets[0], datalist, target2) == reference_velocity_score(datalist, targets[0], target2)
+
+
+@pytest.mark.parametrize("layout", ["QP", "MN", "M"])
+@pytest.mark.parametrize("unsorted", [False, True])
+def test_count_flight_times(layout, unsorted):
+    datalist = make_events(5, layout, unsorted=unsorted)
+    targets = B.getLayout(layout).targets
+    target2 = targets[1] if len(targets) > 1 else None
+    index = B.FlightTimeIndex(datalist, targets[0], target2)
+    starts = np.arange(0, 62000, 750)
+    for time in [500, 2000, 10000]:
+        counts = [len(reference_flight_times(datalist, targets[0], target2, time, starttime=start)[0]) for start in starts]
+        assert index.countFlightTimes(starts, time).tolist() == counts
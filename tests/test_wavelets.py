@@ -0,0 +1,54 @@
+"""
+Chunked FFT Morlet CWT against the direct convolution of scipy.signal.cwt.
+"""
+import numpy as np
+import pytest
+
+import wavelets
+from helpers import reference_cwt
+
+
+def make_widths(fs=200.0):
+    freq = np.linspace(1, 100, 100)
+    return fs / (2 * freq * np.pi)
+
+
+@pytest.mark.parametrize("n, chunk_size", [(3000, 8192), (3000, 257), (150, 64)])
+def test_morlet_cwt(n, chunk_size):
+    rng = np.random.default_rng(n)
+    data = rng.standard_normal(n)
+    widths = make_widths()
+    reference = reference_cwt(data, widths, 1.0)
+    coefficients = wavelets.cwt(data, widths, w=1.0, chunk_size=chunk_size)
+    np.testing.assert_allclose(coefficients, reference, rtol=0, atol=1e-12 * np.abs(reference).max())
+    csa, rows, cols = wavelets.cwtReduce(data, widths, w=1.0, chunk_size=chunk_size)
+    magnitude = np.abs(reference)
+    np.testing.assert_allclose(csa, magnitude.sum(axis=0), rtol=1e-12)
+    ref_rows, ref_cols = np.where(magnitude == magnitude.max())
+    np.testing.assert_array_equal(rows, ref_rows)
+    np.testing.assert_array_equal(cols, ref_cols)
+
+
+def test_single_precision():
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal(2000)
+    widths = make_widths()
+    reference = reference_cwt(data, widths, 1.0)
+    coefficients = wavelets.cwt(data, widths, w=1.0, chunk_size=500, precision="single")
+    assert coefficients.dtype == np.complex64
+    np.testing.assert_allclose(coefficients, reference, rtol=0, atol=1e-4 * np.abs(reference).max())
+
+
+def test_transform_reused():
+    # one transform for all signals of the same length
+    rng = np.random.default_rng(1)
+    widths = make_widths()
+    transform = wavelets.MorletCWT(1000, widths, w=1.0, chunk_size=300)
+    for data in rng.standard_normal((3, 1000)):
+        np.testing.assert_array_equal(transform.transform(data), wavelets.cwt(data, widths, w=1.0, chunk_size=300))
+
+
+def test_morlet2():
+    x = (np.arange(0, 40) - 39 / 2) / 4.0
+    expected = np.sqrt(1 / 4.0) * np.exp(1j * 5 * x) * np.exp(-0.5 * x**2) * np.pi**(-0.25)
+    np.testing.assert_allclose(wavelets.morlet2(40, 4.0), expected, rtol=1e-15)
@@ -0,0 +1,60 @@
+"""
+Streaming and prefetching of the wearable subjects against the serial
+loading.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import Wear4PD as W
+from helpers import write_wear_cohort, WEAR_SUBJECTS
+
+
+ATTRIBUTES = ["subject_id", "diagnosis", "typist", "side", "years", "UPDRS_dom", "UPDRS_ndom", "handedness",
+              "gyro_data_LW", "gyro_FS_LW", "gyro_timestamps_LW", "gyro_data_RW", "gyro_FS_RW", "gyro_timestamps_RW"]
+
+
+@pytest.fixture(scope="module")
+def manifest(tmp_path_factory):
+    return write_wear_cohort(tmp_path_factory.mktemp("cohort"), WEAR_SUBJECTS)
+
+
+def assert_same_subjects(subjects, reference):
+    assert [s.subject_id for s in subjects] == [s.subject_id for s in reference]
+    for s, r in zip(subjects, reference):
+        for name in ATTRIBUTES:
+            np.testing.assert_array_equal(getattr(s, name), getattr(r, name), err_msg=name)
+
+
+def test_serial_order(manifest):
+    serial = W.Subjects("full", manifest=manifest)
+    # the order of the groups: PD_OFF, PD_ON, HC, CA
+    assert [s.subject_id for s in serial.subjects] == ["PD01_OFF", "PD01_ON", "HC01", "HC08", "CA01"]
+    assert list(serial.df["subject_id"]) == [s.subject_id for s in serial.subjects]
+
+
+@pytest.mark.parametrize("io_workers, prefetch", [(1, 1), (2, 2), (4, 10)])
+def test_prefetch_matches_serial(manifest, io_workers, prefetch):
+    serial = W.Subjects("10_seconds", manifest=manifest)
+    prefetched = W.Subjects("10_seconds", manifest=manifest, io_workers=io_workers, prefetch=prefetch)
+    assert_same_subjects(prefetched.subjects, serial.subjects)
+
+
+def test_streaming_matches_serial(manifest):
+    serial = W.Subjects("full", manifest=manifest)
+    streaming = W.Subjects("full", manifest=manifest, io_workers=2, load=False, keep_subjects=False)
+    assert streaming.subjects == []
+    assert_same_subjects(list(streaming.iterSubjects()), serial.subjects)
+    # the streamed subjects are not kept
+    assert streaming.subjects == []
+
+
+def test_wear4pd_streaming_matches_default(manifest):
+    default = W.Wear4PD(manifest=manifest)
+    for wear in [W.Wear4PD(manifest=manifest, io_workers=2, prefetch=1),
+                 W.Wear4PD(manifest=manifest, keep_subjects=False, io_workers=2)]:
+        pd.testing.assert_frame_equal(wear.df_raw, default.df_raw)
+        pd.testing.assert_frame_equal(wear.df, default.df)
+    assert_same_subjects(wear.iterSubjects(), default.iterSubjects())
+    assert wear.subjects == [] and wear.segmentations == {}
+    assert sorted(default.segmentations) == sorted(s.subject_id for s in default.subjects)
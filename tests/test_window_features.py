@@ -0,0 +1,113 @@
+"""
+Fused multi-window features of the finger tapping test against the
+per-window calls of the removed implementation.
+"""
+import numpy as np
+import pytest
+
+import Bradykinesia as B
+from helpers import make_events, reference_flight_times
+
+
+WINDOWS = [10000, 30000, 60000]
+
+
+# Removed quadratic press/release pairing of computeDwellTimes
+
+def reference_dwell_times(datalist, target, time, target2=None):
+    dt = []
+    end = datalist[0]['e'] + time
+    for i, kPress in enumerate(datalist):
+        if (kPress['p'] == 0 and (kPress['k'] == target or kPress['k'] == target2) and kPress['e'] < end):
+            for kRelease in datalist[i + 1:]:
+                if (kRelease['p'] == 1 and kPress['k'] == kRelease['k']):
+                    dt.append(kRelease['e'] - kPress['e'])
+                    break
+    return dt
+
+
+# Removed per-window DS scoring
+
+def reference_ds(datalist, target, time, adjacent, target2=None):
+    err = []
+    end = datalist[0]['e'] + time
+    for d in datalist:
+        if (d['p'] == 0 and d['e'] < end):
+            if (d['k'] == target or d['k'] == target2):
+                err.append(1)
+            elif d['k'] in adjacent:
+                err.append(2)
+            else:
+                err.append(3)
+    return np.sum(err) / len(err)
+
+
+@pytest.mark.parametrize("layout", ["QP", "MN", "M"])
+@pytest.mark.parametrize("unsorted", [False, True])
+def test_flight_times_match_per_window_calls(layout, unsorted):
+    datalist = make_events(1, layout, unsorted=unsorted)
+    targets = B.getLayout(layout).targets
+    target2 = targets[1] if len(targets) > 1 else None
+    features = B.computeWindowFeatures(datalist, layout, WINDOWS)
+    for window in WINDOWS:
+        ft, err = reference_flight_times(datalist, targets[0], target2, window)
+        assert features[window]['ft'] == ft
+        assert features[window]['err'] == err
+        # the public per-window functions are kept as well
+        if target2 is None:
+            assert B.computeFlightTimesWithOneTarget(targets[0], datalist, window) == (ft, err)
+        else:
+            assert B.computeFlightTimesWithTwoTargets(targets[0], target2, datalist, window) == (ft, err)
+    # a single window is the same as the window of a fused call
+    assert B.computeWindowFeatures(datalist, layout, [10000])[10000] == features[10000]
+
+
+def test_no_target_key():
+    datalist = [{'k': 40, 'p': 0, 'e': 0}, {'k': 40, 'p': 1, 'e': 100}]
+    target1, target2 = B.getLayout("QP").targets
+    features = B.computeWindowFeatures(datalist, "QP", WINDOWS)
+    for window in WINDOWS:
+        assert (features[window]['ft'], features[window]['err']) == reference_flight_times(datalist, target1, target2, window) == ([], 0)
+
+
+@pytest.mark.parametrize("layout", ["QP", "MN", "M"])
+@pytest.mark.parametrize("unsorted", [False, True])
+def test_dwell_times_match_per_window_calls(layout, unsorted):
+    datalist = make_events(4, layout, unsorted=unsorted)
+    targets = B.getLayout(layout).targets
+    target2 = targets[1] if len(targets) > 1 else None
+    features = B.computeWindowFeatures(datalist, layout, WINDOWS)
+    for window in WINDOWS:
+        dt = reference_dwell_times(datalist, targets[0], window, target2)
+        assert B.computeDwellTimes(datalist, targets[0], window, target2) == dt
+        assert features[window]['dt'] == dt
+
+
+def test_overlapping_and_unreleased_presses():
+    # the second press of key 80 is released by the same release as the first one, key 81 is never released
+    datalist = [{'k': 80, 'p': 0, 'e': 0}, {'k': 80, 'p': 0, 'e': 10}, {'k': 81, 'p': 0, 'e': 20},
+                {'k': 80, 'p': 1, 'e': 50}, {'k': 80, 'p': 0, 'e': 60}, {'k': 80, 'p': 1, 'e': 90}]
+    assert B.computeDwellTimes(datalist, 80, 60000, 81) == reference_dwell_times(datalist, 80, 60000, 81) == [50, 40, 30]
+    presses, releases = B.pairKeyPresses(datalist, [80, 81])
+    assert presses.tolist() == [0, 1, 2, 4]
+    assert releases.tolist() == [3, 3, -1, 5]
+
+
+@pytest.mark.parametrize("layout", ["QP", "MN", "M"])
+@pytest.mark.parametrize("unsorted", [False, True])
+def test_ds_matches_per_window_calls(layout, unsorted):
+    datalist = make_events(6, layout, unsorted=unsorted)
+    layout = B.getLayout(layout)
+    target2 = layout.targets[1] if len(layout.targets) > 1 else None
+    features = B.computeWindowFeatures(datalist, layout, WINDOWS)
+    DS = B.getDSWindows(datalist, layout, WINDOWS)
+    for window, windowDS in zip(WINDOWS, DS):
+        ds = reference_ds(datalist, layout.targets[0], window, layout.adjacent, target2)
+        assert B.getDS(datalist, layout.targets[0], window, layout.adjacent, target2) == ds
+        assert features[window]['DS'] == windowDS == ds
+
+
+def test_ds_of_layout():
+    layout = B.KeyboardLayout([30, 31], [32, 300])
+    datalist = [{'k': k, 'p': 0, 'e': e} for e, k in enumerate([30, 32, 33, 300, 31, 31, 34, 500])]
+    assert B.getDSWindows(datalist, layout, [3, 100]).tolist() == [reference_ds(datalist, 30, 3, [32, 300], 31), reference_ds(datalist, 30, 100, [32, 300], 31)]
@@ -0,0 +1,111 @@
+"""
+Wrist features of computeWristFeatures against the removed per-wrist
+pipeline of loadUPDRS, and the feature table with both wrists computed
+concurrently against one wrist at a time.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import fftpack
+from scipy.signal import argrelextrema
+
+import Wear4PD as W
+from helpers import make_gyro_data, reference_F, reference_amplitudes, reference_cwt, reference_hesitations, write_wear_cohort, WEAR_SUBJECTS
+
+
+def reference_wrist_features(timestamps, signal, fs):
+    # one wrist of loadUPDRS before computeWristFeatures
+    integral = reference_F(timestamps, signal)
+    (maxi,), (mini,) = argrelextrema(integral, np.greater, order=50), argrelextrema(integral, np.less, order=50)
+    amplitudes, durations = reference_amplitudes(timestamps, integral, maxi, mini)
+    z = fftpack.fft(signal)
+    freqs = fftpack.fftfreq(len(signal)) * fs
+    dt = timestamps[1] - timestamps[0]
+    p = np.polyfit(timestamps - timestamps[0], signal, 1)
+    dat_notrend = signal - np.polyval(p, timestamps - timestamps[0])
+    dat_norm = dat_notrend / dat_notrend.std()
+    freq = np.linspace(1, fs / 2, 100)
+    cwtm = reference_cwt(dat_norm, 1.0 * fs / (2 * freq * np.pi), 1.0)
+    (x, y) = np.where(np.abs(cwtm) == np.amax(np.abs(cwtm)))
+    CSA_T = np.sum(np.abs(cwtm), 0) / np.max(np.sum(np.abs(cwtm), 0)) * 100
+    return {"mean_amplitude_supination": np.mean(amplitudes[amplitudes > 0]),
+            "mean_amplitude_pronation": np.mean(amplitudes[amplitudes < 0]),
+            "mean_amplitude": np.mean(np.abs(amplitudes)),
+            "var_amplitude_supination": np.var(amplitudes[amplitudes > 0]),
+            "var_amplitude_pronation": np.var(amplitudes[amplitudes < 0]),
+            "var_amplitude": np.var(np.abs(amplitudes)),
+            "decrement_amplitude_supination": np.polyfit(range(len(amplitudes[amplitudes > 0])), amplitudes[amplitudes > 0], 1)[0],
+            "decrement_amplitude_pronation": np.polyfit(range(len(amplitudes[amplitudes < 0])), amplitudes[amplitudes < 0], 1)[0],
+            "decrement_amplitude": np.polyfit(range(len(amplitudes)), np.abs(amplitudes), 1)[0],
+            "main_freq": freqs[np.argmax(np.abs(z))],
+            "var_periods": np.var(durations),
+            "decrement_periods": np.polyfit(range(len(durations)), durations, 1)[0],
+            "movements": len(durations),
+            # freq[x] was passed on, float() of a one-element array is an error with NumPy 2
+            "hesitations": reference_hesitations(CSA_T, 0.5 * np.mean(CSA_T), freq[x][0], dt),
+            "freezes": reference_hesitations(CSA_T, 0.25 * np.mean(CSA_T), freq[x][0], dt),
+            "f1": freq[x][0]}
+
+
+def reference_affected(handedness, side):
+    # the side rules of loadUPDRS before mapWrists: (dominant, non-dominant)
+    if (side == 1):
+        return (False, True) if handedness == "left" else (True, False)
+    elif (side == 2):
+        return (True, False) if handedness == "left" else (False, True)
+    elif (side == 3):
+        return (True, True)
+    return (False, False)
+
+
+def assert_same_features(features, reference):
+    for name, value in reference.items():
+        np.testing.assert_allclose(getattr(features, name), value, rtol=1e-9, atol=1e-9, err_msg=name)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_wrist_features_match_removed_pipeline(seed):
+    data = make_gyro_data(100.0, 112.0, seed=seed)
+    gyro, fs, timestamps = W.getSensorData(data, 100.0, 112.0)
+    features = W.computeWristFeatures(timestamps, gyro[:, 0], fs)
+    assert_same_features(features, reference_wrist_features(timestamps, gyro[:, 0], fs))
+    assert features.hesitations > 0
+    # the segmentation of the plots belongs to the same features
+    same, segmentation = W.computeWristFeatures(timestamps, gyro[:, 0], fs, segmentation=True)
+    assert_same_features(same, features._asdict())
+    np.testing.assert_array_equal(segmentation.integral, W.F(timestamps, gyro[:, 0]))
+
+
+@pytest.mark.parametrize("handedness", ["left", "right"])
+@pytest.mark.parametrize("side", [0, 1, 2, 3])
+def test_map_wrists(handedness, side):
+    (dom, affected_dom), (ndom, affected_ndom) = W.mapWrists(handedness, side, ("LW", "RW"))
+    assert (dom, ndom) == (("LW", "RW") if handedness == "left" else ("RW", "LW"))
+    assert (affected_dom, affected_ndom) == reference_affected(handedness, side)
+
+
+@pytest.fixture(scope="module")
+def manifest(tmp_path_factory):
+    return write_wear_cohort(tmp_path_factory.mktemp("cohort"), WEAR_SUBJECTS)
+
+
+def test_feature_table_matches_removed_pipeline(manifest):
+    wear = W.Wear4PD(manifest=manifest, wrist_workers=1)
+    subjects = W.Subjects("full", manifest=manifest)
+    rows = []
+    for s in subjects.subjects:
+        LW = reference_wrist_features(s.gyro_timestamps_LW, s.gyro_data_LW[:, 0], s.gyro_FS_LW)
+        RW = reference_wrist_features(s.gyro_timestamps_RW, s.gyro_data_RW[:, 0], s.gyro_FS_RW)
+        dom, ndom = (LW, RW) if s.handedness == "left" else (RW, LW)
+        for features, dominant, affected, UPDRS in zip([dom, ndom], [True, False], reference_affected(s.handedness, s.side), [s.UPDRS_dom, s.UPDRS_ndom]):
+            rows.append([s.subject_id, s.handedness, dominant, affected, UPDRS] + [features[name] for name in ['mean_amplitude', 'var_amplitude', 'decrement_amplitude', 'main_freq', 'var_periods', 'decrement_periods', 'movements', 'hesitations', 'freezes', 'f1']])
+    reference = pd.DataFrame(rows, columns=['subject_id', 'handedness', 'dominant', 'affected', 'UPDRS', 'mean_amplitude', 'var_amplitude', 'decrement_amplitude', 'main_freq', 'var_periods', 'decrement_periods', 'movements', 'hesitations', 'freezes', 'f1'])
+    pd.testing.assert_frame_equal(wear.df_raw[reference.columns], reference, check_dtype=False, rtol=1e-9)
+
+
+def test_concurrent_wrists_match_serial(manifest):
+    serial = W.Wear4PD(manifest=manifest, wrist_workers=1)
+    for concurrent in [W.Wear4PD(manifest=manifest), W.Wear4PD(manifest=manifest, n_jobs=2)]:
+        pd.testing.assert_frame_equal(concurrent.df_raw, serial.df_raw)
+        pd.testing.assert_frame_equal(concurrent.df, serial.df)
+        np.testing.assert_array_equal(concurrent.X, serial.X)
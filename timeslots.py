@@ -0,0 +1,87 @@
+import os
+import functools
+import numpy as np
+import pandas as pd
+
+
+# Annotated time slots of the tasks in the wearable sensor recordings: one row per subject id, wrist (LW/RW), kind of time slot (e.g. "full" or "10_seconds") and task; lines starting with # are ignored
+TIMESLOTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "timeslots.csv")
+
+DEFAULT_TASK = "pronation_supination"
+
+def loadTimeslots(filename = TIMESLOTS_FILE):
+    """Loads a table of time slots.
+
+    Parameters:
+        filename(string): CSV file with the columns subject_id, wrist, kind, task, start and end
+
+    Returns:
+        dataframe: time slots indexed by (subject_id, wrist, kind, task)
+    """
+    timeslots = pd.read_csv(filename, comment = "#", skipinitialspace = True,
+                            dtype = {"subject_id" : str, "wrist" : str, "kind" : str, "task" : str, "start" : float, "end" : float})
+    index = ["subject_id", "wrist", "kind", "task"]
+    duplicated = timeslots.duplicated(index)
+    if duplicated.any():
+        raise ValueError("Duplicated time slots: " + str(timeslots.loc[duplicated, index].values.tolist()))
+    return timeslots.set_index(index).sort_index()
+
+@functools.lru_cache(maxsize = None)
+def getTimeslotIndex(filename = TIMESLOTS_FILE, mtime = None):
+    """Returns the table of time slots, which is loaded once per file (and modification time, see getTimeslots)."""
+    return loadTimeslots(filename)
+
+def getTimeslots(filename = TIMESLOTS_FILE):
+    """Returns the table of time slots; the file is read again only if it changed.
+
+    Parameters:
+        filename(string): CSV file of the time slots
+
+    Returns:
+        dataframe: time slots indexed by (subject_id, wrist, kind, task)
+    """
+    return getTimeslotIndex(filename, os.path.getmtime(filename))
+
+def lookupTimeslots(subject_ids, wrists, kind, task = DEFAULT_TASK, filename = TIMESLOTS_FILE):
+    """Looks up the time slots of several recordings at once.
+
+    Parameters:
+        subject_ids(list): subject ids
+        wrists(list/string): wrist of every subject id ("LW" or "RW"), or one wrist for all
+        kind(list/string): kind of time slot of every subject id (e.g. "full" or "10_seconds"), or one kind for all
+        task(list/string): task of every subject id, or one task for all
+        filename(string): CSV file of the time slots
+
+    Returns:
+        array: start times (NaN if there is no time slot)
+        array: end times (NaN if there is no time slot)
+    """
+    subject_ids = np.asarray(subject_ids, dtype = object)
+    keys = [np.broadcast_to(np.asarray(values, dtype = object), subject_ids.shape) for values in [subject_ids, wrists, kind, task]]
+    found = getTimeslots(filename).reindex(pd.MultiIndex.from_arrays(keys))
+    return found["start"].to_numpy(), found["end"].to_numpy()
+
+def getTimeslot(subject_id, wrist, kind, task = DEFAULT_TASK, filename = TIMESLOTS_FILE):
+    """Returns the time slot of a recording.
+
+    Parameters:
+        subject_id(string): subject id, e.g. "PD01_OFF"
+        wrist(string): "LW" or "RW"
+        kind(string): kind of time slot, e.g. "full" or "10_seconds"
+        task(string): task
+        filename(string): CSV file of the time slots
+
+    Returns:
+        float: start time
+        float: end time
+    """
+    timeslots = getTimeslots(filename)
+    key = (subject_id, wrist, kind, task)
+    if key not in timeslots.index:
+        raise KeyError("No time slot for " + str(key))
+    start, end = timeslots.loc[key, ["start", "end"]]
+    return start, end
+
+def getTimeslotKinds(filename = TIMESLOTS_FILE):
+    """Returns the kinds of time slots of the table."""
+    return list(getTimeslots(filename).index.unique("kind"))
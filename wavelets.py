@@ -0,0 +1,143 @@
+import numpy as np
+import scipy.fft
+
+
+def morlet2(M, s, w = 5):
+    """Complex Morlet wavelet as defined by scipy.signal.morlet2 (removed from recent SciPy versions).
+
+    Parameters:
+        M(float): length of the wavelet
+        s(float): width of the wavelet
+        w(float): omega0
+
+    Returns:
+        array: wavelet
+    """
+    x = np.arange(0, M) - (M - 1.0) / 2
+    x = x / s
+    wavelet = np.exp(1j * w * x) * np.exp(-0.5 * x**2) * np.pi**(-0.25)
+    return np.sqrt(1/s) * wavelet
+
+class MorletCWT:
+    """
+    This class computes the continuous wavelet transform of a signal with the complex Morlet wavelet like scipy.signal.cwt(data, scipy.signal.morlet2, widths, w=w). The signal is processed in time chunks: every chunk (with the samples around it that the longest wavelet reaches) is transformed with one FFT that is reused for all widths, so memory depends on the chunk size instead of the length of the signal.
+    """
+    def __init__(self, n, widths, w = 5, chunk_size = 8192, precision = "double"):
+        """
+            Initialise class
+
+            Parameters:
+                n(int): number of samples of the signals
+                widths(list): widths of the wavelets
+                w(float): omega0 of the wavelets
+                chunk_size(int): number of output samples per chunk
+                precision(string): "double" (complex128) or "single" (complex64)
+        """
+        self.n = n
+        self.widths = np.asarray(widths, dtype = float)
+        self.dtype = np.complex64 if precision == "single" else np.complex128
+        self.chunk_size = max(1, min(chunk_size, n))
+
+        # Wavelets as convolution kernels, cut to 10 widths (at most the length of the signal) as in scipy.signal.cwt
+        kernels = [np.conj(morlet2(np.min([10 * width, n]), width, w)[::-1]) for width in self.widths]
+        self.pad = max(len(kernel) for kernel in kernels)
+        # offset of the 'same' part of the full convolution
+        self.offsets = np.array([(len(kernel) - 1) // 2 for kernel in kernels])
+
+        # FFT length of a chunk with padding on both sides, long enough to avoid circular convolution
+        self.fft_size = scipy.fft.next_fast_len(self.chunk_size + 3 * self.pad)
+        self.kernels = np.stack([scipy.fft.fft(kernel.astype(self.dtype), self.fft_size) for kernel in kernels])
+
+    def chunks(self, data):
+        """Yields the coefficients of the transform chunk by chunk.
+
+        Parameters:
+            data(array): signal with n samples
+
+        Returns:
+            int: index of the first sample of the chunk
+            array: coefficients of the chunk (widths x samples of the chunk)
+        """
+        data = np.asarray(data, dtype = np.float32 if self.dtype == np.complex64 else np.float64)
+        padded = np.concatenate([np.zeros(self.pad, dtype = data.dtype), data, np.zeros(self.chunk_size + self.pad, dtype = data.dtype)])
+        for start in range(0, self.n, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n)
+            # samples start - pad ... start + chunk_size + pad of the signal (zero outside the signal)
+            segment = scipy.fft.fft(padded[start:start + self.chunk_size + 2 * self.pad], self.fft_size)
+            full = scipy.fft.ifft(self.kernels * segment[np.newaxis, :], axis = 1)
+            columns = self.offsets[:, np.newaxis] + self.pad + np.arange(stop - start)[np.newaxis, :]
+            yield start, np.take_along_axis(full, columns, axis = 1)
+
+    def transform(self, data):
+        """Returns the full coefficient matrix (widths x samples) like scipy.signal.cwt.
+
+        Parameters:
+            data(array): signal with n samples
+
+        Returns:
+            array: coefficients
+        """
+        output = np.empty((len(self.widths), self.n), dtype = self.dtype)
+        for start, coefficients in self.chunks(data):
+            output[:, start:start + coefficients.shape[1]] = coefficients
+        return output
+
+    def reduce(self, data):
+        """Returns the sum of the magnitudes of the coefficients over the widths for every sample and the position of the largest magnitude, without keeping the coefficient matrix.
+
+        Parameters:
+            data(array): signal with n samples
+
+        Returns:
+            array: sum of the magnitudes per sample (the cross-sectional area along the time axis)
+            array: width indices of all coefficients with the largest magnitude (in row-major order like np.where)
+            array: sample indices of these coefficients
+        """
+        csa = np.empty(self.n, dtype = np.float64)
+        peak = -np.inf
+        rows, cols = [], []
+        for start, coefficients in self.chunks(data):
+            magnitude = np.abs(coefficients)
+            csa[start:start + magnitude.shape[1]] = magnitude.sum(axis = 0)
+            chunk_peak = magnitude.max()
+            if (chunk_peak > peak):
+                peak, rows, cols = chunk_peak, [], []
+            if (chunk_peak == peak):
+                r, c = np.nonzero(magnitude == peak)
+                rows.append(r)
+                cols.append(c + start)
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        order = np.lexsort((cols, rows))
+        return csa, rows[order], cols[order]
+
+def cwt(data, widths, w = 5, chunk_size = 8192, precision = "double"):
+    """Continuous wavelet transform with the complex Morlet wavelet, a replacement of scipy.signal.cwt(data, scipy.signal.morlet2, widths, w=w).
+
+    Parameters:
+        data(array): signal
+        widths(list): widths of the wavelets
+        w(float): omega0 of the wavelets
+        chunk_size(int): number of samples per chunk
+        precision(string): "double" or "single"
+
+    Returns:
+        array: coefficients (widths x samples)
+    """
+    return MorletCWT(len(data), widths, w, chunk_size, precision).transform(data)
+
+def cwtReduce(data, widths, w = 5, chunk_size = 8192, precision = "double"):
+    """Sum of the magnitudes of the Morlet wavelet coefficients per sample and the widths of the largest magnitude (see MorletCWT.reduce), computed without the full coefficient matrix.
+
+    Parameters:
+        data(array): signal
+        widths(list): widths of the wavelets
+        w(float): omega0 of the wavelets
+        chunk_size(int): number of samples per chunk
+        precision(string): "double" or "single"
+
+    Returns:
+        array: sum of the magnitudes per sample
+        array: width indices of the largest magnitude
+        array: sample indices of the largest magnitude
+    """
+    return MorletCWT(len(data), widths, w, chunk_size, precision).reduce(data)